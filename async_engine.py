@@ -0,0 +1,122 @@
+"""
+비동기 크롤링 엔진
+- 여러 사이트/게시판을 동시에 수집
+- 호스트별 동시 요청 수 제한
+- 호스트별 요청 속도는 세션의 토큰 버킷(rate_limiter.py)으로 준수
+- 파싱 단계(parse_pool.py)를 연결하면 페치와 파싱을 분리하여 병렬 처리
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List
+
+import requests
+
+from http_session import CrawlerSession, get_shared_session
+from parse_pool import ParsePipeline
+
+
+class AsyncCrawlEngine:
+    """호스트별 동시성 제한이 있는 비동기 수집 엔진"""
+
+    def __init__(self, session: CrawlerSession = None, max_per_host: int = 1,
+                 max_workers: int = 16, parse_pipeline: ParsePipeline = None):
+        """
+        초기화
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+                     호스트별 요청 속도는 session.rate_limiter 설정을 따름
+            max_per_host: 호스트당 동시에 진행할 수 있는 요청 수
+            max_workers: 요청을 실행할 스레드 수
+            parse_pipeline: 프로세스 풀 파싱 단계 (미지정 시 이벤트 루프에서 바로 파싱)
+        """
+        self.session = session or get_shared_session()
+        self.max_per_host = max_per_host
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.parse_pipeline = parse_pipeline
+
+        self._semaphores = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._semaphores[host]
+
+    async def fetch(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
+        """
+        페이지 비동기 요청
+
+        Args:
+            url: 요청 URL
+            method: HTTP 메서드
+            **kwargs: requests에 전달할 인자 (params, headers, timeout 등)
+
+        Returns:
+            응답 객체
+        """
+        # 캐시에서 바로 쓸 수 있는 응답은 요청 제한/동시성 제한을 거치지 않음
+        cached = self.session.cached_response(method, url, **kwargs)
+        if cached is not None:
+            return cached
+
+        host = CrawlerSession.host_of(url)
+
+        async with self._semaphore(host):
+            # 토큰은 이벤트 루프에서 기다리고, 요청 자체는 스레드에서 실행
+            await self.session.rate_limiter.acquire_async(host)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor,
+                partial(self.session.request, method, url, throttle=False, **kwargs)
+            )
+
+    async def parse(self, parser: Callable[[str], List[Dict]], response: requests.Response,
+                    encoding: str = 'utf-8') -> List[Dict]:
+        """
+        응답 페이지 파싱
+
+        Args:
+            parser: 모듈 최상위 파싱 함수 (예: clien_crawling.parse_board_page)
+            response: 페이지 응답
+            encoding: 페이지 인코딩
+
+        Returns:
+            게시물 리스트
+        """
+        if self.parse_pipeline is not None:
+            return await self.parse_pipeline.parse(parser, response.content, encoding)
+
+        response.encoding = encoding
+        return parser(response.text)
+
+    async def run_sync(self, func, *args, **kwargs):
+        """동기 함수를 엔진의 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def run(self, coro):
+        """코루틴 실행 (이벤트 루프 생성)"""
+        # 이벤트 루프마다 동기화 객체를 새로 생성
+        self._semaphores = {}
+        return asyncio.run(coro)
+
+    def gather(self, *coros) -> List:
+        """여러 코루틴을 동시에 실행하고 결과 리스트 반환"""
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+        return self.run(_gather())
+
+    def close(self):
+        """스레드 풀 및 파싱 단계 종료"""
+        self.executor.shutdown(wait=True)
+        if self.parse_pipeline is not None:
+            self.parse_pipeline.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,121 @@
+"""
+키워드 추출 벤치마크
+- benchmarks/fixtures/ 의 목록 페이지에서 제목을 모아 반복 추출
+- 기존 방식(제목마다 정규식 3회 + 불용어 집합 재생성)과 공용 추출 엔진 비교
+- 공용 엔진은 순수 파이썬 집계와 배열 연산(NumPy bincount) 집계를 각각 측정
+- 초당 처리 제목 수와 추출 1회 최대 메모리 출력
+
+실행:
+    python benchmarks/keyword_benchmark.py
+    python benchmarks/keyword_benchmark.py --copies 200
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from keyword_extraction import ENGLISH_PATTERNS, SITE_STOPWORDS, get_extractor, np
+from parser_benchmark import FIXTURE_DIR, FIXTURES
+
+
+def legacy_extract(posts, site: str, min_length: int = 2):
+    """기존 크롤러의 extract_keywords_from_posts (비교 기준)"""
+    keyword_counter = Counter()
+    keyword_engagement = {}
+
+    stopwords = set(SITE_STOPWORDS[site])
+    english_pattern = ENGLISH_PATTERNS.get(site, ENGLISH_PATTERNS['default'])
+
+    for post in posts:
+        title = post['title']
+        engagement = post.get('engagement', 1)
+
+        korean_words = re.findall(r'[가-힣]{2,}', title)
+        english_words = re.findall(english_pattern, title)
+        mixed_words = re.findall(r'\d+[가-힣]+', title)
+
+        all_words = korean_words + english_words + mixed_words
+
+        for word in all_words:
+            if word.lower() in stopwords or len(word) < min_length:
+                continue
+
+            keyword_counter[word] += 1
+
+            if word not in keyword_engagement:
+                keyword_engagement[word] = 0
+            keyword_engagement[word] += engagement
+
+    keywords = []
+    for word, count in keyword_counter.most_common(100):
+        keywords.append({
+            'keyword': word,
+            'count': count,
+            'total_engagement': keyword_engagement.get(word, 0),
+            'avg_engagement': keyword_engagement.get(word, 0) / count if count > 0 else 0
+        })
+    return keywords
+
+
+def load_posts(copies: int):
+    """사이트별 픽스처 게시물을 copies배로 복제"""
+    corpus = {}
+    for site, filename, encoding, parser in FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, filename), encoding=encoding) as f:
+            corpus[site] = parser(f.read()) * copies
+    return corpus
+
+
+def as_table(keywords):
+    """순서와 무관하게 비교하기 위한 키워드 -> (출현 횟수, 인기도 합계)"""
+    return {kw['keyword']: (kw['count'], kw['total_engagement']) for kw in keywords}
+
+
+def measure(extract, posts, repeat: int):
+    """(초당 제목 수, 추출 1회 최대 메모리 KB)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract(posts)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    extract(posts)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rate = len(posts) * repeat / elapsed if elapsed > 0 else 0
+    return rate, peak / 1024
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='키워드 추출 벤치마크')
+    arg_parser.add_argument('--copies', type=int, default=50, help='픽스처 게시물 복제 배수')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='반복 추출 횟수')
+    args = arg_parser.parse_args()
+
+    corpus = load_posts(args.copies)
+
+    modes = [('공용 엔진', False)] + ([('배열 집계', True)] if np is not None else [])
+    header = " | ".join(f"{name:>22s}" for name, _ in modes)
+    print(f"{'사이트':10s} | {'제목 수':>8s} | {'기존':>22s} | {header} | 결과 일치")
+    print("-" * (62 + 25 * len(modes)))
+
+    for site, posts in corpus.items():
+        extractor = get_extractor(site)
+        legacy_rate, legacy_peak = measure(lambda p: legacy_extract(p, site), posts, args.repeat)
+        columns = []
+        same = True
+        for _, vectorized in modes:
+            extract = lambda p: extractor.extract(p, vectorized=vectorized)
+            rate, peak = measure(extract, posts, args.repeat)
+            columns.append(f"{rate:8.0f}건/초 {peak:6.0f}KB")
+            same = same and as_table(legacy_extract(posts, site)) == as_table(extract(posts))
+        print(f"{site:10s} | {len(posts):8d} | {legacy_rate:8.0f}건/초 {legacy_peak:6.0f}KB | "
+              + " | ".join(columns) + f" | {'✅' if same else '❌'}")
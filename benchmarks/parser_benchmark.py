@@ -0,0 +1,90 @@
+"""
+HTML 파서 백엔드 벤치마크
+- benchmarks/fixtures/ 에 저장된 목록 페이지를 백엔드별로 파싱
+- 사이트/백엔드별 초당 파싱 게시물 수 출력
+- 전체 파싱과 목록 영역만 파싱(부분 파싱)의 속도/최대 메모리 비교
+
+실행:
+    python benchmarks/parser_benchmark.py
+    python benchmarks/parser_benchmark.py --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from clien_crawling import parse_board_page as parse_clien
+from dcinside_crawling import parse_gallery_page as parse_dcinside
+from html_parser import available_backends
+from instiz_crawling import parse_board_page as parse_instiz
+from ppomppu_crawling import parse_hotdeal_page as parse_ppomppu
+
+
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+# (사이트, 픽스처 파일, 인코딩, 파싱 함수)
+FIXTURES = [
+    ('clien', 'clien_board.html', 'utf-8', parse_clien),
+    ('dcinside', 'dcinside_gallery.html', 'utf-8', parse_dcinside),
+    ('ppomppu', 'ppomppu_hotdeal.html', 'euc-kr', parse_ppomppu),
+    ('instiz', 'instiz_board.html', 'utf-8', parse_instiz),
+]
+
+
+MODES = [('전체', False), ('부분', True)]
+
+
+def bench(parser, html: str, backend: str, repeat: int, targeted: bool = False) -> float:
+    """초당 파싱 게시물 수 측정"""
+    posts = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        posts += len(parser(html, backend, targeted))
+    elapsed = time.perf_counter() - start
+    return posts / elapsed if elapsed > 0 else 0
+
+
+def peak_memory(parser, html: str, backend: str, targeted: bool = False) -> float:
+    """한 페이지 파싱 시 최대 메모리 사용량 (KB)"""
+    tracemalloc.start()
+    parser(html, backend, targeted)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    arg_parser.add_argument('--repeat', type=int, default=20, help='픽스처당 반복 파싱 횟수')
+    args = arg_parser.parse_args()
+
+    backends = available_backends()
+    print(f"사용 가능한 백엔드: {', '.join(backends)}\n")
+
+    columns = [(backend, mode, targeted) for backend in backends for mode, targeted in MODES]
+    header = " | ".join(f"{backend + '/' + mode:>16s}" for backend, mode, _ in columns)
+    print(f"{'사이트':10s} | {header} | 게시물/페이지")
+    print("-" * (28 + 19 * len(columns)))
+
+    memory_rows = []
+    for site, filename, encoding, parser in FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, filename), encoding=encoding) as f:
+            html = f.read()
+
+        rates = [bench(parser, html, backend, args.repeat, targeted) for backend, _, targeted in columns]
+        per_page = len(parser(html, backends[-1]))
+        print(f"{site:10s} | " + " | ".join(f"{rate:12.0f}건/초" for rate in rates) + f" | {per_page:5d}")
+
+        memory_rows.append((site, [peak_memory(parser, html, backend, targeted)
+                                   for backend, _, targeted in columns]))
+
+    print("\n최대 메모리 (페이지 1개 파싱)")
+    print(f"{'사이트':10s} | {header}")
+    print("-" * (12 + 19 * len(columns)))
+    for site, peaks in memory_rows:
+        print(f"{site:10s} | " + " | ".join(f"{peak:14.0f}KB" for peak in peaks))
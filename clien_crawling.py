@@ -4,35 +4,203 @@
 - 월간 베스트 게시판 지원
 """
 
+import argparse
+import asyncio
+from functools import partial
 import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
-from collections import Counter
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional
 import json
 import csv
 from datetime import datetime
 import sys
 import io
 
+from async_engine import AsyncCrawlEngine
+from crawl_state import CrawlState
+from html_parser import class_strainer, make_soup
+from http_session import CrawlerSession, get_shared_session
+from keyword_extraction import extract_keywords, make_counter
+from post_record import Post
+from result_store import ResultStore, add_db_argument
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+# 부분 파싱 시 트리로 만들 영역: 게시물 목록(.list_item)
+LIST_STRAINER = class_strainer('div', 'list_item')
+
+
+def parse_board_page(html: str, backend: str = 'auto', targeted: bool = True) -> List[Post]:
+    """
+    게시판 목록 페이지 파싱
+
+    Args:
+        html: 목록 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+        targeted: True면 게시물 목록 영역만 파싱 (헤더/사이드바/광고 제외)
+
+    Returns:
+        게시물 리스트
+    """
+    soup = make_soup(html, backend, LIST_STRAINER if targeted else None)
+    posts = []
+
+    # 게시물 목록 파싱
+    post_list = soup.select('.list_item')
+
+    for post in post_list:
+        try:
+            # 제목
+            title_elem = post.select_one('.subject_fixed')
+            if not title_elem:
+                title_elem = post.select_one('.list_subject')
+
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # 댓글 수
+            comment_elem = post.select_one('.comment_count')
+            comments = 0
+            if comment_elem:
+                comment_text = comment_elem.text.strip()
+                comment_match = re.search(r'\[(\d+)\]', comment_text)
+                if comment_match:
+                    comments = int(comment_match.group(1))
+
+            # 조회수
+            hit_elem = post.select_one('.hit')
+            hits = 0
+            if hit_elem:
+                hit_text = hit_elem.text.strip()
+                hits = int(hit_text) if hit_text.isdigit() else 0
+
+            # 추천수
+            symph_elem = post.select_one('.symph_count')
+            symphs = 0
+            if symph_elem:
+                symph_text = symph_elem.text.strip()
+                symphs = int(symph_text) if symph_text.isdigit() else 0
+
+            posts.append(Post('clien', title, comments=comments, views=hits, likes=symphs,
+                              engagement=comments * 5 + symphs * 10,  # 가중치
+                              post_id=_parse_post_id(post), **_parse_source(post)))
+
+        except Exception as e:
+            continue
+
+    return posts
+
+
+def _parse_post_id(post) -> Optional[int]:
+    """게시물 번호 (증분 수집 기준) - data-board-sn 속성, 없으면 제목 링크의 번호"""
+    sn = post.get('data-board-sn', '')
+    if sn.isdigit():
+        return int(sn)
+
+    link_elem = post.select_one('a.list_subject[href]')
+    id_match = re.search(r'/(\d+)(?:\?|$)', link_elem['href']) if link_elem else None
+    return int(id_match.group(1)) if id_match else None
+
+
+def _parse_source(post) -> Dict[str, str]:
+    """작성자/게시물 링크 (번호가 없는 게시물을 구분하는 데 사용)"""
+    author_elem = post.select_one('.nickname')
+    author = ''
+    if author_elem:
+        image = author_elem.find('img')
+        author = author_elem.text.strip() or (image.get('alt', '') if image else '')
+
+    link_elem = post.select_one('a.list_subject[href]')
+    return {'author': author, 'url': link_elem['href'] if link_elem else ''}
+
+
+def parse_monthly_best_page(html: str, backend: str = 'auto') -> List[Post]:
+    """
+    인기글 목록 페이지 파싱 (인기도는 댓글 수와 추천수 기준)
+
+    Args:
+        html: 목록 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+
+    Returns:
+        게시물 리스트
+    """
+    soup = make_soup(html, backend)
+
+    # 게시물 목록 파싱 (여러 선택자 시도)
+    post_list = soup.select('.list_item')
+
+    if not post_list:
+        post_list = soup.select('div[class*="list"]')
+
+    posts = []
+    for post in post_list:
+        try:
+            # 제목
+            title_elem = post.select_one('.subject_fixed') or post.select_one('.list_subject')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # 댓글 수
+            comment_elem = post.select_one('.comment_count')
+            comments = 0
+            if comment_elem:
+                comment_text = comment_elem.text.strip()
+                comment_match = re.search(r'\[(\d+)\]', comment_text)
+                if comment_match:
+                    comments = int(comment_match.group(1))
+
+            # 추천수
+            symph_elem = post.select_one('.symph_count')
+            symphs = 0
+            if symph_elem:
+                symph_text = symph_elem.text.strip()
+                symphs = int(symph_text) if symph_text.isdigit() else 0
+
+            posts.append(Post('clien', title, comments=comments, likes=symphs,
+                              engagement=comments * 5 + symphs * 10,
+                              post_id=_parse_post_id(post), **_parse_source(post)))
+
+        except Exception as e:
+            continue
+
+    return posts
+
+
 class ClienCrawler:
     """클리앙 크롤러"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, crawl_state: CrawlState = None,
+                 result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            parser_backend: HTML 파서 백엔드 ('auto': lxml 우선, 없으면 'html.parser')
+            targeted_parsing: True면 목록 페이지에서 게시물 목록 영역만 파싱
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집에서 보지 못한 게시물만 수집)
+            result_store: 결과 저장소 (지정 시 수집한 게시물을 게시판별로 저장)
+        """
+        self.session = session or get_shared_session()
+        self.parser_backend = parser_backend
+        self.parse_options = {'backend': parser_backend, 'targeted': targeted_parsing}
+        self.crawl_state = crawl_state
+        self.result_store = result_store
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.base_url = 'https://www.clien.net'
 
-    def get_board_posts(self, board_type: str = 'park', max_pages: int = 5) -> List[Dict]:
+    def get_board_posts(self, board_type: str = 'park', max_pages: int = 5) -> List[Post]:
         """
         게시판의 게시물 가져오기
 
@@ -48,91 +216,109 @@ class ClienCrawler:
         Returns:
             게시물 리스트
         """
-        posts = []
+        return list(self.iter_board_posts(board_type, max_pages))
 
-        for page in range(0, max_pages):
-            url = f'{self.base_url}/service/board/{board_type}'
+    def iter_board_posts(self, board_type: str = 'park', max_pages: int = 5) -> Iterator[Post]:
+        """
+        게시판의 게시물을 페이지를 파싱하는 대로 하나씩 내보냄
 
-            params = {
-                'od': 'T31',  # 인기순
-                'po': page * 15  # 15개씩 페이지네이션
-            }
+        Args:
+            board_type: 게시판 타입 (get_board_posts 참고)
+            max_pages: 크롤링할 페이지 수
 
-            try:
-                response = requests.get(url, params=params, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
+        Yields:
+            게시물 (증분 모드에서는 지난 수집에서 보지 못한 게시물만)
+        """
+        total = 0
+        # 인기순 목록이라 번호 순서가 아니므로 이미 본 게시물만 제외하고 페이지는 끝까지 넘김
+        cursor = self.crawl_state.ranked_cursor(f'clien:{board_type}') if self.crawl_state else None
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 게시물 목록 파싱
-                post_list = soup.select('.list_item')
-
-                for post in post_list:
-                    try:
-                        # 제목
-                        title_elem = post.select_one('.subject_fixed')
-                        if not title_elem:
-                            title_elem = post.select_one('.list_subject')
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.text.strip()
-
-                        # 댓글 수
-                        comment_elem = post.select_one('.comment_count')
-                        comments = 0
-                        if comment_elem:
-                            comment_text = comment_elem.text.strip()
-                            comment_match = re.search(r'\[(\d+)\]', comment_text)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-
-                        # 조회수
-                        hit_elem = post.select_one('.hit')
-                        hits = 0
-                        if hit_elem:
-                            hit_text = hit_elem.text.strip()
-                            hits = int(hit_text) if hit_text.isdigit() else 0
-
-                        # 추천수
-                        symph_elem = post.select_one('.symph_count')
-                        symphs = 0
-                        if symph_elem:
-                            symph_text = symph_elem.text.strip()
-                            symphs = int(symph_text) if symph_text.isdigit() else 0
-
-                        posts.append({
-                            'title': title,
-                            'comments': comments,
-                            'hits': hits,
-                            'symphs': symphs,
-                            'engagement': comments * 5 + symphs * 10  # 가중치
-                        })
-
-                    except Exception as e:
-                        continue
+        try:
+            for page in range(0, max_pages):
+                url = f'{self.base_url}/service/board/{board_type}'
 
-                if len(posts) > 0:
-                    print(f"   ✅ 현재까지 총 {len(posts)}개 게시물 수집")
+                params = {
+                    'od': 'T31',  # 인기순
+                    'po': page * 15  # 15개씩 페이지네이션
+                }
+
+                try:
+                    response = self.session.get(url, params=params, headers=self.headers, timeout=10)
+                    response.raise_for_status()
+                    response.encoding = 'utf-8'
+
+                    page_posts = parse_board_page(response.text, **self.parse_options)
+
+                except requests.exceptions.HTTPError as e:
+                    print(f"   ⚠️ HTTP 에러: {e}")
+                    continue
+                except Exception as e:
+                    print(f"   ⚠️ 페이지 {page + 1} 수집 실패: {e}")
+                    continue
+
+                if cursor:
+                    page_posts = cursor.filter(page_posts, deliver=False)
+                self._record(f'clien:{board_type}', page_posts)
+
+                total += len(page_posts)
+                if total > 0:
+                    print(f"   ✅ 현재까지 총 {total}개 게시물 수집")
                 else:
                     print(f"   ⚠️ 수집된 게시물 없음")
 
-                # Rate limit 방지
-                time.sleep(random.uniform(1, 2))
+                for post in page_posts:
+                    if cursor:
+                        cursor.deliver(post)
+                    yield post
+        finally:
+            # 넘긴 게시물까지만 기록 (호출한 쪽이 중간에 멈춰도 상태 저장)
+            if cursor:
+                cursor.commit()
+
+        print(f"\n📊 전체 수집 완료: 총 {total}개 게시물")
+
+    async def get_board_posts_async(self, engine: AsyncCrawlEngine, board_type: str = 'park',
+                                    max_pages: int = 5) -> List[Post]:
+        """
+        게시판의 게시물 비동기 수집 (요청 간격은 엔진이 호스트별로 관리)
+
+        Args:
+            engine: 비동기 크롤링 엔진
+            board_type: 게시판 타입
+            max_pages: 크롤링할 페이지 수
+
+        Returns:
+            게시물 리스트
+        """
+        url = f'{self.base_url}/service/board/{board_type}'
+
+        async def fetch_page(page: int) -> List[Post]:
+            # 페이지마다 페치 후 바로 파싱 단계로 넘겨 다른 페이지의 요청과 겹치도록 함
+            try:
+                response = await engine.fetch(url, params={'od': 'T31', 'po': page * 15},
+                                              headers=self.headers, timeout=10)
+                response.raise_for_status()
+                return await engine.parse(partial(parse_board_page, **self.parse_options),
+                                          response, 'utf-8')
 
-            except requests.exceptions.HTTPError as e:
-                print(f"   ⚠️ HTTP 에러: {e}")
-                continue
             except Exception as e:
-                print(f"   ⚠️ 페이지 {page + 1} 수집 실패: {e}")
-                continue
+                print(f"   ⚠️ [{board_type}] 페이지 {page + 1} 수집 실패: {e}")
+                return []
 
-        print(f"\n📊 전체 수집 완료: 총 {len(posts)}개 게시물")
-        return posts
+        pages = await asyncio.gather(*[fetch_page(page) for page in range(0, max_pages)])
+
+        posts = []
+        # 증분 모드: 인기순 목록이라 모든 페이지를 받은 뒤 이미 본 게시물만 제외
+        cursor = self.crawl_state.ranked_cursor(f'clien:{board_type}') if self.crawl_state else None
+        for page_posts in pages:
+            posts.extend(cursor.filter(page_posts) if cursor else page_posts)
+        if cursor:
+            cursor.commit()
+
+        print(f"   ✅ [{board_type}] 총 {len(posts)}개 게시물 수집")
+        return self._record(f'clien:{board_type}', posts)
 
-    def get_monthly_best(self, max_pages: int = 10) -> List[Dict]:
+    def get_monthly_best(self, max_pages: int = 10) -> List[Post]:
         """
         월간 베스트 게시판 가져오기 (모두의공원 인기글)
 
@@ -140,9 +326,11 @@ class ClienCrawler:
             max_pages: 크롤링할 페이지 수
 
         Returns:
-            게시물 리스트
+            게시물 리스트 (증분 모드에서는 지난 수집에서 보지 못한 게시물만)
         """
         posts = []
+        # 인기순 목록이라 이미 본 게시물만 제외하고 페이지는 끝까지 넘김
+        cursor = self.crawl_state.ranked_cursor('clien:park') if self.crawl_state else None
 
         # 모두의공원(park) 게시판의 인기글로 변경
         for page in range(0, max_pages):
@@ -155,7 +343,7 @@ class ClienCrawler:
 
             try:
                 print(f"   페이지 {page + 1}/{max_pages} 요청 중: {url}")
-                response = requests.get(url, params=params, headers=self.headers, timeout=10)
+                response = self.session.get(url, params=params, headers=self.headers, timeout=10)
 
                 print(f"   응답 코드: {response.status_code}")
 
@@ -166,63 +354,20 @@ class ClienCrawler:
                 response.raise_for_status()
                 response.encoding = 'utf-8'
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 게시물 목록 파싱 (여러 선택자 시도)
-                post_list = soup.select('.list_item')
-
-                if not post_list:
-                    post_list = soup.select('div[class*="list"]')
-
-                if not post_list:
+                page_posts = parse_monthly_best_page(response.text, self.parser_backend)
+                if not page_posts:
                     print(f"   ⚠️ 게시물을 찾을 수 없습니다")
                     continue
 
-                print(f"   ✓ {len(post_list)}개 게시물 발견")
-
-                for post in post_list:
-                    try:
-                        # 제목
-                        title_elem = post.select_one('.subject_fixed') or post.select_one('.list_subject')
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.text.strip()
-
-                        # 댓글 수
-                        comment_elem = post.select_one('.comment_count')
-                        comments = 0
-                        if comment_elem:
-                            comment_text = comment_elem.text.strip()
-                            comment_match = re.search(r'\[(\d+)\]', comment_text)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-
-                        # 추천수
-                        symph_elem = post.select_one('.symph_count')
-                        symphs = 0
-                        if symph_elem:
-                            symph_text = symph_elem.text.strip()
-                            symphs = int(symph_text) if symph_text.isdigit() else 0
-
-                        posts.append({
-                            'title': title,
-                            'comments': comments,
-                            'symphs': symphs,
-                            'engagement': comments * 5 + symphs * 10
-                        })
-
-                    except Exception as e:
-                        continue
+                if cursor:
+                    page_posts = cursor.filter(page_posts)
+                posts.extend(page_posts)
 
                 if len(posts) > 0:
                     print(f"   ✅ 현재까지 총 {len(posts)}개 게시물 수집")
                 else:
                     print(f"   ⚠️ 수집된 게시물 없음")
 
-                # Rate limit 방지
-                time.sleep(random.uniform(1, 2))
-
             except requests.exceptions.HTTPError as e:
                 print(f"   ⚠️ HTTP 에러: {e}")
                 continue
@@ -230,84 +375,102 @@ class ClienCrawler:
                 print(f"   ⚠️ 페이지 {page + 1} 수집 실패: {e}")
                 continue
 
+        if cursor:
+            cursor.commit()
+
         print(f"\n📊 전체 수집 완료: 총 {len(posts)}개 게시물")
-        return posts
+        return self._record('clien:park', posts)
 
-    def extract_keywords_from_posts(self, posts: List[Dict],
-                                   min_length: int = 2) -> List[Dict]:
+    async def get_monthly_best_async(self, engine: AsyncCrawlEngine, max_pages: int = 10) -> List[Post]:
         """
-        게시물에서 키워드 추출
+        월간 베스트 게시판 비동기 수집 (요청 간격은 엔진이 호스트별로 관리)
 
         Args:
-            posts: 게시물 리스트
-            min_length: 최소 키워드 길이
+            engine: 비동기 크롤링 엔진
+            max_pages: 크롤링할 페이지 수
 
         Returns:
-            키워드와 빈도수
+            게시물 리스트 (증분 모드에서는 지난 수집에서 보지 못한 게시물만)
         """
-        keyword_counter = Counter()
-        keyword_engagement = {}
-
-        # 불용어
-        stopwords = {
-            '클리앙', '게시판', '게시글', '공지', '질문', '답변',
-            '입니다', '합니다', '있습니다', '없습니다', '가능', '불가능',
-            '이거', '저거', '그거', '이게', '저게', '그게',
-            '오늘', '어제', '내일', '요즘', '지금', '이제', '그냥',
-            '진짜', '정말', '완전', '너무', '엄청', '개', '매우',
-            '있다', '없다', '하다', '되다', '이다', '아니다',
-            '같다', '듯하다', '보이다', '싶다', '하고', '그리고',
-            '또는', '그런데', '하지만', '그러나', '그래서', '때문에',
-            '안녕하세요', '감사합니다', '수고하세요', '부탁드립니다',
-            '모두의공원', '알뜰구매', '자동차', '영상기기'
-        }
+        url = f'{self.base_url}/service/board/park'
+
+        async def fetch_page(page: int) -> List[Post]:
+            try:
+                response = await engine.fetch(url, params={'od': 'T31', 'po': page * 15},
+                                              headers=self.headers, timeout=10)
+                response.raise_for_status()
+                return await engine.parse(partial(parse_monthly_best_page, backend=self.parser_backend),
+                                          response, 'utf-8')
 
-        for post in posts:
-            title = post['title']
-            engagement = post.get('engagement', 1)
+            except Exception as e:
+                print(f"   ⚠️ 페이지 {page + 1} 수집 실패: {e}")
+                return []
 
-            # 한글 키워드 추출 (2글자 이상)
-            korean_words = re.findall(r'[가-힣]{2,}', title)
+        pages = await asyncio.gather(*[fetch_page(page) for page in range(0, max_pages)])
 
-            # 영어 키워드 추출 (2글자 이상)
-            english_words = re.findall(r'\b[A-Za-z]{2,}\b', title)
+        posts = []
+        # 인기순 목록이라 모든 페이지를 받은 뒤 이미 본 게시물만 제외
+        cursor = self.crawl_state.ranked_cursor('clien:park') if self.crawl_state else None
+        for page_posts in pages:
+            posts.extend(cursor.filter(page_posts) if cursor else page_posts)
+        if cursor:
+            cursor.commit()
 
-            # 숫자+텍스트 조합
-            mixed_words = re.findall(r'\d+[가-힣]+', title)
+        print(f"\n📊 전체 수집 완료: 총 {len(posts)}개 게시물")
+        return self._record('clien:park', posts)
 
-            all_words = korean_words + english_words + mixed_words
+    def _record(self, board_key: str, posts: List[Post]) -> List[Post]:
+        """결과 저장소가 있으면 게시물 저장 후 그대로 반환"""
+        if self.result_store:
+            self.result_store.add_posts(board_key, posts)
+        return posts
 
-            for word in all_words:
-                # 불용어 제거
-                if word.lower() in stopwords or len(word) < min_length:
-                    continue
+    def extract_keywords_from_posts(self, posts: Iterable[Dict], min_length: int = 2,
+                                   top_k: Optional[int] = 100, rank_by: str = 'count',
+                                   capacity: Optional[int] = None) -> List[Dict]:
+        """
+        게시물에서 키워드 추출 (공용 추출 엔진의 'clien' 프로필 사용)
 
-                keyword_counter[word] += 1
+        Args:
+            posts: 게시물 리스트 (capacity 지정 시 제너레이터도 가능)
+            min_length: 최소 키워드 길이
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
 
-                # 인기도 누적
-                if word not in keyword_engagement:
-                    keyword_engagement[word] = 0
-                keyword_engagement[word] += engagement
+        Returns:
+            키워드와 빈도수
+        """
+        return extract_keywords(posts, 'clien', min_length, top_k, rank_by, capacity)
 
-        # 결과 정리
-        keywords = []
-        for word, count in keyword_counter.most_common(100):
-            keywords.append({
-                'keyword': word,
-                'count': count,
-                'total_engagement': keyword_engagement.get(word, 0),
-                'avg_engagement': keyword_engagement.get(word, 0) / count if count > 0 else 0
-            })
+    def keyword_counter(self, capacity: Optional[int] = None):
+        """
+        게시물을 하나씩 집계하는 키워드 카운터 ('clien' 프로필)
 
-        return keywords
+        Args:
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
+        """
+        return make_counter('clien', capacity=capacity)
 
 
 class ClienTrendAnalyzer:
     """클리앙 트렌드 분석기"""
 
-    def __init__(self):
-        """초기화"""
-        self.crawler = ClienCrawler()
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, keyword_capacity: Optional[int] = None,
+                 crawl_state: CrawlState = None, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            keyword_capacity: 지정하면 게시판별 키워드를 고정 메모리 근사 집계
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집에서 보지 못한 게시물만 분석)
+            result_store: 결과 저장소 (지정 시 게시물과 키워드 순위를 실행마다 누적 저장)
+        """
+        self.crawler = ClienCrawler(session, parser_backend, targeted_parsing, crawl_state=crawl_state,
+                                    result_store=result_store)
+        self.keyword_capacity = keyword_capacity
+        self.result_store = result_store
 
     def analyze_boards(self, boards: List[Dict], max_pages: int = 5) -> Dict:
         """
@@ -330,40 +493,76 @@ class ClienTrendAnalyzer:
             print(f"📱 {board_name} 크롤링 중...")
             print(f"{'='*60}")
 
-            posts = self.crawler.get_board_posts(board_type, max_pages)
+            # 페이지를 파싱하는 대로 바로 집계하여 게시물 리스트를 만들지 않음
+            counter = self.crawler.keyword_counter(self.keyword_capacity)
+            counter.add_posts(self.crawler.iter_board_posts(board_type, max_pages))
 
-            if not posts:
-                print(f"⚠️ {board_name}: 게시물을 수집하지 못했습니다.")
-                continue
+            result = self._summarize_board(board_name, counter)
+            if result:
+                results[board_type] = result
 
-            print(f"📊 총 {len(posts)}개 게시물 수집 완료")
+        return results
 
-            # 키워드 추출
-            print(f"🔍 키워드 추출 중...")
-            keywords = self.crawler.extract_keywords_from_posts(posts)
+    async def analyze_boards_async(self, boards: List[Dict], max_pages: int = 5,
+                                   engine: AsyncCrawlEngine = None) -> Dict:
+        """
+        여러 게시판 동시 분석
 
-            print(f"✅ {len(keywords)}개 키워드 추출 완료")
+        Args:
+            boards: [{'type': 'board_type', 'name': 'board_name'}, ...]
+            max_pages: 게시판당 크롤링할 페이지 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
 
-            results[board_type] = {
-                'board_name': board_name,
-                'total_posts': len(posts),
-                'keywords': keywords,
-                'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+        Returns:
+            전체 분석 결과
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
 
-            # 게시판별 Top 10 출력
-            print(f"\n🏆 {board_name} Top 10 키워드:")
-            print("-" * 70)
-            for i, kw in enumerate(keywords[:10], 1):
-                print(f"{i:2d}. {kw['keyword']:20s} | "
-                      f"출현: {kw['count']:3d}회 | "
-                      f"인기도: {kw['total_engagement']:6d}")
+        board_posts = await asyncio.gather(*[
+            self.crawler.get_board_posts_async(engine, board['type'], max_pages)
+            for board in boards
+        ])
 
-            # 게시판 사이 대기
-            time.sleep(random.uniform(2, 3))
+        results = {}
+        for board, posts in zip(boards, board_posts):
+            counter = self.crawler.keyword_counter(self.keyword_capacity)
+            counter.add_posts(posts)
+            result = self._summarize_board(board['name'], counter)
+            if result:
+                results[board['type']] = result
 
         return results
 
+    def _summarize_board(self, board_name: str, counter) -> Dict:
+        """집계한 게시판 키워드에서 결과를 만들고 Top 10 출력"""
+        if not counter.post_count:
+            print(f"⚠️ {board_name}: 게시물을 수집하지 못했습니다.")
+            return None
+
+        print(f"📊 총 {counter.post_count}개 게시물 수집 완료")
+
+        # 키워드 추출
+        print(f"🔍 키워드 추출 중...")
+        keywords = counter.top()
+
+        print(f"✅ {len(keywords)}개 키워드 추출 완료")
+
+        # 게시판별 Top 10 출력
+        print(f"\n🏆 {board_name} Top 10 키워드:")
+        print("-" * 70)
+        for i, kw in enumerate(keywords[:10], 1):
+            print(f"{i:2d}. {kw['keyword']:20s} | "
+                  f"출현: {kw['count']:3d}회 | "
+                  f"인기도: {kw['total_engagement']:6d}")
+
+        return {
+            'board_name': board_name,
+            'total_posts': counter.post_count,
+            'keywords': keywords,
+            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
     def analyze_monthly_best(self, max_pages: int = 10) -> Dict:
         """
         월간 베스트 분석
@@ -378,8 +577,30 @@ class ClienTrendAnalyzer:
         print(f"📊 클리앙 월간 베스트 분석")
         print(f"{'='*60}")
 
-        posts = self.crawler.get_monthly_best(max_pages)
+        return self._summarize_monthly_best(self.crawler.get_monthly_best(max_pages))
+
+    async def analyze_monthly_best_async(self, max_pages: int = 10, engine: AsyncCrawlEngine = None) -> Dict:
+        """
+        월간 베스트 비동기 분석
+
+        Args:
+            max_pages: 크롤링할 페이지 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+
+        Returns:
+            분석 결과
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
+
+        print(f"\n{'='*60}")
+        print(f"📊 클리앙 월간 베스트 분석")
+        print(f"{'='*60}")
+
+        return self._summarize_monthly_best(await self.crawler.get_monthly_best_async(engine, max_pages))
 
+    def _summarize_monthly_best(self, posts: List[Post]) -> Dict:
+        """수집한 월간 베스트 게시물에서 키워드를 추출하여 결과 생성"""
         if not posts:
             print(f"⚠️ 데이터를 수집하지 못했습니다.")
             return {}
@@ -400,11 +621,15 @@ class ClienTrendAnalyzer:
         }
 
     def save_results(self, results: Dict, filename: str = 'clien_trends.json'):
-        """결과 저장 (JSON)"""
+        """결과 저장 (JSON, 결과 저장소가 있으면 키워드 순위도 누적)"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\n💾 결과가 {filename}에 저장되었습니다.")
 
+        if self.result_store:
+            rows = self.result_store.add_keyword_results('clien', results)
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
     def save_results_to_csv(self, results: Dict, filename: str = 'clien_trends.csv'):
         """결과 저장 (CSV)"""
         with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
@@ -428,14 +653,18 @@ class ClienTrendAnalyzer:
 
 # 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='클리앙 트렌드 크롤링')
+    add_db_argument(parser)
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("🚀 클리앙 트렌드 크롤링")
     print("="*80)
     print("\n📱 클리앙에서 트렌드 키워드를 수집합니다.")
     print("⚠️  크롤링 속도 제한을 준수하며, 공개 게시판만 수집합니다.\n")
 
-    # 분석기 초기화
-    analyzer = ClienTrendAnalyzer()
+    # 분석기 초기화 (--db 지정 시 게시물과 키워드 순위를 실행마다 DB에 누적)
+    analyzer = ClienTrendAnalyzer(result_store=ResultStore(args.db) if args.db else None)
 
     try:
         # ===== 옵션 1: 월간 베스트 분석 (추천!) =====
@@ -489,3 +718,6 @@ if __name__ == "__main__":
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if analyzer.result_store:
+            analyzer.result_store.close()
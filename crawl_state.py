@@ -0,0 +1,265 @@
+"""
+증분 수집 상태
+- 게시판별로 마지막으로 수집한 게시물 번호(high-water mark)를 JSON 파일에 저장
+- 다음 실행에서는 이미 본 게시물까지만 페이지를 넘김
+  (새 글이 없으면 게시판당 1페이지, 새 글이 한 페이지를 넘지 않으면 2페이지만 요청)
+- 인기순/차트처럼 번호 순서가 아닌 목록은 최근 수집한 게시물 번호 집합(최대 MAX_SEEN_IDS개)으로
+  이미 본 글만 제외하고 페이지는 끝까지 넘김
+- 크롤러의 __init__(crawl_state=...)에 주입하면 증분 모드로 동작
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from post_record import Post
+
+
+# 기본 상태 파일
+CRAWL_STATE_FILE = 'crawl_state.json'
+
+# 순위 목록에서 기억할 최근 게시물 번호 수 (게시판당)
+MAX_SEEN_IDS = 2000
+
+
+class BoardCursor:
+    """
+    한 번의 게시판 수집에서 새 게시물만 골라내는 커서
+
+    최신 글이 먼저 나오는 목록 전용입니다. 수집 시작 시점의 기준 번호보다 큰 번호의
+    게시물만 새 글로 보고, 번호가 있는 게시물이 전부 이미 본 글인 페이지를 만나면 수집을 멈춥니다.
+    (상단 공지처럼 오래된 글이 섞여 있어도 새 글이 남은 페이지는 계속 넘김)
+
+    기준 번호는 호출한 쪽에 넘긴(deliver) 게시물로만 올리며, 새 글을 모두 넘기지 못했으면
+    (제너레이터를 중간에 멈춘 경우 등) 읽지 않은 글을 건너뛰지 않도록 갱신하지 않습니다.
+    """
+
+    def __init__(self, state: 'CrawlState', board_key: str):
+        self.state = state
+        self.board_key = board_key
+        self.last_seen = state.last_seen(board_key)
+        self.newest = self.last_seen
+        self.done = False
+        self._pending = set()
+
+    def is_new(self, post: Post) -> bool:
+        """번호를 알 수 없는 게시물은 새 글로 취급"""
+        return self.last_seen is None or post.post_id is None or post.post_id > self.last_seen
+
+    def filter(self, page_posts: Iterable[Post], deliver: bool = True) -> List[Post]:
+        """
+        한 페이지의 게시물 중 새 글만 반환
+
+        Args:
+            page_posts: 페이지에서 파싱한 게시물
+            deliver: True면 반환한 게시물을 모두 넘긴 것으로 기록
+                     (False면 호출한 쪽이 게시물마다 deliver 호출)
+
+        Returns:
+            새 게시물 리스트 (이미 본 글만 있는 페이지였다면 done이 True가 됨)
+        """
+        new_posts = []
+        numbered = 0
+        numbered_new = 0
+
+        for post in page_posts:
+            if post.post_id is not None:
+                numbered += 1
+            if self.is_new(post):
+                new_posts.append(post)
+                if post.post_id is not None:
+                    numbered_new += 1
+                    self._pending.add(post.post_id)
+
+        if self.last_seen is not None and numbered > 0 and numbered_new == 0:
+            self.done = True
+
+        if deliver:
+            for post in new_posts:
+                self.deliver(post)
+        return new_posts
+
+    def deliver(self, post: Post):
+        """게시물을 호출한 쪽에 넘긴 것으로 기록"""
+        if post.post_id is None:
+            return
+        self._pending.discard(post.post_id)
+        if self.newest is None or post.post_id > self.newest:
+            self.newest = post.post_id
+
+    def commit(self):
+        """넘긴 게시물 중 가장 큰 번호를 상태 파일에 기록 (넘기지 못한 새 글이 있으면 갱신하지 않음)"""
+        if self._pending:
+            print(f"   ⚠️ [{self.board_key}] 읽지 않은 새 게시물 {len(self._pending)}개가 있어 "
+                  f"증분 수집 상태를 갱신하지 않음")
+            return
+        if self.newest is not None and self.newest != self.last_seen:
+            self.state.update(self.board_key, self.newest)
+
+
+class SeenCursor:
+    """
+    순위 목록(인기순, 실시간 차트)에서 이미 수집한 게시물을 걸러내는 커서
+
+    번호 순서와 순위가 무관하므로 최근 수집한 게시물 번호 집합으로 판별하고,
+    이미 본 글만 있는 페이지라도 수집을 멈추지 않습니다 (done은 항상 False).
+    상태 파일에는 호출한 쪽에 넘긴 게시물의 번호만 추가합니다.
+    """
+
+    def __init__(self, state: 'CrawlState', board_key: str):
+        self.state = state
+        self.board_key = board_key
+        self.seen = set(state.seen_ids(board_key))
+        self.done = False
+        self._delivered = []
+
+    def is_new(self, post: Post) -> bool:
+        """번호를 알 수 없는 게시물은 새 글로 취급"""
+        return post.post_id is None or post.post_id not in self.seen
+
+    def filter(self, page_posts: Iterable[Post], deliver: bool = True) -> List[Post]:
+        """
+        한 페이지의 게시물 중 처음 보는 글만 반환 (같은 수집에서 앞 페이지에 나온 글도 제외)
+
+        Args:
+            page_posts: 페이지에서 파싱한 게시물
+            deliver: True면 반환한 게시물을 모두 넘긴 것으로 기록
+
+        Returns:
+            새 게시물 리스트
+        """
+        new_posts = []
+        for post in page_posts:
+            if self.is_new(post):
+                new_posts.append(post)
+                if post.post_id is not None:
+                    self.seen.add(post.post_id)
+
+        if deliver:
+            for post in new_posts:
+                self.deliver(post)
+        return new_posts
+
+    def deliver(self, post: Post):
+        """게시물을 호출한 쪽에 넘긴 것으로 기록"""
+        if post.post_id is not None:
+            self._delivered.append(post.post_id)
+
+    def commit(self):
+        """넘긴 게시물 번호를 상태 파일의 최근 번호 집합에 추가"""
+        if self._delivered:
+            self.state.add_seen(self.board_key, self._delivered)
+            self._delivered = []
+
+
+class CrawlState:
+    """게시판별 마지막 수집 게시물 번호 저장소"""
+
+    def __init__(self, path: Optional[str] = CRAWL_STATE_FILE):
+        """
+        초기화
+
+        Args:
+            path: 상태 파일 경로 (None이면 파일 없이 메모리에만 유지)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._marks = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """상태 파일 읽기 (없거나 손상된 경우 빈 상태)"""
+        if not self.path:
+            return {}
+
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                marks = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(marks, dict):
+            return {}
+        return {key: mark for key, mark in marks.items()
+                if isinstance(mark, dict) and (isinstance(mark.get('post_id'), int)
+                                               or isinstance(mark.get('seen'), list))}
+
+    def save(self):
+        """상태 파일 저장"""
+        if not self.path:
+            return
+
+        with self._lock:
+            marks = dict(self._marks)
+
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(marks, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"   ⚠️ 증분 수집 상태 저장 실패: {e}")
+
+    def last_seen(self, board_key: str) -> Optional[int]:
+        """게시판의 마지막 수집 게시물 번호 (처음 수집하는 게시판은 None)"""
+        mark = self._marks.get(board_key)
+        return mark.get('post_id') if mark else None
+
+    def seen_ids(self, board_key: str) -> List[int]:
+        """순위 목록의 최근 수집 게시물 번호 (오래된 순)"""
+        mark = self._marks.get(board_key)
+        return mark.get('seen', []) if mark else []
+
+    def cursor(self, board_key: str) -> BoardCursor:
+        """
+        게시판 수집용 커서 생성
+
+        Args:
+            board_key: '사이트:게시판' 형식의 키 (예: 'dcinside:movie', 'ppomppu:ppomppu')
+        """
+        return BoardCursor(self, board_key)
+
+    def ranked_cursor(self, board_key: str) -> SeenCursor:
+        """
+        순위 목록(인기순, 실시간 차트) 수집용 커서 생성
+
+        Args:
+            board_key: '사이트:게시판' 형식의 키 (예: 'clien:park', 'instiz:ichart')
+        """
+        return SeenCursor(self, board_key)
+
+    def update(self, board_key: str, post_id: int):
+        """게시판의 마지막 수집 게시물 번호 갱신 후 저장"""
+        with self._lock:
+            self._marks[board_key] = {
+                'post_id': post_id,
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+        self.save()
+
+    def add_seen(self, board_key: str, post_ids: Iterable[int]):
+        """순위 목록의 최근 수집 게시물 번호 추가 후 저장 (최근 MAX_SEEN_IDS개만 유지)"""
+        with self._lock:
+            seen = list(self._marks.get(board_key, {}).get('seen', []))
+            known = set(seen)
+            for post_id in post_ids:
+                if post_id not in known:
+                    seen.append(post_id)
+                    known.add(post_id)
+            self._marks[board_key] = {
+                'seen': seen[-MAX_SEEN_IDS:],
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+        self.save()
+
+    def reset(self, board_key: str = None):
+        """게시판(미지정 시 전체)의 상태 삭제 - 다음 수집은 처음부터"""
+        with self._lock:
+            if board_key is None:
+                self._marks.clear()
+            else:
+                self._marks.pop(board_key, None)
+
+        if board_key is None and self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        else:
+            self.save()
@@ -4,35 +4,149 @@
 - 제목, 내용에서 트렌드 키워드 분석
 """
 
+import argparse
+import asyncio
+from functools import partial
 import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
 from collections import Counter
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional
 import json
 import csv
 from datetime import datetime
 import sys
 import io
 
+from async_engine import AsyncCrawlEngine
+from crawl_state import CrawlState
+from html_parser import class_strainer, make_soup
+from http_session import CrawlerSession, get_shared_session
+from keyword_extraction import extract_keywords, make_counter, top_keywords
+from post_record import Post
+from result_store import ResultStore, add_db_argument
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+# 기본 크롤링 갤러리 목록
+DEFAULT_GALLERIES = [
+    {'id': 'book', 'name': '도서 갤러리'},
+    {'id': 'comic_new2', 'name': '만화 갤러리'},
+    {'id': 'movie', 'name': '영화 갤러리'},
+    {'id': 'drama', 'name': '드라마 갤러리'},
+    {'id': 'music', 'name': '음악 갤러리'},
+    {'id': 'game', 'name': '게임 갤러리'},
+]
+
+
+# 부분 파싱 시 트리로 만들 영역: 게시물 목록 테이블(.gall_list)
+LIST_STRAINER = class_strainer('table', 'gall_list')
+
+
+def parse_gallery_page(html: str, backend: str = 'auto', targeted: bool = True) -> List[Post]:
+    """
+    갤러리 목록 페이지 파싱
+
+    Args:
+        html: 목록 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+        targeted: True면 게시물 목록 영역만 파싱 (헤더/사이드바/광고 제외)
+
+    Returns:
+        게시물 리스트
+    """
+    soup = make_soup(html, backend, LIST_STRAINER if targeted else None)
+    posts = []
+
+    # 게시물 목록 파싱
+    post_list = soup.select('.gall_list tbody tr.ub-content')
+
+    for post in post_list:
+        try:
+            # 제목
+            title_elem = post.select_one('.gall_tit a')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # 댓글 수
+            reply_elem = post.select_one('.gall_tit .reply_num')
+            reply_count = 0
+            if reply_elem:
+                reply_text = reply_elem.text.strip()
+                reply_match = re.search(r'\[(\d+)\]', reply_text)
+                if reply_match:
+                    reply_count = int(reply_match.group(1))
+
+            # 조회수
+            views_elem = post.select_one('.gall_count')
+            views = 0
+            if views_elem:
+                views_text = views_elem.text.strip()
+                views = int(views_text) if views_text.isdigit() else 0
+
+            # 추천수
+            recommend_elem = post.select_one('.gall_recommend')
+            recommend = 0
+            if recommend_elem:
+                recommend_text = recommend_elem.text.strip()
+                recommend = int(recommend_text) if recommend_text.isdigit() else 0
+
+            # 작성일
+            date_elem = post.select_one('.gall_date')
+            date = date_elem.text.strip() if date_elem else ''
+
+            # 게시물 번호 (증분 수집 기준)
+            post_no = post.get('data-no', '')
+            post_id = int(post_no) if post_no.isdigit() else None
+
+            # 작성자
+            writer_elem = post.select_one('.gall_writer')
+            author = ''
+            if writer_elem:
+                author = writer_elem.get('data-nick', '') or writer_elem.text.strip()
+
+            posts.append(Post('dcinside', title, comments=reply_count, views=views,
+                              likes=recommend, date=date,
+                              engagement=reply_count + recommend,  # 인기도 지표
+                              post_id=post_id, author=author, url=title_elem.get('href', '')))
+
+        except Exception as e:
+            continue
+
+    return posts
+
+
 class DCInsideCrawler:
     """디시인사이드 크롤러"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, crawl_state: CrawlState = None,
+                 result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            parser_backend: HTML 파서 백엔드 ('auto': lxml 우선, 없으면 'html.parser')
+            targeted_parsing: True면 목록 페이지에서 게시물 목록 영역만 파싱
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 수집)
+            result_store: 결과 저장소 (지정 시 수집한 게시물을 게시판별로 저장)
+        """
+        self.session = session or get_shared_session()
+        self.parser_backend = parser_backend
+        self.parse_options = {'backend': parser_backend, 'targeted': targeted_parsing}
+        self.crawl_state = crawl_state
+        self.result_store = result_store
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.base_url = 'https://gall.dcinside.com'
 
-    def get_gallery_list(self, gallery_id: str, page: int = 1) -> List[Dict]:
+    def get_gallery_list(self, gallery_id: str, page: int = 1) -> List[Post]:
         """
         특정 갤러리의 게시물 목록 가져오기
 
@@ -46,138 +160,114 @@ class DCInsideCrawler:
         url = f'{self.base_url}/board/lists/?id={gallery_id}&page={page}'
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             response.encoding = 'utf-8'
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            posts = []
-
-            # 게시물 목록 파싱
-            post_list = soup.select('.gall_list tbody tr.ub-content')
-
-            for post in post_list:
-                try:
-                    # 제목
-                    title_elem = post.select_one('.gall_tit a')
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.text.strip()
-
-                    # 댓글 수
-                    reply_elem = post.select_one('.gall_tit .reply_num')
-                    reply_count = 0
-                    if reply_elem:
-                        reply_text = reply_elem.text.strip()
-                        reply_match = re.search(r'\[(\d+)\]', reply_text)
-                        if reply_match:
-                            reply_count = int(reply_match.group(1))
-
-                    # 조회수
-                    views_elem = post.select_one('.gall_count')
-                    views = 0
-                    if views_elem:
-                        views_text = views_elem.text.strip()
-                        views = int(views_text) if views_text.isdigit() else 0
-
-                    # 추천수
-                    recommend_elem = post.select_one('.gall_recommend')
-                    recommend = 0
-                    if recommend_elem:
-                        recommend_text = recommend_elem.text.strip()
-                        recommend = int(recommend_text) if recommend_text.isdigit() else 0
-
-                    # 작성일
-                    date_elem = post.select_one('.gall_date')
-                    date = date_elem.text.strip() if date_elem else ''
-
-                    posts.append({
-                        'title': title,
-                        'reply_count': reply_count,
-                        'views': views,
-                        'recommend': recommend,
-                        'date': date,
-                        'engagement': reply_count + recommend  # 인기도 지표
-                    })
-
-                except Exception as e:
-                    continue
-
-            return posts
+            return parse_gallery_page(response.text, **self.parse_options)
 
         except requests.exceptions.RequestException as e:
             print(f"❌ 갤러리 조회 실패 ({gallery_id}): {e}")
             return []
 
-    def extract_keywords_from_posts(self, posts: List[Dict],
-                                   min_length: int = 2) -> List[Dict]:
+    async def get_gallery_list_async(self, engine: AsyncCrawlEngine, gallery_id: str,
+                                     page: int = 1) -> List[Post]:
         """
-        게시물에서 키워드 추출
+        특정 갤러리의 게시물 목록 비동기 수집
 
         Args:
-            posts: 게시물 리스트
+            engine: 비동기 크롤링 엔진
+            gallery_id: 갤러리 ID
+            page: 페이지 번호
+
+        Returns:
+            게시물 리스트
+        """
+        url = f'{self.base_url}/board/lists/?id={gallery_id}&page={page}'
+
+        try:
+            response = await engine.fetch(url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+
+            return await engine.parse(partial(parse_gallery_page, **self.parse_options),
+                                      response, 'utf-8')
+
+        except requests.exceptions.RequestException as e:
+            print(f"❌ 갤러리 조회 실패 ({gallery_id}, {page}페이지): {e}")
+            return []
+
+    def _record(self, board_key: str, posts: List[Post]) -> List[Post]:
+        """결과 저장소가 있으면 게시물 저장 후 그대로 반환"""
+        if self.result_store:
+            self.result_store.add_posts(board_key, posts)
+        return posts
+
+    def extract_keywords_from_posts(self, posts: Iterable[Dict], min_length: int = 2,
+                                   top_k: Optional[int] = 100, rank_by: str = 'count',
+                                   capacity: Optional[int] = None) -> List[Dict]:
+        """
+        게시물에서 키워드 추출 (공용 추출 엔진의 'dcinside' 프로필 사용)
+
+        Args:
+            posts: 게시물 리스트 (capacity 지정 시 제너레이터도 가능)
             min_length: 최소 키워드 길이
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
 
         Returns:
             키워드와 빈도수
         """
-        keyword_counter = Counter()
-        keyword_engagement = {}  # 키워드별 인기도 합산
-
-        # 일반적인 단어 필터링
-        stopwords = {
-            '게시판', '갤러리', '디시인사이드', '디시', '질문', '답변',
-            '입니다', '합니다', '있습니다', '없습니다', '가능', '불가능',
-            '이거', '저거', '그거', '이게', '저게', '그게',
-            '오늘', '어제', '내일', '요즘', '지금', '이제', '그냥',
-            '진짜', '정말', '완전', '너무', '엄청', '개', '매우',
-            '있다', '없다', '하다', '되다', '이다', '아니다',
-            '같다', '듯하다', '보이다', '싶다', '하고', '그리고',
-            '또는', '그런데', '하지만', '그러나', '그래서', '때문에'
-        }
+        return extract_keywords(posts, 'dcinside', min_length, top_k, rank_by, capacity)
 
-        for post in posts:
-            title = post['title']
-            engagement = post['engagement']
+    def keyword_counter(self, capacity: Optional[int] = None):
+        """
+        게시물을 하나씩 집계하는 키워드 카운터 ('dcinside' 프로필)
 
-            # 한글 키워드 추출 (2글자 이상)
-            korean_words = re.findall(r'[가-힣]{2,}', title)
+        Args:
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
+        """
+        return make_counter('dcinside', capacity=capacity)
 
-            # 영어 키워드 추출 (3글자 이상)
-            english_words = re.findall(r'\b[A-Za-z]{3,}\b', title)
+    def iter_gallery_posts(self, gallery_id: str, max_pages: int = 5) -> Iterator[Post]:
+        """
+        갤러리 게시물을 페이지를 파싱하는 대로 하나씩 내보냄
 
-            # 숫자+텍스트 조합 (예: 2024년, 3월)
-            mixed_words = re.findall(r'\d+[가-힣]+', title)
+        Args:
+            gallery_id: 갤러리 ID
+            max_pages: 크롤링할 페이지 수
 
-            all_words = korean_words + english_words + mixed_words
+        Yields:
+            게시물 (증분 모드에서는 지난 수집 이후의 새 게시물만)
+        """
+        cursor = self.crawl_state.cursor(f'dcinside:{gallery_id}') if self.crawl_state else None
 
-            for word in all_words:
-                # 불용어 제거
-                if word.lower() in stopwords or len(word) < min_length:
-                    continue
+        try:
+            for page in range(1, max_pages + 1):
+                print(f"   페이지 {page}/{max_pages} 수집 중...")
 
-                keyword_counter[word] += 1
+                posts = self.get_gallery_list(gallery_id, page)
+                if cursor:
+                    posts = cursor.filter(posts, deliver=False)
+                self._record(f'dcinside:{gallery_id}', posts)
 
-                # 인기도 누적
-                if word not in keyword_engagement:
-                    keyword_engagement[word] = 0
-                keyword_engagement[word] += engagement
+                print(f"   ✅ {len(posts)}개 게시물 수집")
 
-        # 결과 정리
-        keywords = []
-        for word, count in keyword_counter.most_common(100):
-            keywords.append({
-                'keyword': word,
-                'count': count,
-                'total_engagement': keyword_engagement.get(word, 0),
-                'avg_engagement': keyword_engagement.get(word, 0) / count if count > 0 else 0
-            })
+                for post in posts:
+                    if cursor:
+                        cursor.deliver(post)
+                    yield post
 
-        return keywords
+                if cursor and cursor.done:
+                    print(f"   ⏹️ 이미 수집한 게시물에 도달 (페이지 {page})")
+                    break
+        finally:
+            # 넘긴 게시물까지만 기록 (호출한 쪽이 중간에 멈춰도 상태 저장)
+            if cursor:
+                cursor.commit()
 
     def crawl_gallery(self, gallery_id: str, gallery_name: str,
-                     max_pages: int = 5) -> Dict:
+                     max_pages: int = 5, keyword_capacity: Optional[int] = None) -> Dict:
         """
         갤러리 크롤링
 
@@ -185,6 +275,7 @@ class DCInsideCrawler:
             gallery_id: 갤러리 ID
             gallery_name: 갤러리 이름
             max_pages: 크롤링할 페이지 수
+            keyword_capacity: 지정하면 키워드를 고정 메모리 근사 집계
 
         Returns:
             크롤링 결과
@@ -193,31 +284,65 @@ class DCInsideCrawler:
         print(f"📱 {gallery_name} ({gallery_id}) 크롤링 중...")
         print(f"{'='*60}")
 
-        all_posts = []
+        # 페이지를 파싱하는 대로 바로 집계하여 게시물 리스트를 만들지 않음
+        counter = self.keyword_counter(keyword_capacity)
+        counter.add_posts(self.iter_gallery_posts(gallery_id, max_pages))
+
+        return self._build_gallery_result(gallery_id, gallery_name, counter)
 
-        for page in range(1, max_pages + 1):
-            print(f"   페이지 {page}/{max_pages} 수집 중...")
+    async def crawl_gallery_async(self, engine: AsyncCrawlEngine, gallery_id: str,
+                                  gallery_name: str, max_pages: int = 5,
+                                  keyword_capacity: Optional[int] = None) -> Dict:
+        """
+        갤러리 비동기 크롤링 (페이지 요청 간격은 엔진이 관리)
 
-            posts = self.get_gallery_list(gallery_id, page)
-            all_posts.extend(posts)
+        Args:
+            engine: 비동기 크롤링 엔진
+            gallery_id: 갤러리 ID
+            gallery_name: 갤러리 이름
+            max_pages: 크롤링할 페이지 수
+            keyword_capacity: 지정하면 키워드를 고정 메모리 근사 집계
 
-            print(f"   ✅ {len(posts)}개 게시물 수집")
+        Returns:
+            크롤링 결과
+        """
+        print(f"📱 {gallery_name} ({gallery_id}) 크롤링 시작...")
+
+        counter = self.keyword_counter(keyword_capacity)
+
+        if self.crawl_state:
+            # 증분 모드: 이미 본 게시물에 도달할 때까지 한 페이지씩 순서대로 요청
+            cursor = self.crawl_state.cursor(f'dcinside:{gallery_id}')
+            for page in range(1, max_pages + 1):
+                counter.add_posts(self._record(f'dcinside:{gallery_id}', cursor.filter(
+                    await self.get_gallery_list_async(engine, gallery_id, page))))
+                if cursor.done:
+                    break
+            cursor.commit()
+        else:
+            pages = await asyncio.gather(*[
+                self.get_gallery_list_async(engine, gallery_id, page)
+                for page in range(1, max_pages + 1)
+            ])
+            for posts in pages:
+                counter.add_posts(self._record(f'dcinside:{gallery_id}', posts))
 
-            # Rate limit 방지
-            time.sleep(random.uniform(1, 2))
+        return self._build_gallery_result(gallery_id, gallery_name, counter)
 
-        print(f"\n📊 총 {len(all_posts)}개 게시물 수집 완료")
+    def _build_gallery_result(self, gallery_id: str, gallery_name: str, counter) -> Dict:
+        """집계한 키워드로 갤러리 결과 생성"""
+        print(f"\n📊 [{gallery_name}] 총 {counter.post_count}개 게시물 수집 완료")
 
         # 키워드 추출
         print(f"🔍 키워드 추출 중...")
-        keywords = self.extract_keywords_from_posts(all_posts)
+        keywords = counter.top()
 
         print(f"✅ {len(keywords)}개 키워드 추출 완료")
 
         return {
             'gallery_id': gallery_id,
             'gallery_name': gallery_name,
-            'total_posts': len(all_posts),
+            'total_posts': counter.post_count,
             'keywords': keywords,
             'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
@@ -226,9 +351,21 @@ class DCInsideCrawler:
 class DCInsideTrendAnalyzer:
     """디시인사이드 트렌드 분석기"""
 
-    def __init__(self):
-        """초기화"""
-        self.crawler = DCInsideCrawler()
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, keyword_capacity: Optional[int] = None,
+                 crawl_state: CrawlState = None, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            keyword_capacity: 지정하면 갤러리별 키워드를 고정 메모리 근사 집계
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 분석)
+            result_store: 결과 저장소 (지정 시 게시물과 키워드 순위를 실행마다 누적 저장)
+        """
+        self.crawler = DCInsideCrawler(session, parser_backend, targeted_parsing, crawl_state=crawl_state,
+                                       result_store=result_store)
+        self.keyword_capacity = keyword_capacity
+        self.result_store = result_store
 
     def analyze_multiple_galleries(self, galleries: List[Dict],
                                    max_pages: int = 5) -> Dict:
@@ -248,66 +385,87 @@ class DCInsideTrendAnalyzer:
             gallery_id = gallery['id']
             gallery_name = gallery['name']
 
-            result = self.crawler.crawl_gallery(gallery_id, gallery_name, max_pages)
+            result = self.crawler.crawl_gallery(gallery_id, gallery_name, max_pages,
+                                                self.keyword_capacity)
             results[gallery_id] = result
+            self._print_gallery_top(result)
 
-            # 각 갤러리별 Top 10 출력
-            print(f"\n🏆 {gallery_name} Top 10 키워드:")
-            print("-" * 70)
-            for i, kw in enumerate(result['keywords'][:10], 1):
-                print(f"{i:2d}. {kw['keyword']:20s} | "
-                      f"출현: {kw['count']:3d}회 | "
-                      f"인기도: {kw['total_engagement']:5d}")
+        return results
+
+    async def analyze_multiple_galleries_async(self, galleries: List[Dict], max_pages: int = 5,
+                                               engine: AsyncCrawlEngine = None) -> Dict:
+        """
+        여러 갤러리 동시 분석
+
+        Args:
+            galleries: [{'id': 'gallery_id', 'name': 'gallery_name'}, ...]
+            max_pages: 갤러리당 크롤링할 페이지 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+
+        Returns:
+            전체 분석 결과
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
+
+        gallery_results = await asyncio.gather(*[
+            self.crawler.crawl_gallery_async(engine, gallery['id'], gallery['name'], max_pages,
+                                             self.keyword_capacity)
+            for gallery in galleries
+        ])
 
-            # 갤러리 사이 대기
-            time.sleep(random.uniform(2, 3))
+        results = {}
+        for gallery, result in zip(galleries, gallery_results):
+            results[gallery['id']] = result
+            self._print_gallery_top(result)
 
         return results
 
-    def get_overall_trends(self, results: Dict, top_n: int = 30) -> List[Dict]:
+    def _print_gallery_top(self, result: Dict):
+        """갤러리별 Top 10 출력"""
+        print(f"\n🏆 {result['gallery_name']} Top 10 키워드:")
+        print("-" * 70)
+        for i, kw in enumerate(result['keywords'][:10], 1):
+            print(f"{i:2d}. {kw['keyword']:20s} | "
+                  f"출현: {kw['count']:3d}회 | "
+                  f"인기도: {kw['total_engagement']:5d}")
+
+    def get_overall_trends(self, results: Dict, top_n: Optional[int] = 30,
+                           rank_by: str = 'count') -> List[Dict]:
         """
         전체 갤러리에서 통합 트렌드 추출
 
         Args:
             results: 갤러리별 분석 결과
-            top_n: 상위 N개 키워드
+            top_n: 상위 N개 키워드 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
 
         Returns:
             통합 트렌드 키워드
         """
         all_keywords = Counter()
-        keyword_engagement = {}
+        keyword_engagement = Counter()
 
         for gallery_id, result in results.items():
             for kw in result['keywords']:
-                keyword = kw['keyword']
-                count = kw['count']
-                engagement = kw['total_engagement']
-
-                all_keywords[keyword] += count
-
-                if keyword not in keyword_engagement:
-                    keyword_engagement[keyword] = 0
-                keyword_engagement[keyword] += engagement
+                all_keywords[kw['keyword']] += kw['count']
+                keyword_engagement[kw['keyword']] += kw['total_engagement']
 
-        # 결과 정리
-        overall_trends = []
-        for keyword, count in all_keywords.most_common(top_n):
-            overall_trends.append({
-                'keyword': keyword,
-                'count': count,
-                'total_engagement': keyword_engagement[keyword],
-                'avg_engagement': keyword_engagement[keyword] / count if count > 0 else 0
-            })
-
-        return overall_trends
+        return top_keywords(
+            ((keyword, count, keyword_engagement[keyword]) for keyword, count in all_keywords.items()),
+            top_n, rank_by
+        )
 
     def save_results(self, results: Dict, filename: str = 'dcinside_trends.json'):
-        """결과 저장 (JSON)"""
+        """결과 저장 (JSON, 결과 저장소가 있으면 키워드 순위도 누적)"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\n💾 결과가 {filename}에 저장되었습니다.")
 
+        if self.result_store:
+            rows = self.result_store.add_keyword_results('dcinside', results)
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
     def save_results_to_csv(self, results: Dict, filename: str = 'dcinside_trends.csv'):
         """결과 저장 (CSV)"""
         with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
@@ -331,6 +489,10 @@ class DCInsideTrendAnalyzer:
 
 # 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='디시인사이드 트렌드 크롤링')
+    add_db_argument(parser)
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("🚀 디시인사이드 트렌드 크롤링")
     print("="*80)
@@ -338,17 +500,10 @@ if __name__ == "__main__":
     print("⚠️  크롤링 속도 제한을 준수하며, 공개 게시판만 수집합니다.\n")
 
     # 크롤링할 갤러리 목록 (필요에 따라 수정 가능)
-    galleries = [
-        {'id': 'book', 'name': '도서 갤러리'},
-        {'id': 'comic_new2', 'name': '만화 갤러리'},
-        {'id': 'movie', 'name': '영화 갤러리'},
-        {'id': 'drama', 'name': '드라마 갤러리'},
-        {'id': 'music', 'name': '음악 갤러리'},
-        {'id': 'game', 'name': '게임 갤러리'},
-    ]
-
-    # 분석기 초기화
-    analyzer = DCInsideTrendAnalyzer()
+    galleries = DEFAULT_GALLERIES
+
+    # 분석기 초기화 (--db 지정 시 게시물과 키워드 순위를 실행마다 DB에 누적)
+    analyzer = DCInsideTrendAnalyzer(result_store=ResultStore(args.db) if args.db else None)
 
     try:
         # 갤러리별 크롤링 및 분석
@@ -395,3 +550,6 @@ if __name__ == "__main__":
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if analyzer.result_store:
+            analyzer.result_store.close()
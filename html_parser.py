@@ -0,0 +1,80 @@
+"""
+HTML 파서 백엔드 선택
+- C 기반 lxml 파서가 설치되어 있으면 사용
+- 없으면 기존 순수 파이썬 'html.parser'로 대체
+- 필요한 목록 영역만 트리로 만드는 부분 파싱(SoupStrainer) 지원
+"""
+
+from typing import List
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+
+# 선호 순서 (앞쪽이 빠름)
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+_available = None
+
+
+def available_backends() -> List[str]:
+    """현재 환경에서 사용할 수 있는 파서 백엔드 목록"""
+    global _available
+
+    if _available is None:
+        _available = []
+        for backend in PARSER_BACKENDS:
+            try:
+                BeautifulSoup('<p></p>', backend)
+                _available.append(backend)
+            except FeatureNotFound:
+                continue
+    return _available
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """
+    파서 백엔드 이름 결정
+
+    Args:
+        backend: 'auto' (가장 빠른 백엔드), 'lxml', 'html.parser'
+
+    Returns:
+        실제로 사용할 백엔드 이름 (설치되지 않은 경우 'html.parser')
+    """
+    backends = available_backends()
+
+    if backend == 'auto':
+        return backends[0]
+    if backend in backends:
+        return backend
+    return 'html.parser'
+
+
+def class_strainer(tag: str = None, class_name: str = None) -> SoupStrainer:
+    """
+    특정 클래스를 가진 요소만 남기는 SoupStrainer 생성
+
+    여러 클래스가 붙은 요소(class="list_item symph_row")도 매칭되도록
+    클래스 값을 공백 단위로 비교합니다.
+    """
+    def has_class(value) -> bool:
+        if not value:
+            return False
+        if isinstance(value, str):
+            return class_name in value.split()
+        return class_name in value
+
+    return SoupStrainer(tag, class_=has_class)
+
+
+def make_soup(html: str, backend: str = 'auto',
+              parse_only: SoupStrainer = None) -> BeautifulSoup:
+    """
+    선택한 백엔드로 BeautifulSoup 생성
+
+    Args:
+        html: 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+        parse_only: 지정하면 일치하는 요소의 하위 트리만 생성 (헤더/사이드바/광고 제외)
+    """
+    return BeautifulSoup(html, resolve_backend(backend), parse_only=parse_only)
@@ -0,0 +1,139 @@
+"""
+디스크 HTTP 응답 캐시
+- URL+쿼리 파라미터를 키로 GET 응답 본문/헤더를 디스크에 저장
+- TTL 안의 응답은 요청 없이 로컬에서 반환 (요청 제한 토큰도 쓰지 않음)
+- TTL이 지난 응답은 ETag/Last-Modified가 있으면 If-None-Match/If-Modified-Since로 재검증
+  (304 응답이면 저장된 본문을 그대로 사용)
+- CrawlerSession(cache=HttpCache())로 연결하면 모든 크롤러의 목록 페이지 요청에 적용
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# 기본 캐시 디렉터리 / 유효 기간 (초)
+HTTP_CACHE_DIR = '.http_cache'
+DEFAULT_CACHE_TTL = 3600
+
+
+class HttpCache:
+    """URL+파라미터 단위 디스크 응답 캐시"""
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉터리
+            ttl: 저장된 응답을 재검증 없이 쓰는 시간(초) (None이면 만료 없음)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Dict = None) -> str:
+        """URL과 쿼리 파라미터를 합친 최종 URL의 해시 (파라미터 순서 무관)"""
+        parts = urlsplit(requests.Request('GET', url, params=params).prepare().url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        full_url = urlunsplit(parts._replace(query=query, fragment=''))
+        return hashlib.sha256(full_url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def get(self, key: str) -> Optional[Dict]:
+        """저장된 응답 정보 (없거나 손상된 경우 None)"""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(body_path, 'rb') as f:
+                entry['content'] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """TTL 안에 저장(또는 재검증)된 응답인지"""
+        return self.ttl is None or time.time() - entry['stored_at'] < self.ttl
+
+    @staticmethod
+    def validators(entry: Dict) -> Dict[str, str]:
+        """재검증 요청 헤더 (서버가 ETag/Last-Modified를 준 경우에만)"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: str, response: requests.Response):
+        """200 응답 저장 (Cache-Control: no-store 응답은 저장하지 않음)"""
+        if response.status_code != 200:
+            return
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+
+        self._write(key, {
+            'url': response.url,
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': time.time(),
+        }, response.content)
+
+    def refresh(self, key: str, entry: Dict, response: requests.Response) -> Dict:
+        """304 응답으로 재검증된 항목의 저장 시각/검증 헤더 갱신"""
+        entry = dict(entry)
+        content = entry.pop('content')
+        entry['stored_at'] = time.time()
+        entry['etag'] = response.headers.get('ETag') or entry.get('etag')
+        entry['last_modified'] = response.headers.get('Last-Modified') or entry.get('last_modified')
+
+        self._write(key, entry, None)
+        entry['content'] = content
+        return entry
+
+    def _write(self, key: str, meta: Dict, content: Optional[bytes]):
+        # 임시 파일에 쓴 뒤 교체하여 동시에 읽는 스레드가 반쯤 쓴 파일을 보지 않도록 함
+        meta_path, body_path = self._paths(key)
+        suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            if content is not None:
+                with open(body_path + suffix, 'wb') as f:
+                    f.write(content)
+                os.replace(body_path + suffix, body_path)
+            with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + suffix, meta_path)
+        except OSError as e:
+            print(f"   ⚠️ 응답 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def to_response(entry: Dict) -> requests.Response:
+        """저장된 항목을 응답 객체로 변환 (response.from_cache = True)"""
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response._content = entry['content']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
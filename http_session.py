@@ -0,0 +1,160 @@
+"""
+공용 HTTP 세션 레이어
+- Keep-Alive 커넥션 재사용 (요청마다 TCP/TLS 핸드셰이크 반복 방지)
+- 호스트별 커넥션 풀 크기 설정
+- 호스트별 토큰 버킷 요청 제한
+- 선택: 디스크 응답 캐시 (http_cache.py)
+- 모든 크롤러의 __init__에 주입 가능
+"""
+
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import HttpCache
+from rate_limiter import HostRateLimiter
+
+
+# 호스트별 기본 커넥션 풀 크기
+DEFAULT_HOST_POOL_SIZES = {
+    'www.clien.net': 4,
+    'gall.dcinside.com': 4,
+    'www.ppomppu.co.kr': 4,
+    'www.instiz.net': 4,
+    'openapi.naver.com': 8,
+}
+
+
+class CrawlerSession:
+    """커넥션 풀을 공유하는 HTTP 세션"""
+
+    def __init__(self, pool_maxsize: int = 4, host_pool_sizes: Dict[str, int] = None,
+                 rate_limiter: HostRateLimiter = None, cache: HttpCache = None):
+        """
+        초기화
+
+        Args:
+            pool_maxsize: 별도 설정이 없는 호스트의 풀 크기
+            host_pool_sizes: {'호스트': 풀 크기, ...} (기본값: DEFAULT_HOST_POOL_SIZES)
+            rate_limiter: 호스트별 요청 제한 (미지정 시 기본 설정으로 생성)
+            cache: 디스크 응답 캐시 (지정 시 GET 요청에 적용)
+        """
+        if host_pool_sizes is None:
+            host_pool_sizes = DEFAULT_HOST_POOL_SIZES
+
+        self.session = requests.Session()
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = dict(host_pool_sizes)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache = cache
+
+        # 기본 어댑터 (그 외 호스트)
+        default_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', default_adapter)
+        self.session.mount('http://', default_adapter)
+
+        # 호스트별 어댑터 (가장 긴 prefix가 우선 적용됨)
+        for host, size in self.host_pool_sizes.items():
+            self.mount_host(host, size)
+
+    def mount_host(self, host: str, pool_size: int):
+        """특정 호스트 전용 커넥션 풀 등록"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount(f'https://{host}', adapter)
+        self.session.mount(f'http://{host}', adapter)
+        self.host_pool_sizes[host] = pool_size
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL에서 호스트 추출"""
+        return urlsplit(url).netloc
+
+    def request(self, method: str, url: str, throttle: bool = True,
+                **kwargs) -> requests.Response:
+        """
+        HTTP 요청 (풀에 있는 커넥션 재사용)
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            throttle: False면 요청 제한을 건너뜀 (호출 측에서 이미 토큰을 얻은 경우)
+            **kwargs: requests에 전달할 인자
+        """
+        if self.cache is not None and method.upper() == 'GET':
+            return self._cached_get(url, throttle, **kwargs)
+
+        if throttle:
+            self.rate_limiter.acquire(self.host_of(url))
+        return self.session.request(method, url, **kwargs)
+
+    def cached_response(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """
+        요청 없이 쓸 수 있는 캐시 응답 (TTL 안의 GET 응답, 없으면 None)
+
+        비동기 엔진이 요청 제한 토큰을 기다리기 전에 확인하는 용도
+        """
+        if self.cache is None or method.upper() != 'GET':
+            return None
+
+        entry = self.cache.get(self.cache.key(url, kwargs.get('params')))
+        if entry is None or not self.cache.is_fresh(entry):
+            return None
+        return self.cache.to_response(entry)
+
+    def _cached_get(self, url: str, throttle: bool, **kwargs) -> requests.Response:
+        """캐시를 거치는 GET 요청 (만료된 항목은 조건부 요청으로 재검증)"""
+        key = self.cache.key(url, kwargs.get('params'))
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return self.cache.to_response(entry)
+
+        if entry is not None:
+            headers = dict(kwargs.get('headers') or {})
+            headers.update(self.cache.validators(entry))
+            kwargs['headers'] = headers
+
+        if throttle:
+            self.rate_limiter.acquire(self.host_of(url))
+        response = self.session.request('GET', url, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            # 변경 없음: 저장된 본문을 그대로 사용
+            return self.cache.to_response(self.cache.refresh(key, entry, response))
+
+        self.cache.store(key, response)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청"""
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        """모든 커넥션 종료"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> CrawlerSession:
+    """프로세스 전체에서 공유하는 기본 세션 반환"""
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = CrawlerSession()
+        return _shared_session
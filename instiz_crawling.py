@@ -4,138 +4,382 @@
 - 실시간 이슈 분석
 """
 
+import argparse
+import asyncio
+from functools import partial
 import requests
-from bs4 import BeautifulSoup
-import time
-import random
+from bs4 import SoupStrainer
 import re
-from collections import Counter
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import json
 import csv
+import os
 from datetime import datetime
 import sys
 import io
 
+from async_engine import AsyncCrawlEngine
+from crawl_state import CrawlState
+from html_parser import make_soup
+from http_session import CrawlerSession, get_shared_session
+from keyword_extraction import extract_keywords, make_counter
+from post_record import Post
+from result_store import ResultStore, add_db_argument
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+# 게시물 링크의 번호 (/pt/70000000 -> 70000000)
+POST_LINK_PATTERN = re.compile(r'/(\d+)(?:\?|$)')
+
+# 부분 파싱 시 트리로 만들 영역: 게시물 목록 표(#mainboard)
+# (제목/댓글 수가 링크 안에 있든 옆 칸에 있든 행 전체를 보존)
+LIST_STRAINER = SoupStrainer('table', id='mainboard')
+
+
+def parse_board_page(html: str, backend: str = 'auto', targeted: bool = True) -> List[Post]:
+    """
+    게시판 목록 페이지 파싱
+
+    Args:
+        html: 목록 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+        targeted: True면 게시물 목록 영역만 파싱 (헤더/사이드바/광고 제외)
+
+    Returns:
+        게시물 리스트
+    """
+    soup = make_soup(html, backend, LIST_STRAINER if targeted else None)
+    posts = []
+
+    # 게시물 목록 파싱
+    post_list = soup.select('.postBtn')
+    if targeted and not post_list:
+        # 목록 표를 찾지 못하면 (마크업 변경 등) 전체 문서에서 다시 찾음
+        post_list = make_soup(html, backend).select('.postBtn')
+
+    for post in post_list:
+        try:
+            # 제목
+            title_elem = post.select_one('.title')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # 댓글 수
+            comment_elem = post.select_one('.cmtnum')
+            comments = 0
+            if comment_elem:
+                comment_text = comment_elem.text.strip()
+                comment_match = re.search(r'(\d+)', comment_text)
+                if comment_match:
+                    comments = int(comment_match.group(1))
+
+            url = _post_link(post)
+            posts.append(Post('instiz', title, comments=comments, engagement=comments,
+                              post_id=_parse_post_id(url), url=url))
+
+        except Exception as e:
+            continue
+
+    return posts
+
+
+def _post_link(post) -> str:
+    """게시물 링크 - 게시물 요소 자신이나 감싼 링크, 없으면 같은 행의 게시물 링크 (없으면 빈 값)"""
+    if post.name == 'a' and POST_LINK_PATTERN.search(post.get('href', '')):
+        link_elem = post
+    else:
+        link_elem = post.find_parent('a', href=POST_LINK_PATTERN)
+    if not link_elem:
+        row = post if post.name == 'tr' else post.find_parent('tr')
+        link_elem = row.find('a', href=POST_LINK_PATTERN) if row else None
+    return link_elem['href'] if link_elem else ''
+
+
+def _parse_post_id(url: str) -> Optional[int]:
+    """게시물 링크의 번호 (증분 수집 기준)"""
+    id_match = POST_LINK_PATTERN.search(url)
+    return int(id_match.group(1)) if id_match else None
+
+
+# 아이차트 수집 시 시도할 URL 경로 (앞쪽 우선)
+ICHART_URL_PATHS = [
+    '/pt',  # 전체 게시판
+    '/pt/0',  # 인기글
+    '/name',  # 네임드
+]
+
+# 아이차트 게시물 선택자 (앞쪽 우선)
+ICHART_SELECTORS = [
+    '.postBtn',
+    '.post-list-item',
+    'tr.tr',
+    '.list-item',
+    'a[class*="subject"]',
+    'td.subject',
+    '.sbj'
+]
+
+# 제목 추출 방법 (이 순서대로 시도): .title 클래스, a 태그, 직접 텍스트
+TITLE_STRATEGIES = ['title_class', 'anchor', 'text']
+
+# 성공한 URL/선택자를 저장하는 캐시 파일
+SELECTOR_CACHE_FILE = 'instiz_selector_cache.json'
+
+
+def _extract_title(post, strategy: str) -> Optional[str]:
+    """지정한 방법으로 게시물 제목 추출 (실패 시 빈 값)"""
+    if strategy == 'title_class':
+        title_elem = post.select_one('.title')
+        return title_elem.text.strip() if title_elem else None
+
+    if strategy == 'anchor':
+        title_elem = post.select_one('a')
+        if title_elem:
+            return title_elem.get('title', '') or title_elem.text.strip()
+        return None
+
+    return post.text.strip()
+
+
+def parse_ichart_page(html: str, selectors: List[str], max_items: int,
+                      backend: str = 'auto') -> Optional[Tuple[List[Post], str]]:
+    """
+    아이차트 페이지 파싱 (선택자를 차례로 시도, 제목은 .title -> a -> 텍스트 순서로 추출)
+
+    Args:
+        html: 페이지 HTML
+        selectors: 시도할 선택자 목록 (앞쪽 우선)
+        max_items: 수집할 항목 수
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+
+    Returns:
+        (항목 리스트, 성공한 선택자), 실패 시 None
+    """
+    soup = make_soup(html, backend)
+
+    posts = []
+    for selector in selectors:
+        posts = soup.select(selector)
+        if posts:
+            print(f"   ✓ 선택자 '{selector}' 발견: {len(posts)}개")
+            break
+
+    if not posts:
+        print(f"   ✗ 게시물을 찾지 못함")
+        return None
+
+    items = []
+    for post in posts[:max_items]:
+        try:
+            title = None
+            for strategy in TITLE_STRATEGIES:
+                title = _extract_title(post, strategy)
+                if title:
+                    break
+
+            if not title or len(title) < 2:
+                continue
+
+            # 댓글 수
+            comment_elem = post.select_one('.cmtnum') or post.select_one('[class*="cmt"]')
+            comments = 0
+            if comment_elem:
+                comment_text = comment_elem.text.strip()
+                comment_match = re.search(r'(\d+)', comment_text)
+                if comment_match:
+                    comments = int(comment_match.group(1))
+
+            url = _post_link(post)
+            items.append(Post('instiz', title, comments=comments, engagement=comments + 1,
+                              post_id=_parse_post_id(url), url=url))
+
+        except Exception as e:
+            continue
+
+    if not items:
+        return None
+
+    print(f"   ✓ {len(items)}개 게시물 수집 성공")
+    return items, selector
+
+
 class InstizCrawler:
     """인스티즈 크롤러"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True,
+                 selector_cache_file: Optional[str] = SELECTOR_CACHE_FILE,
+                 crawl_state: CrawlState = None, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            parser_backend: HTML 파서 백엔드 ('auto': lxml 우선, 없으면 'html.parser')
+            targeted_parsing: True면 목록 페이지에서 게시물 목록 영역만 파싱
+            selector_cache_file: 아이차트 선택자 캐시 파일 (None이면 캐시 사용 안 함)
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 수집)
+            result_store: 결과 저장소 (지정 시 수집한 게시물을 게시판별로 저장)
+        """
+        self.session = session or get_shared_session()
+        self.parser_backend = parser_backend
+        self.parse_options = {'backend': parser_backend, 'targeted': targeted_parsing}
+        self.crawl_state = crawl_state
+        self.result_store = result_store
+        self.selector_cache_file = selector_cache_file
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.base_url = 'https://www.instiz.net'
 
-    def get_ichart_trends(self, max_items: int = 50) -> List[Dict]:
+    def get_ichart_trends(self, max_items: int = 50) -> List[Post]:
         """
         인스티즈 아이차트 (실시간 차트) 가져오기
 
+        이전 실행에서 성공한 URL/선택자를 캐시 파일에서 읽어 한 번의 요청과
+        한 번의 선택자 탐색으로 수집합니다 (제목은 항상 .title -> a -> 텍스트 순서로 추출).
+        캐시된 선택자로 max_items개를 수집하지 못하면 캐시를 지우고 전체 URL/선택자를 다시 탐색합니다.
+
         Args:
             max_items: 수집할 항목 수
 
         Returns:
-            차트 항목 리스트
+            차트 항목 리스트 (증분 모드에서는 지난 수집에서 보지 못한 게시물만)
         """
-        # 여러 URL 시도
-        urls_to_try = [
-            f'{self.base_url}/pt',  # 전체 게시판
-            f'{self.base_url}/pt/0',  # 인기글
-            'https://www.instiz.net/name',  # 네임드
-        ]
-
-        for url in urls_to_try:
-            try:
-                print(f"   시도 중: {url}")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-                items = []
-
-                # 여러 선택자 시도
-                selectors = [
-                    '.postBtn',
-                    '.post-list-item',
-                    'tr.tr',
-                    '.list-item',
-                    'a[class*="subject"]',
-                    'td.subject',
-                    '.sbj'
-                ]
-
-                posts = []
-                for selector in selectors:
-                    posts = soup.select(selector)
-                    if posts:
-                        print(f"   ✓ 선택자 '{selector}' 발견: {len(posts)}개")
-                        break
-
-                if not posts:
-                    print(f"   ✗ 게시물을 찾지 못함")
-                    # 디버그: HTML 일부 출력
-                    # print(f"   HTML 샘플: {soup.prettify()[:500]}")
-                    continue
+        cached = self._load_selector_cache()
+        if cached:
+            print(f"   캐시된 선택자 사용: {cached['url']} / '{cached['selector']}'")
+            result = self._probe_ichart(cached['url'], [cached['selector']], max_items)
+            # 제목 추출의 마지막 방법(직접 텍스트)은 어떤 요소에도 맞으므로 항목 수로 캐시를 검증
+            if result and len(result[0]) >= max_items:
+                return self._record_new('instiz:ichart', result[0])
+
+            print(f"   ⚠️ 캐시된 선택자로 {max_items}개를 수집하지 못해 다시 탐색합니다.")
+            self._clear_selector_cache()
+
+        for path in ICHART_URL_PATHS:
+            result = self._probe_ichart(f'{self.base_url}{path}', ICHART_SELECTORS, max_items)
+            if result:
+                items, selector = result
+                self._save_selector_cache(f'{self.base_url}{path}', selector)
+                return self._record_new('instiz:ichart', items)
 
-                for post in posts[:max_items]:
-                    try:
-                        # 여러 방법으로 제목 추출 시도
-                        title = None
-
-                        # 방법 1: .title 클래스
-                        title_elem = post.select_one('.title')
-                        if title_elem:
-                            title = title_elem.text.strip()
-
-                        # 방법 2: a 태그
-                        if not title:
-                            title_elem = post.select_one('a')
-                            if title_elem:
-                                title = title_elem.get('title', '') or title_elem.text.strip()
-
-                        # 방법 3: 직접 텍스트
-                        if not title:
-                            title = post.text.strip()
-
-                        if not title or len(title) < 2:
-                            continue
-
-                        # 댓글 수
-                        comment_elem = post.select_one('.cmtnum') or post.select_one('[class*="cmt"]')
-                        comments = 0
-                        if comment_elem:
-                            comment_text = comment_elem.text.strip()
-                            comment_match = re.search(r'(\d+)', comment_text)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
-
-                        items.append({
-                            'title': title,
-                            'comments': comments,
-                            'engagement': comments + 1
-                        })
-
-                    except Exception as e:
-                        continue
-
-                if items:
-                    print(f"   ✓ {len(items)}개 게시물 수집 성공")
-                    return items
-
-            except requests.exceptions.RequestException as e:
-                print(f"   ✗ 실패: {e}")
-                continue
+        print(f"❌ 모든 URL에서 데이터 수집 실패")
+        return []
+
+    def _probe_ichart(self, url: str, selectors: List[str],
+                      max_items: int) -> Optional[Tuple[List[Post], str]]:
+        """
+        URL 하나에서 선택자를 차례로 시도하여 차트 항목 수집
+
+        Args:
+            url: 요청 URL
+            selectors: 시도할 선택자 목록 (앞쪽 우선)
+            max_items: 수집할 항목 수
+
+        Returns:
+            (항목 리스트, 성공한 선택자), 실패 시 None
+        """
+        try:
+            print(f"   시도 중: {url}")
+            response = self.session.get(url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            response.encoding = 'utf-8'
+        except requests.exceptions.RequestException as e:
+            print(f"   ✗ 실패: {e}")
+            return None
+
+        return parse_ichart_page(response.text, selectors, max_items, self.parser_backend)
+
+    async def get_ichart_trends_async(self, engine: AsyncCrawlEngine, max_items: int = 50) -> List[Post]:
+        """
+        인스티즈 아이차트 비동기 수집 (get_ichart_trends와 같은 캐시/탐색 순서, 파싱은 엔진이 담당)
+
+        Args:
+            engine: 비동기 크롤링 엔진
+            max_items: 수집할 항목 수
+
+        Returns:
+            차트 항목 리스트 (증분 모드에서는 지난 수집에서 보지 못한 게시물만)
+        """
+        cached = self._load_selector_cache()
+        if cached:
+            print(f"   캐시된 선택자 사용: {cached['url']} / '{cached['selector']}'")
+            result = await self._probe_ichart_async(engine, cached['url'], [cached['selector']], max_items)
+            if result and len(result[0]) >= max_items:
+                return self._record_new('instiz:ichart', result[0])
+
+            print(f"   ⚠️ 캐시된 선택자로 {max_items}개를 수집하지 못해 다시 탐색합니다.")
+            self._clear_selector_cache()
+
+        # 앞쪽 URL에서 성공하면 나머지는 요청하지 않도록 순서대로 시도
+        for path in ICHART_URL_PATHS:
+            result = await self._probe_ichart_async(engine, f'{self.base_url}{path}', ICHART_SELECTORS,
+                                                    max_items)
+            if result:
+                items, selector = result
+                self._save_selector_cache(f'{self.base_url}{path}', selector)
+                return self._record_new('instiz:ichart', items)
 
         print(f"❌ 모든 URL에서 데이터 수집 실패")
         return []
 
-    def get_board_posts(self, board_id: str, max_pages: int = 5) -> List[Dict]:
+    async def _probe_ichart_async(self, engine: AsyncCrawlEngine, url: str, selectors: List[str],
+                                  max_items: int) -> Optional[Tuple[List[Post], str]]:
+        """URL 하나를 비동기로 요청하여 차트 항목 수집 (_probe_ichart의 비동기 버전)"""
+        try:
+            print(f"   시도 중: {url}")
+            response = await engine.fetch(url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"   ✗ 실패: {e}")
+            return None
+
+        return await engine.parse(partial(parse_ichart_page, selectors=selectors, max_items=max_items,
+                                          backend=self.parser_backend),
+                                  response, 'utf-8')
+
+    def _load_selector_cache(self) -> Optional[Dict]:
+        """선택자 캐시 읽기 (없거나 손상된 경우 None)"""
+        if not self.selector_cache_file:
+            return None
+
+        try:
+            with open(self.selector_cache_file, encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not all(key in cached for key in ('url', 'selector')):
+            return None
+        return cached
+
+    def _save_selector_cache(self, url: str, selector: str):
+        """성공한 URL/선택자 저장"""
+        if not self.selector_cache_file:
+            return
+
+        try:
+            with open(self.selector_cache_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': url,
+                    'selector': selector,
+                    'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"   ⚠️ 선택자 캐시 저장 실패: {e}")
+
+    def _clear_selector_cache(self):
+        """선택자 캐시 삭제"""
+        if self.selector_cache_file and os.path.exists(self.selector_cache_file):
+            os.remove(self.selector_cache_file)
+
+    def get_board_posts(self, board_id: str, max_pages: int = 5) -> List[Post]:
         """
         특정 게시판의 게시물 가져오기
 
@@ -146,150 +390,199 @@ class InstizCrawler:
         Returns:
             게시물 리스트
         """
-        posts = []
+        return list(self.iter_board_posts(board_id, max_pages))
 
-        for page in range(1, max_pages + 1):
-            url = f'{self.base_url}/bbs/{board_id}?page={page}'
+    def iter_board_posts(self, board_id: str, max_pages: int = 5) -> Iterator[Post]:
+        """
+        특정 게시판의 게시물을 페이지를 파싱하는 대로 하나씩 내보냄
 
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response.encoding = 'utf-8'
+        Args:
+            board_id: 게시판 ID
+            max_pages: 크롤링할 페이지 수
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+        Yields:
+            게시물 (증분 모드에서는 지난 수집 이후의 새 게시물만)
+        """
+        cursor = self.crawl_state.cursor(f'instiz:{board_id}') if self.crawl_state else None
 
-                # 게시물 목록 파싱
-                post_list = soup.select('.postBtn')
+        try:
+            for page in range(1, max_pages + 1):
+                url = f'{self.base_url}/bbs/{board_id}?page={page}'
 
-                for post in post_list:
-                    try:
-                        # 제목
-                        title_elem = post.select_one('.title')
-                        if not title_elem:
-                            continue
+                try:
+                    response = self.session.get(url, headers=self.headers, timeout=10)
+                    response.raise_for_status()
+                    response.encoding = 'utf-8'
 
-                        title = title_elem.text.strip()
+                    page_posts = parse_board_page(response.text, **self.parse_options)
 
-                        # 댓글 수
-                        comment_elem = post.select_one('.cmtnum')
-                        comments = 0
-                        if comment_elem:
-                            comment_text = comment_elem.text.strip()
-                            comment_match = re.search(r'(\d+)', comment_text)
-                            if comment_match:
-                                comments = int(comment_match.group(1))
+                    print(f"   페이지 {page}/{max_pages}: {len(page_posts)}개 게시물 수집")
 
-                        posts.append({
-                            'title': title,
-                            'comments': comments,
-                            'engagement': comments
-                        })
+                except Exception as e:
+                    print(f"   ⚠️ 페이지 {page} 수집 실패: {e}")
+                    continue
 
-                    except Exception as e:
-                        continue
+                if cursor:
+                    page_posts = cursor.filter(page_posts, deliver=False)
+                self._record(f'instiz:{board_id}', page_posts)
+
+                for post in page_posts:
+                    if cursor:
+                        cursor.deliver(post)
+                    yield post
+
+                if cursor and cursor.done:
+                    print(f"   ⏹️ 이미 수집한 게시물에 도달 (페이지 {page})")
+                    break
+        finally:
+            # 넘긴 게시물까지만 기록 (호출한 쪽이 중간에 멈춰도 상태 저장)
+            if cursor:
+                cursor.commit()
+
+    async def get_board_posts_async(self, engine: AsyncCrawlEngine, board_id: str,
+                                    max_pages: int = 5) -> List[Post]:
+        """
+        특정 게시판의 게시물 비동기 수집 (요청 간격은 엔진이 호스트별로 관리)
 
-                print(f"   페이지 {page}/{max_pages}: {len(post_list)}개 게시물 수집")
+        Args:
+            engine: 비동기 크롤링 엔진
+            board_id: 게시판 ID
+            max_pages: 크롤링할 페이지 수
 
-                # Rate limit 방지
-                time.sleep(random.uniform(1, 2))
+        Returns:
+            게시물 리스트
+        """
+        async def fetch_page(page: int) -> List[Post]:
+            # 페이지마다 페치 후 바로 파싱 단계로 넘겨 다른 페이지의 요청과 겹치도록 함
+            try:
+                response = await engine.fetch(f'{self.base_url}/bbs/{board_id}?page={page}',
+                                              headers=self.headers, timeout=10)
+                response.raise_for_status()
+                return await engine.parse(partial(parse_board_page, **self.parse_options),
+                                          response, 'utf-8')
 
             except Exception as e:
-                print(f"   ⚠️ 페이지 {page} 수집 실패: {e}")
-                continue
+                print(f"   ⚠️ [{board_id}] 페이지 {page} 수집 실패: {e}")
+                return []
 
+        posts = []
+        if self.crawl_state:
+            # 증분 모드: 이미 본 게시물에 도달할 때까지 한 페이지씩 순서대로 요청
+            cursor = self.crawl_state.cursor(f'instiz:{board_id}')
+            for page in range(1, max_pages + 1):
+                posts.extend(cursor.filter(await fetch_page(page)))
+                if cursor.done:
+                    break
+            cursor.commit()
+        else:
+            pages = await asyncio.gather(*[fetch_page(page) for page in range(1, max_pages + 1)])
+            for page_posts in pages:
+                posts.extend(page_posts)
+
+        print(f"   ✅ [{board_id}] 총 {len(posts)}개 게시물 수집")
+        return self._record(f'instiz:{board_id}', posts)
+
+    def _record_new(self, board_key: str, posts: List[Post]) -> List[Post]:
+        """증분 모드면 지난 수집에서 보지 못한 게시물만 남기고 상태를 갱신한 뒤 저장"""
+        if self.crawl_state:
+            # 실시간 차트는 순위 목록이라 번호 기준점 대신 최근 수집한 번호 집합으로 판별
+            cursor = self.crawl_state.ranked_cursor(board_key)
+            posts = cursor.filter(posts)
+            cursor.commit()
+            print(f"   ✓ 새 게시물 {len(posts)}개")
+        return self._record(board_key, posts)
+
+    def _record(self, board_key: str, posts: List[Post]) -> List[Post]:
+        """결과 저장소가 있으면 게시물 저장 후 그대로 반환"""
+        if self.result_store:
+            self.result_store.add_posts(board_key, posts)
         return posts
 
-    def extract_keywords_from_posts(self, posts: List[Dict],
-                                   min_length: int = 2) -> List[Dict]:
+    def extract_keywords_from_posts(self, posts: Iterable[Dict], min_length: int = 2,
+                                   top_k: Optional[int] = 100, rank_by: str = 'count',
+                                   capacity: Optional[int] = None) -> List[Dict]:
         """
-        게시물에서 키워드 추출
+        게시물에서 키워드 추출 (공용 추출 엔진의 'instiz' 프로필 사용)
 
         Args:
-            posts: 게시물 리스트
+            posts: 게시물 리스트 (capacity 지정 시 제너레이터도 가능)
             min_length: 최소 키워드 길이
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
 
         Returns:
             키워드와 빈도수
         """
-        keyword_counter = Counter()
-        keyword_engagement = {}
-
-        # 불용어
-        stopwords = {
-            '인스티즈', '게시판', '게시글', '공지', '질문', '답변',
-            '입니다', '합니다', '있습니다', '없습니다', '가능', '불가능',
-            '이거', '저거', '그거', '이게', '저게', '그게',
-            '오늘', '어제', '내일', '요즘', '지금', '이제', '그냥',
-            '진짜', '정말', '완전', '너무', '엄청', '개', '매우',
-            '있다', '없다', '하다', '되다', '이다', '아니다',
-            '같다', '듯하다', '보이다', '싶다', '하고', '그리고',
-            '또는', '그런데', '하지만', '그러나', '그래서', '때문에',
-            '안녕하세요', '감사합니다', '수고하세요', '부탁드립니다'
-        }
-
-        for post in posts:
-            title = post['title']
-            engagement = post.get('engagement', 1)
-
-            # 한글 키워드 추출 (2글자 이상)
-            korean_words = re.findall(r'[가-힣]{2,}', title)
-
-            # 영어 키워드 추출 (2글자 이상, 대소문자 구분)
-            english_words = re.findall(r'\b[A-Z][a-z]+\b|\b[A-Z]{2,}\b', title)
+        return extract_keywords(posts, 'instiz', min_length, top_k, rank_by, capacity)
 
-            # 숫자+텍스트 조합
-            mixed_words = re.findall(r'\d+[가-힣]+', title)
+    def keyword_counter(self, capacity: Optional[int] = None):
+        """
+        게시물을 하나씩 집계하는 키워드 카운터 ('instiz' 프로필)
 
-            all_words = korean_words + english_words + mixed_words
+        Args:
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
+        """
+        return make_counter('instiz', capacity=capacity)
 
-            for word in all_words:
-                # 불용어 제거
-                if word.lower() in stopwords or len(word) < min_length:
-                    continue
 
-                keyword_counter[word] += 1
+class InstizTrendAnalyzer:
+    """인스티즈 트렌드 분석기"""
 
-                # 인기도 누적
-                if word not in keyword_engagement:
-                    keyword_engagement[word] = 0
-                keyword_engagement[word] += engagement
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, keyword_capacity: Optional[int] = None,
+                 crawl_state: CrawlState = None, result_store: ResultStore = None):
+        """
+        초기화
 
-        # 결과 정리
-        keywords = []
-        for word, count in keyword_counter.most_common(100):
-            keywords.append({
-                'keyword': word,
-                'count': count,
-                'total_engagement': keyword_engagement.get(word, 0),
-                'avg_engagement': keyword_engagement.get(word, 0) / count if count > 0 else 0
-            })
+        Args:
+            keyword_capacity: 지정하면 게시판별 키워드를 고정 메모리 근사 집계
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 분석)
+            result_store: 결과 저장소 (지정 시 게시물과 키워드 순위를 실행마다 누적 저장)
+        """
+        self.crawler = InstizCrawler(session, parser_backend, targeted_parsing, crawl_state=crawl_state,
+                                     result_store=result_store)
+        self.keyword_capacity = keyword_capacity
+        self.result_store = result_store
 
-        return keywords
+    def analyze_ichart(self, max_items: int = 100) -> Dict:
+        """
+        아이차트 분석
 
+        Args:
+            max_items: 수집할 항목 수
 
-class InstizTrendAnalyzer:
-    """인스티즈 트렌드 분석기"""
+        Returns:
+            분석 결과
+        """
+        print(f"\n{'='*60}")
+        print(f"📊 인스티즈 실시간 인기글 분석")
+        print(f"{'='*60}")
 
-    def __init__(self):
-        """초기화"""
-        self.crawler = InstizCrawler()
+        return self._summarize_ichart(self.crawler.get_ichart_trends(max_items))
 
-    def analyze_ichart(self, max_items: int = 100) -> Dict:
+    async def analyze_ichart_async(self, max_items: int = 100, engine: AsyncCrawlEngine = None) -> Dict:
         """
-        아이차트 분석
+        아이차트 비동기 분석
 
         Args:
             max_items: 수집할 항목 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
 
         Returns:
             분석 결과
         """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
+
         print(f"\n{'='*60}")
         print(f"📊 인스티즈 실시간 인기글 분석")
         print(f"{'='*60}")
 
-        items = self.crawler.get_ichart_trends(max_items)
+        return self._summarize_ichart(await self.crawler.get_ichart_trends_async(engine, max_items))
 
+    def _summarize_ichart(self, items: List[Post]) -> Dict:
+        """수집한 아이차트 항목에서 키워드를 추출하여 결과 생성"""
         if not items:
             print(f"⚠️ 데이터를 수집하지 못했습니다.")
             return {}
@@ -330,46 +623,86 @@ class InstizTrendAnalyzer:
             print(f"📱 {board_name} 크롤링 중...")
             print(f"{'='*60}")
 
-            posts = self.crawler.get_board_posts(board_id, max_pages)
+            # 페이지를 파싱하는 대로 바로 집계하여 게시물 리스트를 만들지 않음
+            counter = self.crawler.keyword_counter(self.keyword_capacity)
+            counter.add_posts(self.crawler.iter_board_posts(board_id, max_pages))
 
-            if not posts:
-                print(f"⚠️ {board_name}: 게시물을 수집하지 못했습니다.")
-                continue
+            result = self._summarize_board(board_name, counter)
+            if result:
+                results[board_id] = result
 
-            print(f"📊 총 {len(posts)}개 게시물 수집 완료")
+        return results
 
-            # 키워드 추출
-            print(f"🔍 키워드 추출 중...")
-            keywords = self.crawler.extract_keywords_from_posts(posts)
+    async def analyze_boards_async(self, boards: List[Dict], max_pages: int = 5,
+                                   engine: AsyncCrawlEngine = None) -> Dict:
+        """
+        여러 게시판 동시 분석
 
-            print(f"✅ {len(keywords)}개 키워드 추출 완료")
+        Args:
+            boards: [{'id': 'board_id', 'name': 'board_name'}, ...]
+            max_pages: 게시판당 크롤링할 페이지 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
 
-            results[board_id] = {
-                'board_name': board_name,
-                'total_posts': len(posts),
-                'keywords': keywords,
-                'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+        Returns:
+            전체 분석 결과
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
 
-            # 게시판별 Top 10 출력
-            print(f"\n🏆 {board_name} Top 10 키워드:")
-            print("-" * 70)
-            for i, kw in enumerate(keywords[:10], 1):
-                print(f"{i:2d}. {kw['keyword']:20s} | "
-                      f"출현: {kw['count']:3d}회 | "
-                      f"인기도: {kw['total_engagement']:5d}")
+        board_posts = await asyncio.gather(*[
+            self.crawler.get_board_posts_async(engine, board['id'], max_pages)
+            for board in boards
+        ])
 
-            # 게시판 사이 대기
-            time.sleep(random.uniform(2, 3))
+        results = {}
+        for board, posts in zip(boards, board_posts):
+            counter = self.crawler.keyword_counter(self.keyword_capacity)
+            counter.add_posts(posts)
+            result = self._summarize_board(board['name'], counter)
+            if result:
+                results[board['id']] = result
 
         return results
 
+    def _summarize_board(self, board_name: str, counter) -> Dict:
+        """집계한 게시판 키워드에서 결과를 만들고 Top 10 출력"""
+        if not counter.post_count:
+            print(f"⚠️ {board_name}: 게시물을 수집하지 못했습니다.")
+            return None
+
+        print(f"📊 총 {counter.post_count}개 게시물 수집 완료")
+
+        # 키워드 추출
+        print(f"🔍 키워드 추출 중...")
+        keywords = counter.top()
+
+        print(f"✅ {len(keywords)}개 키워드 추출 완료")
+
+        # 게시판별 Top 10 출력
+        print(f"\n🏆 {board_name} Top 10 키워드:")
+        print("-" * 70)
+        for i, kw in enumerate(keywords[:10], 1):
+            print(f"{i:2d}. {kw['keyword']:20s} | "
+                  f"출현: {kw['count']:3d}회 | "
+                  f"인기도: {kw['total_engagement']:5d}")
+
+        return {
+            'board_name': board_name,
+            'total_posts': counter.post_count,
+            'keywords': keywords,
+            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
     def save_results(self, results: Dict, filename: str = 'instiz_trends.json'):
-        """결과 저장 (JSON)"""
+        """결과 저장 (JSON, 결과 저장소가 있으면 키워드 순위도 누적)"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\n💾 결과가 {filename}에 저장되었습니다.")
 
+        if self.result_store:
+            rows = self.result_store.add_keyword_results('instiz', results)
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
     def save_results_to_csv(self, results: Dict, filename: str = 'instiz_trends.csv'):
         """결과 저장 (CSV)"""
         with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
@@ -393,14 +726,18 @@ class InstizTrendAnalyzer:
 
 # 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='인스티즈 트렌드 크롤링')
+    add_db_argument(parser)
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("🚀 인스티즈 트렌드 크롤링")
     print("="*80)
     print("\n📊 인스티즈에서 실시간 트렌드를 수집합니다.")
     print("⚠️  크롤링 속도 제한을 준수하며, 공개 게시판만 수집합니다.\n")
 
-    # 분석기 초기화
-    analyzer = InstizTrendAnalyzer()
+    # 분석기 초기화 (--db 지정 시 게시물과 키워드 순위를 실행마다 DB에 누적)
+    analyzer = InstizTrendAnalyzer(result_store=ResultStore(args.db) if args.db else None)
 
     try:
         # 실시간 인기글 분석
@@ -437,3 +774,6 @@ if __name__ == "__main__":
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if analyzer.result_store:
+            analyzer.result_store.close()
@@ -0,0 +1,549 @@
+"""
+게시물 제목 키워드 추출
+- 모든 사이트 크롤러가 공유하는 추출 엔진
+- 한글/영어/숫자+한글 토큰을 미리 컴파일한 정규식 하나로 한 번에 추출
+- 사이트별 불용어/영어 패턴 프로필은 모듈 로드 시 한 번만 생성
+- 대량 게시물은 토큰을 정수 ID로 바꿔 NumPy 배열 연산(bincount)으로 집계
+- 끝없이 수집하는 경우 고정 메모리 근사 집계(Space-Saving) 지원
+"""
+
+import heapq
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 파이썬 집계 사용
+    np = None
+
+from post_record import Post
+
+
+# 모든 사이트 공통 불용어
+BASE_STOPWORDS = frozenset({
+    '입니다', '합니다', '있습니다', '없습니다', '가능', '불가능',
+    '이거', '저거', '그거', '이게', '저게', '그게',
+    '오늘', '어제', '내일', '요즘', '지금', '이제', '그냥',
+    '진짜', '정말', '완전', '너무', '엄청', '개', '매우',
+    '있다', '없다', '하다', '되다', '이다', '아니다',
+    '같다', '듯하다', '보이다', '싶다', '하고', '그리고',
+    '또는', '그런데', '하지만', '그러나', '그래서', '때문에'
+})
+
+# 인사말 불용어
+GREETING_STOPWORDS = frozenset({
+    '안녕하세요', '감사합니다', '수고하세요', '부탁드립니다'
+})
+
+# 게시판 공통 단어
+BOARD_STOPWORDS = frozenset({'게시판', '게시글', '공지', '질문', '답변'})
+
+# 사이트별 불용어 프로필
+SITE_STOPWORDS = {
+    'default': BASE_STOPWORDS | GREETING_STOPWORDS | BOARD_STOPWORDS,
+    'dcinside': BASE_STOPWORDS | {'게시판', '갤러리', '디시인사이드', '디시', '질문', '답변'},
+    'clien': BASE_STOPWORDS | GREETING_STOPWORDS | BOARD_STOPWORDS | {
+        '클리앙', '모두의공원', '알뜰구매', '자동차', '영상기기'
+    },
+    'ppomppu': BASE_STOPWORDS | GREETING_STOPWORDS | BOARD_STOPWORDS | {
+        '뽐뿌', '핫딜', '특가', '할인', '최저가', '무료배송', '쿠폰'
+    },
+    'instiz': BASE_STOPWORDS | GREETING_STOPWORDS | BOARD_STOPWORDS | {'인스티즈'},
+}
+
+# 사이트별 영어 키워드 패턴
+ENGLISH_PATTERNS = {
+    'default': r'\b[A-Za-z]{2,}\b',
+    'dcinside': r'\b[A-Za-z]{3,}\b',
+    'instiz': r'\b[A-Z][a-z]+\b|\b[A-Z]{2,}\b',  # 대소문자 구분
+}
+
+# 이 수 이상의 게시물은 배열 연산으로 집계 (작은 입력은 배열 생성 비용이 더 큼)
+VECTORIZE_MIN_POSTS = 500
+
+# 숫자+한글 조합 (예: 2024년, 3월)과 한글 2글자 이상 (뒤에 사이트별 영어 패턴을 붙여 한 번에 매칭)
+# findall 결과: (숫자+한글, 그중 한글 부분, 한글 단어, 영어 단어)
+TOKEN_PATTERN = r'(\d+([가-힣]+))|([가-힣]{2,})'
+
+
+def title_and_engagement(post) -> Tuple[str, int]:
+    """게시물의 (제목, 인기도) - Post는 속성으로, dict는 키로 읽음 (인기도 기본값 1)"""
+    if isinstance(post, Post):
+        return post.title, post.engagement
+    return post['title'], post.get('engagement', 1)
+
+
+class KeywordExtractor:
+    """사이트 프로필 기반 키워드 추출기"""
+
+    def __init__(self, site: str = 'default', min_length: int = 2):
+        """
+        초기화
+
+        Args:
+            site: 사이트 프로필 이름 ('dcinside', 'clien', 'ppomppu', 'instiz', 'default')
+            min_length: 최소 키워드 길이
+        """
+        self.site = site
+        self.min_length = min_length
+        self.stopwords = SITE_STOPWORDS.get(site, SITE_STOPWORDS['default'])
+
+        english = ENGLISH_PATTERNS.get(site, ENGLISH_PATTERNS['default'])
+        self._findall = re.compile(f'{TOKEN_PATTERN}|({english})').findall
+
+    def tokenize(self, title: str) -> List[str]:
+        """
+        제목에서 키워드 추출 (불용어/짧은 단어 제외)
+
+        기존 추출 방식과 같게 한글 단어, 영어 단어, 숫자+한글 조합 순서로 반환하며
+        (출현 횟수가 같은 키워드의 순위가 이 순서를 따름), 숫자+한글 조합은
+        한글 부분이 2글자 이상이면 한글 단어로도 한 번 더 집계합니다.
+        """
+        stopwords = self.stopwords
+        min_length = self.min_length
+        korean_words = []
+        english_words = []
+        mixed_words = []
+
+        for mixed, suffix, korean, english in self._findall(title):
+            if korean:
+                if korean not in stopwords and len(korean) >= min_length:
+                    korean_words.append(korean)
+            elif english:
+                if english.lower() not in stopwords and len(english) >= min_length:
+                    english_words.append(english)
+            else:
+                if len(suffix) >= 2 and suffix not in stopwords and len(suffix) >= min_length:
+                    korean_words.append(suffix)
+                if mixed not in stopwords and len(mixed) >= min_length:
+                    mixed_words.append(mixed)
+
+        return korean_words + english_words + mixed_words
+
+    def count_batch(self, titles: Iterable[str],
+                    engagements: Iterable[int]) -> Tuple[Counter, Dict[str, int]]:
+        """
+        여러 제목의 키워드 출현 횟수와 인기도 합계 집계
+
+        Args:
+            titles: 제목 목록
+            engagements: 제목별 인기도 (titles와 같은 순서)
+
+        Returns:
+            (키워드별 출현 횟수, 키워드별 인기도 합계)
+        """
+        counter = Counter()
+        engagement_sum = {}
+        get = engagement_sum.get
+
+        for title, engagement in zip(titles, engagements):
+            for word in self.tokenize(title):
+                counter[word] += 1
+                engagement_sum[word] = get(word, 0) + engagement
+
+        return counter, engagement_sum
+
+    def intern_batch(self, titles: Iterable[str]) -> Tuple[List[str], List[int], List[int]]:
+        """
+        여러 제목의 토큰을 정수 ID로 변환
+
+        Args:
+            titles: 제목 목록
+
+        Returns:
+            (어휘 - ID 순서의 키워드 목록, 전체 토큰 ID 목록, 제목별 토큰 수)
+        """
+        ids = {}
+        token_ids = []
+        lengths = []
+
+        for title in titles:
+            words = self.tokenize(title)
+            lengths.append(len(words))
+            token_ids.extend([ids.setdefault(word, len(ids)) for word in words])
+
+        return list(ids), token_ids, lengths
+
+    def count_batch_vectorized(self, titles: Iterable[str], engagements: Iterable[int]):
+        """
+        여러 제목의 키워드 출현 횟수와 인기도 합계를 배열 연산으로 집계
+
+        Args:
+            titles: 제목 목록
+            engagements: 제목별 인기도 (titles와 같은 순서)
+
+        Returns:
+            (어휘, 키워드 ID별 출현 횟수 배열, 키워드 ID별 인기도 합계 배열)
+            어휘는 처음 등장한 순서이므로 Counter 집계와 같은 순서
+        """
+        vocab, token_ids, lengths = self.intern_batch(titles)
+        engagement_array = np.asarray(list(engagements))
+
+        token_ids = np.asarray(token_ids, dtype=np.intp)
+        weights = np.repeat(engagement_array, lengths)
+
+        counts = np.bincount(token_ids, minlength=len(vocab))
+        totals = np.bincount(token_ids, weights=weights, minlength=len(vocab))
+
+        # bincount 가중치 합계는 실수이므로 정수 인기도는 정수로 되돌림
+        if np.issubdtype(engagement_array.dtype, np.integer):
+            totals = totals.round().astype(np.int64)
+
+        return vocab, counts, totals
+
+    def extract(self, posts: List[Dict], top_k: Optional[int] = 100,
+                rank_by: str = 'count', vectorized: bool = None) -> List[Dict]:
+        """
+        게시물에서 키워드 추출
+
+        Args:
+            posts: 게시물 리스트 (Post 또는 title/engagement dict)
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+            vectorized: 배열 연산 집계 사용 여부
+                        (None이면 NumPy가 있고 게시물이 VECTORIZE_MIN_POSTS개 이상일 때 사용)
+
+        Returns:
+            키워드와 빈도수 (keyword, count, total_engagement, avg_engagement)
+        """
+        _check_rank_by(rank_by)
+        titles = (title_and_engagement(post)[0] for post in posts)
+        engagements = (title_and_engagement(post)[1] for post in posts)
+
+        if vectorized is None:
+            vectorized = len(posts) >= VECTORIZE_MIN_POSTS
+        if vectorized and np is not None:
+            vocab, counts, totals = self.count_batch_vectorized(titles, engagements)
+            order = _top_indices(_rank_scores(counts, totals, rank_by), top_k)
+            return build_keyword_records(
+                (vocab[i], int(counts[i]), totals[i].item()) for i in order
+            )
+
+        counter, engagement_sum = self.count_batch(titles, engagements)
+        return top_keywords(
+            ((word, count, engagement_sum[word]) for word, count in counter.items()),
+            top_k, rank_by
+        )
+
+
+# 순위 기준별 정렬 키 (행: (키워드, 출현 횟수, 인기도 합계))
+RANK_KEYS = {
+    'count': lambda row: row[1],
+    'total_engagement': lambda row: row[2],
+    'avg_engagement': lambda row: row[2] / row[1] if row[1] > 0 else 0,
+}
+
+
+def _check_rank_by(rank_by: str):
+    if rank_by not in RANK_KEYS:
+        raise ValueError(f"지원하지 않는 순위 기준: {rank_by} (가능: {', '.join(RANK_KEYS)})")
+
+
+def _rank_scores(counts, totals, rank_by: str):
+    """배열 집계 결과에서 순위 기준 점수 배열 생성"""
+    if rank_by == 'count':
+        return counts
+    if rank_by == 'total_engagement':
+        return totals
+    return np.divide(totals, counts, out=np.zeros(len(counts)), where=counts > 0)
+
+
+def _top_indices(scores, top_k: Optional[int]):
+    """
+    점수 상위 top_k개 인덱스 (점수가 같으면 앞쪽 인덱스 우선)
+
+    np.partition으로 k번째 점수를 구해 후보만 정렬하므로 전체 어휘를 정렬하지 않습니다.
+    """
+    size = len(scores)
+    if top_k is not None and top_k <= 0:
+        return []
+
+    if top_k is None or top_k >= size:
+        candidates = np.arange(size)
+    else:
+        threshold = np.partition(scores, size - top_k)[size - top_k]
+        candidates = np.flatnonzero(scores >= threshold)
+
+    order = candidates[np.argsort(-scores[candidates], kind='stable')]
+    return order[:top_k]
+
+
+def top_keywords(rows: Iterable[Tuple[str, int, int]], top_k: Optional[int] = 100,
+                 rank_by: str = 'count') -> List[Dict]:
+    """
+    (키워드, 출현 횟수, 인기도 합계) 행에서 상위 키워드 레코드 생성
+
+    크기 top_k의 힙(heapq.nlargest)으로 선택하므로 전체 정렬 없이 O(n log k)이며,
+    점수가 같으면 먼저 나온 행이 앞에 옵니다 (Counter.most_common과 같은 순서).
+
+    Args:
+        rows: (키워드, 출현 횟수, 인기도 합계) 행
+        top_k: 반환할 키워드 수 (None이면 전체)
+        rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+
+    Returns:
+        키워드 레코드 리스트
+    """
+    _check_rank_by(rank_by)
+    key = RANK_KEYS[rank_by]
+
+    if top_k is None:
+        ranked = sorted(rows, key=key, reverse=True)
+    else:
+        ranked = heapq.nlargest(top_k, rows, key=key)
+    return build_keyword_records(ranked)
+
+
+def build_keyword_records(rows: Iterable[Tuple[str, int, int]]) -> List[Dict]:
+    """(키워드, 출현 횟수, 인기도 합계) 목록을 결과 레코드로 변환"""
+    keywords = []
+    for word, count, total in rows:
+        keywords.append({
+            'keyword': word,
+            'count': count,
+            'total_engagement': total,
+            'avg_engagement': total / count if count > 0 else 0
+        })
+    return keywords
+
+
+class KeywordCounter:
+    """
+    게시물을 하나씩 받아 정확히 집계하는 키워드 카운터
+
+    게시물 리스트를 모두 모으지 않고 제너레이터에서 바로 집계할 때 사용합니다.
+    결과는 같은 게시물로 KeywordExtractor.extract()를 호출한 것과 같습니다.
+    """
+
+    def __init__(self, site: str = 'default', min_length: int = 2):
+        """
+        초기화
+
+        Args:
+            site: 사이트 프로필 이름 (토큰화에 사용)
+            min_length: 최소 키워드 길이
+        """
+        self.extractor = get_extractor(site, min_length)
+        self.post_count = 0
+        self.counts = Counter()
+        self.engagement = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def add_post(self, post: Dict):
+        """게시물 하나의 제목 키워드 집계"""
+        self.post_count += 1
+        title, engagement = title_and_engagement(post)
+        counts = self.counts
+        engagement_sum = self.engagement
+
+        for word in self.extractor.tokenize(title):
+            counts[word] += 1
+            engagement_sum[word] = engagement_sum.get(word, 0) + engagement
+
+    def add_posts(self, posts: Iterable[Dict]):
+        """게시물을 하나씩 집계 (리스트/제너레이터 모두 가능)"""
+        for post in posts:
+            self.add_post(post)
+
+    def feed(self, posts: Iterable[Dict]) -> Iterator[Dict]:
+        """게시물을 집계하면서 그대로 다시 내보냄 (결과 저장과 집계를 한 번에 진행)"""
+        for post in posts:
+            self.add_post(post)
+            yield post
+
+    def top(self, top_k: Optional[int] = 100, rank_by: str = 'count') -> List[Dict]:
+        """
+        상위 키워드
+
+        Args:
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+
+        Returns:
+            키워드 레코드 리스트
+        """
+        return top_keywords(
+            ((word, count, self.engagement[word]) for word, count in self.counts.items()),
+            top_k, rank_by
+        )
+
+
+class HeavyHitterCounter:
+    """
+    고정 메모리 스트리밍 키워드 집계 (Space-Saving 알고리즘)
+
+    최대 capacity개의 키워드만 추적합니다. 추적 중이 아닌 키워드가 들어오고
+    자리가 없으면 출현 횟수가 가장 적은 키워드(최솟값 min)를 내보내고,
+    새 키워드를 출현 횟수 min + 1, 오차 min으로 추적합니다.
+
+    오차 한계 (N = 지금까지 집계한 토큰 수, m = capacity):
+    - 출현 횟수는 과대 추정: count - count_error <= 실제 횟수 <= count
+    - count_error <= N / m
+    - 실제 횟수가 N / m 보다 많은 키워드는 반드시 추적 중
+    - 인기도 합계는 마지막으로 추적을 시작한 이후의 합계이므로 실제 합계 이하
+    """
+
+    def __init__(self, capacity: int = 1000, site: str = 'default', min_length: int = 2):
+        """
+        초기화
+
+        Args:
+            capacity: 추적할 최대 키워드 수 (메모리 한도)
+            site: 사이트 프로필 이름 (토큰화에 사용)
+            min_length: 최소 키워드 길이
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+
+        self.capacity = capacity
+        self.extractor = get_extractor(site, min_length)
+        self.total = 0
+        self.post_count = 0
+
+        # 키워드 -> [출현 횟수, 오차, 인기도 합계]
+        self._entries = {}
+        # 출현 횟수 -> 해당 횟수의 키워드 (삽입 순서 유지, 값 미사용)
+        self._buckets = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_error(self) -> float:
+        """출현 횟수 최대 오차 (N / capacity)"""
+        return self.total / self.capacity
+
+    def _move(self, word: str, old_count: int, new_count: int):
+        """키워드를 출현 횟수 버킷 사이에서 이동"""
+        bucket = self._buckets[old_count]
+        del bucket[word]
+        if not bucket:
+            del self._buckets[old_count]
+            if self._min_count == old_count:
+                self._min_count = new_count
+        self._buckets.setdefault(new_count, {})[word] = None
+
+    def add(self, word: str, engagement: int = 1):
+        """키워드 한 번 집계"""
+        self.total += 1
+        entry = self._entries.get(word)
+
+        if entry is not None:
+            entry[0] += 1
+            entry[2] += engagement
+            self._move(word, entry[0] - 1, entry[0])
+            return
+
+        if len(self._entries) < self.capacity:
+            self._entries[word] = [1, 0, engagement]
+            self._buckets.setdefault(1, {})[word] = None
+            self._min_count = 1
+            return
+
+        # 가장 오래된 최솟값 키워드를 내보내고 그 자리에서 추적 시작
+        min_count = self._min_count
+        bucket = self._buckets[min_count]
+        evicted = next(iter(bucket))
+        del bucket[evicted]
+        del self._entries[evicted]
+        if not bucket:
+            del self._buckets[min_count]
+            self._min_count = min_count + 1
+
+        self._entries[word] = [min_count + 1, min_count, engagement]
+        self._buckets.setdefault(min_count + 1, {})[word] = None
+
+    def add_post(self, post: Dict):
+        """게시물 하나의 제목 키워드 집계"""
+        self.post_count += 1
+        title, engagement = title_and_engagement(post)
+        for word in self.extractor.tokenize(title):
+            self.add(word, engagement)
+
+    def add_posts(self, posts: Iterable[Dict]):
+        """게시물을 하나씩 집계 (리스트/제너레이터 모두 가능)"""
+        for post in posts:
+            self.add_post(post)
+
+    def feed(self, posts: Iterable[Dict]) -> Iterator[Dict]:
+        """게시물을 집계하면서 그대로 다시 내보냄 (결과 저장과 집계를 한 번에 진행)"""
+        for post in posts:
+            self.add_post(post)
+            yield post
+
+    def top(self, top_k: Optional[int] = 100, rank_by: str = 'count') -> List[Dict]:
+        """
+        상위 키워드
+
+        Args:
+            top_k: 반환할 키워드 수 (None이면 추적 중인 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+
+        Returns:
+            키워드 레코드 리스트 (count_error: 출현 횟수 과대 추정 한계)
+        """
+        keywords = top_keywords(
+            ((word, entry[0], entry[2]) for word, entry in self._entries.items()),
+            top_k, rank_by
+        )
+        for kw in keywords:
+            kw['count_error'] = self._entries[kw['keyword']][1]
+        return keywords
+
+
+_extractors = {}
+
+
+def get_extractor(site: str = 'default', min_length: int = 2) -> KeywordExtractor:
+    """사이트 프로필별 추출기 (정규식/불용어는 처음 한 번만 생성)"""
+    key = (site, min_length)
+    if key not in _extractors:
+        _extractors[key] = KeywordExtractor(site, min_length)
+    return _extractors[key]
+
+
+def make_counter(site: str = 'default', min_length: int = 2,
+                 capacity: Optional[int] = None):
+    """
+    스트리밍 키워드 카운터 생성
+
+    Args:
+        site: 사이트 프로필 이름
+        min_length: 최소 키워드 길이
+        capacity: 지정하면 고정 메모리 근사 집계 (HeavyHitterCounter), 없으면 정확한 집계
+
+    Returns:
+        KeywordCounter 또는 HeavyHitterCounter
+    """
+    if capacity is not None:
+        return HeavyHitterCounter(capacity, site, min_length)
+    return KeywordCounter(site, min_length)
+
+
+def extract_keywords(posts: Iterable[Dict], site: str = 'default', min_length: int = 2,
+                     top_k: Optional[int] = 100, rank_by: str = 'count',
+                     capacity: Optional[int] = None) -> List[Dict]:
+    """
+    게시물에서 키워드 추출
+
+    Args:
+        posts: 게시물 리스트 또는 제너레이터 (제너레이터는 하나씩 집계)
+        site: 사이트 프로필 이름
+        min_length: 최소 키워드 길이
+        top_k: 반환할 키워드 수 (None이면 전체)
+        rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+        capacity: 지정하면 최대 capacity개 키워드만 추적하는 근사 집계 (HeavyHitterCounter)
+
+    Returns:
+        키워드와 빈도수
+    """
+    if capacity is not None or not isinstance(posts, (list, tuple)):
+        counter = make_counter(site, min_length, capacity)
+        counter.add_posts(posts)
+        return counter.top(top_k, rank_by)
+
+    return get_extractor(site, min_length).extract(posts, top_k, rank_by)
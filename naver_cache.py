@@ -0,0 +1,132 @@
+"""
+네이버 데이터랩 조회 캐시
+- API 요청 본문(JSON)을 정규화한 문자열을 키로 응답을 디스크에 저장
+- 데이터랩은 일별 데이터를 며칠 늦게 반영하므로, 며칠(SETTLE_DAYS) 전에 끝난 기간만 영구 보관
+- 최근 며칠이 포함된 기간은 짧은 TTL 후 다시 조회
+- 결과(results)가 비어 있는 응답은 저장하지 않음
+- 같은 키워드/기간을 다시 분석할 때 일일 API 호출 한도를 쓰지 않음
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+
+# 기본 캐시 디렉터리 / 최근 기간이 포함된 조회의 유효 기간 (초)
+NAVER_CACHE_DIR = '.naver_cache'
+CURRENT_MONTH_TTL = 3600
+
+# 데이터 반영이 끝났다고 보는 경과 일수 (종료일이 오늘로부터 이 일수 이전이면 영구 보관)
+SETTLE_DAYS = 3
+
+
+class NaverQueryCache:
+    """요청 본문 단위 네이버 데이터랩 응답 캐시"""
+
+    def __init__(self, cache_dir: str = NAVER_CACHE_DIR, current_ttl: float = CURRENT_MONTH_TTL,
+                 settle_days: int = SETTLE_DAYS):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉터리
+            current_ttl: 최근 기간이 포함된 응답을 다시 조회하기까지의 시간(초)
+            settle_days: 종료일이 오늘로부터 이 일수 이전인 기간만 영구 보관
+        """
+        self.cache_dir = cache_dir
+        self.current_ttl = current_ttl
+        self.settle_days = settle_days
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def canonical_body(body: Dict) -> str:
+        """키 순서/공백과 무관한 요청 본문 문자열 (키워드 그룹 순서는 결과 순서이므로 유지)"""
+        return json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+    def key(self, url: str, body: Dict) -> str:
+        """API 주소 + 정규화한 요청 본문의 해시"""
+        raw = url + '\n' + self.canonical_body(body)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def is_closed_range(body: Dict, today: date = None, settle_days: int = SETTLE_DAYS) -> bool:
+        """조회 기간이 settle_days일 이전에 끝나는지 (반영이 끝난 데이터는 바뀌지 않음)"""
+        today = today or date.today()
+        return body['endDate'] <= (today - timedelta(days=settle_days)).isoformat()
+
+    @staticmethod
+    def is_cacheable(response: Dict) -> bool:
+        """결과가 있는 응답인지 (오류/빈 응답을 저장해 두면 같은 조회가 계속 빈 결과를 받음)"""
+        return isinstance(response, dict) and bool(response.get('results'))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, url: str, body: Dict) -> Optional[Dict]:
+        """
+        저장된 응답 반환
+
+        Args:
+            url: API 주소
+            body: 요청 본문
+
+        Returns:
+            API 응답 (없거나 만료된 경우 None)
+        """
+        try:
+            with open(self._path(self.key(url, body)), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() >= expires_at:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry['response']
+
+    def put(self, url: str, body: Dict, response: Dict):
+        """
+        응답 저장 (반영이 끝난 기간은 영구, 최근 기간이 포함되면 current_ttl 동안, 빈 결과는 저장 안 함)
+
+        Args:
+            url: API 주소
+            body: 요청 본문
+            response: API 응답 (JSON)
+        """
+        if not self.is_cacheable(response):
+            return
+
+        closed = self.is_closed_range(body, settle_days=self.settle_days)
+        entry = {
+            'url': url,
+            'body': body,
+            'response': response,
+            'stored_at': time.time(),
+            'expires_at': None if closed else time.time() + self.current_ttl,
+        }
+
+        # 임시 파일에 쓴 뒤 교체하여 동시에 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 함
+        path = self._path(self.key(url, body))
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"   ⚠️ 네이버 조회 캐시 저장 실패: {e}")
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
@@ -0,0 +1,150 @@
+"""
+네이버 데이터랩 배치 간 검색 비율 보정
+- 데이터랩의 ratio는 요청마다 그 요청 안의 최댓값을 100으로 둔 상대값이라
+  서로 다른 요청(키워드 묶음)의 값을 그대로 비교할 수 없음
+- 모든 요청에 같은 기준 키워드(anchor)를 넣고, 요청마다 기준 키워드의 합계가 같아지도록 배율을 맞춤
+- 보정 후 전체 최댓값을 100으로 다시 맞춰 하나의 척도로 정렬 가능
+- 기준 키워드 때문에 요청당 시드는 4개 (추가 요청은 시드 20개당 1회 수준)
+- 쇼핑인사이트 분야도 같은 방식 (요청당 기준 분야 1개 + 분야 2개)
+- 실행 간에는 저장된 시계열과 겹치는 날짜를 기준으로 같은 척도로 조회한 묶음마다 배율 하나로 맞춤
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from naver_planner import (MAX_CATEGORIES_PER_REQUEST, MAX_GROUPS_PER_REQUEST, Seed,
+                           category_group, keyword_group, keyword_groups, plan_category_batches)
+
+
+def _anchor_batches(groups: List[Dict], anchor_group: Dict, key: str,
+                    size: int) -> List[List[Dict]]:
+    """기준 그룹 1개 + 나머지 그룹 (size - 1)개씩 묶음"""
+    others = [group for group in groups if group[key] != anchor_group[key]]
+    return [[anchor_group] + others[i:i + size - 1] for i in range(0, len(others), size - 1)]
+
+
+def plan_anchored_batches(seeds: List[Seed],
+                          anchor: Seed = None) -> Tuple[List[List[Dict]], Optional[Dict]]:
+    """
+    모든 요청에 기준 키워드 그룹을 넣어 시드를 묶음
+
+    한 번의 요청에 모두 들어가면(그룹 5개 이하) 보정이 필요 없으므로 기준 키워드를 넣지 않습니다.
+
+    Args:
+        seeds: 시드 키워드 리스트
+        anchor: 기준 키워드 (미지정 시 첫 번째 시드, 검색량이 중간 정도인 키워드가 가장 정확)
+
+    Returns:
+        (요청별 keywordGroups 리스트, 기준 키워드 그룹 또는 None)
+    """
+    groups = keyword_groups(seeds)
+    if len(groups) <= MAX_GROUPS_PER_REQUEST:
+        return [groups], None
+
+    anchor_group = keyword_group(anchor) if anchor is not None else groups[0]
+    return _anchor_batches(groups, anchor_group, 'groupName', MAX_GROUPS_PER_REQUEST), anchor_group
+
+
+def plan_anchored_categories(categories: List, anchor=None) -> Tuple[List[List[Dict]], Optional[Dict]]:
+    """
+    쇼핑 분야용 plan_anchored_batches (요청당 기준 분야 1개 + 분야 2개)
+
+    Args:
+        categories: 분야 cid 또는 {'name', 'param'} 리스트
+        anchor: 기준 분야 (미지정 시 첫 번째 분야)
+
+    Returns:
+        (요청별 category 리스트, 기준 분야 또는 None)
+    """
+    batches = plan_category_batches(categories)
+    if len(batches) <= 1:
+        return batches, None
+
+    groups = [group for batch in batches for group in batch]
+    anchor_group = category_group(anchor) if anchor is not None else groups[0]
+    return _anchor_batches(groups, anchor_group, 'name', MAX_CATEGORIES_PER_REQUEST), anchor_group
+
+
+def calibrate_batches(batch_series: List[Dict[str, List[Dict]]], anchor_name: str,
+                      keep_anchor: bool = True) -> Dict[str, List[Dict]]:
+    """
+    요청별 검색 비율을 기준 키워드로 하나의 척도에 맞춤
+
+    Args:
+        batch_series: 요청별 {그룹 이름: [{'period': ..., 'ratio': ...}, ...]}
+        anchor_name: 기준 키워드 그룹 이름
+        keep_anchor: False면 결과에서 기준 키워드 제외 (시드가 아닌 기준 키워드인 경우)
+
+    Returns:
+        {그룹 이름: 보정한 데이터} (전체 최댓값 = 100)
+    """
+    def anchor_total(series: Dict[str, List[Dict]]) -> float:
+        return sum(point['ratio'] for point in series.get(anchor_name, []))
+
+    # 기준 키워드 합계가 0보다 큰 첫 요청을 기준 척도로 사용
+    reference = next((total for total in map(anchor_total, batch_series) if total > 0), 0)
+
+    calibrated = {}
+    for series in batch_series:
+        total = anchor_total(series)
+        if reference > 0 and total > 0:
+            scale = reference / total
+        else:
+            scale = 1.0
+            if series:
+                print(f"   ⚠️ 기준 키워드 '{anchor_name}'의 검색량이 없어 보정하지 못한 묶음: "
+                      f"{', '.join(name for name in series if name != anchor_name)}")
+
+        for name, points in series.items():
+            if name == anchor_name and name in calibrated:
+                continue
+            calibrated[name] = [{'period': point['period'], 'ratio': point['ratio'] * scale}
+                                for point in points]
+
+    if not keep_anchor:
+        calibrated.pop(anchor_name, None)
+
+    # 전체 최댓값을 100으로
+    peak = max((point['ratio'] for points in calibrated.values() for point in points), default=0)
+    if peak > 0:
+        for points in calibrated.values():
+            for point in points:
+                point['ratio'] = round(point['ratio'] * 100 / peak, 5)
+
+    return calibrated
+
+
+
+def overlap_scale(series: Dict[str, List[Dict]],
+                  stored: Dict[str, List[Dict]]) -> Optional[float]:
+    """
+    같은 척도로 조회한 시계열 묶음을 저장된 척도에 맞출 배율
+
+    한 번의 조회는 모든 키워드를 같은 최댓값(100) 기준으로 돌려주므로, 시계열마다 따로
+    맞추면 키워드 간 비율이 깨집니다. 저장된 날짜와 겹치는 모든 시계열의 합계로 배율 하나를 구합니다.
+
+    Args:
+        series: 새로 조회한 {이름: [{'period': ..., 'ratio': ...}, ...]} (같은 척도)
+        stored: {이름: 같은 기간의 저장된 데이터}
+
+    Returns:
+        배율 (겹치는 날짜가 없거나 합계가 0이면 None)
+    """
+    stored_total = 0.0
+    new_total = 0.0
+    for name, points in series.items():
+        stored_ratios = {point['period']: point['ratio'] for point in stored.get(name) or []}
+        for point in points:
+            if point['period'] in stored_ratios:
+                stored_total += stored_ratios[point['period']]
+                new_total += point['ratio']
+
+    if stored_total <= 0 or new_total <= 0:
+        return None
+    return stored_total / new_total
+
+
+def rescale(series: Dict[str, List[Dict]], scale: float) -> Dict[str, List[Dict]]:
+    """모든 시계열에 같은 배율 적용"""
+    return {name: [{'period': point['period'], 'ratio': round(point['ratio'] * scale, 5)}
+                   for point in points]
+            for name, points in series.items()}
@@ -0,0 +1,361 @@
+"""
+네이버 데이터랩 API 클라이언트
+- 요청마다 타임아웃 적용
+- 여러 요청을 동시에 진행 (max_in_flight, 요청 속도는 세션의 rate_limiter를 따름)
+- API별 일일 호출 한도를 로컬에서 집계하여 파일에 저장 (자정에 초기화)
+  - 같은 파일/Client ID의 집계기는 프로세스에 하나만 두고, 예약/저장할 때 파일의 호출 수와 큰 값으로 합침
+  - 호출 수는 논리적 요청마다 1회만 집계 (429 재시도는 집계하지 않음)
+- 429 응답은 Retry-After 또는 지수 백오프로 재시도, 일일 한도 초과 응답이면 즉시 중단
+- 남은 호출 수 보고 (report())
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from http_session import CrawlerSession, get_shared_session
+
+
+# API별 일일 호출 한도 (네이버 개발자센터 기본값)
+DAILY_QUOTAS = {
+    'datalab_search': 1000,
+    'shopping_insight': 1000,
+}
+
+API_NAMES = {
+    'datalab_search': '검색어 트렌드',
+    'shopping_insight': '쇼핑인사이트',
+}
+
+# 호출 수 저장 파일
+QUOTA_FILE = 'naver_quota.json'
+
+# 일일 한도 초과 응답의 errorCode (429)
+QUOTA_ERROR_CODE = '010'
+
+
+class QuotaExceededError(requests.exceptions.RequestException):
+    """일일 호출 한도 소진 (기존 요청 실패 처리에서 함께 잡히도록 RequestException 상속)"""
+
+
+def api_of(url: str) -> str:
+    """API 주소 -> 호출 한도 구분 이름"""
+    return 'shopping_insight' if '/datalab/shopping' in url else 'datalab_search'
+
+
+class QuotaTracker:
+    """API별 일일 호출 수 집계"""
+
+    def __init__(self, client_id: str = None, path: Optional[str] = QUOTA_FILE,
+                 daily_quotas: Dict[str, int] = None):
+        """
+        초기화
+
+        Args:
+            client_id: 네이버 API Client ID (애플리케이션마다 한도가 따로 집계됨)
+            path: 호출 수 저장 파일 (None이면 메모리에만 유지)
+            daily_quotas: {'API 이름': 일일 한도} (기본값: DAILY_QUOTAS)
+        """
+        self.client_id = client_id or 'default'
+        self.path = path
+        self.daily_quotas = dict(daily_quotas or DAILY_QUOTAS)
+        self._lock = threading.Lock()
+        self._usage = self._load()
+
+    def _load(self) -> Dict:
+        """저장된 호출 수 읽기 (없거나 손상된 경우 빈 상태)"""
+        if not self.path:
+            return {}
+
+        usage = self._read_file().get(self.client_id, {})
+        return usage if isinstance(usage, dict) else {}
+
+    def _read_file(self) -> Dict:
+        """호출 수 파일 전체 (없거나 손상된 경우 빈 상태)"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                usage = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return usage if isinstance(usage, dict) else {}
+
+    def _merge(self, usage: Dict):
+        """
+        파일의 호출 수를 메모리에 합침
+
+        다른 프로세스가 같은 파일에 기록했을 수 있으므로 API마다 같은 날짜면
+        큰 값, 파일 쪽 날짜가 더 최근이면 파일 값을 사용합니다 (적게 집계하지 않도록).
+        """
+        stored = usage.get(self.client_id)
+        if not isinstance(stored, dict):
+            return
+
+        for api, stored_usage in stored.items():
+            if not isinstance(stored_usage, dict):
+                continue
+            mine = self._usage.get(api)
+            if not mine or stored_usage.get('date', '') > mine.get('date', ''):
+                self._usage[api] = dict(stored_usage)
+            elif stored_usage.get('date') == mine.get('date'):
+                mine['used'] = max(mine.get('used', 0), stored_usage.get('used', 0))
+
+    def _save(self):
+        """호출 수 저장 (파일의 호출 수와 합친 뒤 저장, 다른 Client ID의 기록은 유지)"""
+        if not self.path:
+            return
+
+        usage = self._read_file()
+        self._merge(usage)
+        usage[self.client_id] = self._usage
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(usage, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"   ⚠️ 네이버 API 호출 수 저장 실패: {e}")
+
+    def _today_usage(self, api: str) -> Dict:
+        # 날짜가 바뀌면 호출 수 초기화
+        today = date.today().isoformat()
+        usage = self._usage.get(api)
+        if not usage or usage.get('date') != today:
+            usage = {'date': today, 'used': 0}
+            self._usage[api] = usage
+        return usage
+
+    def used(self, api: str) -> int:
+        """오늘 사용한 호출 수"""
+        with self._lock:
+            return self._today_usage(api)['used']
+
+    def remaining(self, api: str) -> int:
+        """오늘 남은 호출 수"""
+        with self._lock:
+            return max(0, self.daily_quotas.get(api, 0) - self._today_usage(api)['used'])
+
+    def reserve(self, api: str):
+        """
+        호출 1회 예약
+
+        Raises:
+            QuotaExceededError: 오늘 한도를 모두 사용한 경우
+        """
+        with self._lock:
+            if self.path:
+                # 다른 프로세스의 호출 수를 반영한 뒤 한도 확인
+                self._merge(self._read_file())
+            usage = self._today_usage(api)
+            limit = self.daily_quotas.get(api, 0)
+            if usage['used'] >= limit:
+                raise QuotaExceededError(
+                    f"{API_NAMES.get(api, api)} 일일 호출 한도({limit}회)를 모두 사용했습니다.")
+            usage['used'] += 1
+            self._save()
+
+    def exhaust(self, api: str):
+        """서버가 한도 초과를 알린 경우 오늘 남은 호출 수를 0으로 기록"""
+        with self._lock:
+            self._today_usage(api)['used'] = self.daily_quotas.get(api, 0)
+            self._save()
+
+    def report(self) -> Dict[str, Dict]:
+        """API별 {'used', 'limit', 'remaining'}"""
+        report = {}
+        for api, limit in self.daily_quotas.items():
+            used = self.used(api)
+            report[api] = {'used': used, 'limit': limit, 'remaining': max(0, limit - used)}
+        return report
+
+
+# (파일 경로, Client ID) -> 집계기 (같은 한도를 여러 집계기가 나눠 세지 않도록 공유)
+_TRACKERS: Dict[Tuple[Optional[str], str], QuotaTracker] = {}
+_TRACKERS_LOCK = threading.Lock()
+
+
+def get_quota_tracker(client_id: str = None, path: Optional[str] = QUOTA_FILE,
+                      daily_quotas: Dict[str, int] = None) -> QuotaTracker:
+    """
+    파일 경로/Client ID별 공용 호출 수 집계기 (처음 요청할 때 생성)
+
+    Args:
+        client_id: 네이버 API Client ID
+        path: 호출 수 저장 파일 (None이면 메모리에만 유지)
+        daily_quotas: 처음 생성할 때 사용할 일일 한도 (기본값: DAILY_QUOTAS)
+    """
+    key = (os.path.abspath(path) if path else None, client_id or 'default')
+    with _TRACKERS_LOCK:
+        if key not in _TRACKERS:
+            _TRACKERS[key] = QuotaTracker(client_id, path, daily_quotas)
+        return _TRACKERS[key]
+
+
+class NaverApiClient:
+    """동시 요청/호출 한도/429 재시도를 처리하는 네이버 데이터랩 API 클라이언트"""
+
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 session: CrawlerSession = None, quota: QuotaTracker = None,
+                 max_in_flight: int = 4, timeout: float = 10, max_retries: int = 3,
+                 backoff: float = 1.0):
+        """
+        초기화
+
+        Args:
+            client_id: 네이버 API Client ID
+            client_secret: 네이버 API Client Secret
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            quota: 일일 호출 수 집계 (미지정 시 client_id별 공용 집계기 사용)
+            max_in_flight: 동시에 진행할 수 있는 요청 수
+            timeout: 요청 타임아웃(초)
+            max_retries: 429 응답 재시도 횟수
+            backoff: 첫 재시도 대기 시간(초), 재시도마다 2배
+        """
+        self.session = session or get_shared_session()
+        self.quota = quota or get_quota_tracker(client_id)
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.headers = {
+            'X-Naver-Client-Id': client_id,
+            'X-Naver-Client-Secret': client_secret,
+            'Content-Type': 'application/json'
+        }
+
+        self._executor = None
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        429 응답 처리
+
+        Returns:
+            재시도 전 대기 시간 (재시도하지 않을 응답이면 None)
+
+        Raises:
+            QuotaExceededError: 일일 한도 초과 응답인 경우
+        """
+        if response.status_code != 429:
+            return None
+
+        try:
+            error_code = response.json().get('errorCode')
+        except ValueError:
+            error_code = None
+        if error_code == QUOTA_ERROR_CODE:
+            api = api_of(response.url or '')
+            self.quota.exhaust(api)
+            raise QuotaExceededError(f"{API_NAMES.get(api, api)} 일일 호출 한도 초과 (서버 응답)",
+                                     response=response)
+
+        if attempt >= self.max_retries:
+            return None
+
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * (2 ** attempt)
+
+    def _send(self, url: str, body: Dict, throttle: bool = True) -> requests.Response:
+        """요청 1회 전송 (호출 수 예약은 호출한 쪽에서 논리적 요청마다 1회)"""
+        return self.session.post(url, headers=self.headers, data=json.dumps(body),
+                                 timeout=self.timeout, throttle=throttle)
+
+    def post(self, url: str, body: Dict) -> Dict:
+        """
+        API 요청 (429 응답은 대기 후 재시도)
+
+        Args:
+            url: API 주소
+            body: 요청 본문
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패 (한도 소진 시 QuotaExceededError)
+        """
+        # 429로 거절된 재시도는 한도에 집계되지 않으므로 요청마다 한 번만 예약
+        self.quota.reserve(api_of(url))
+
+        attempt = 0
+        while True:
+            response = self._send(url, body)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            print(f"   ⏳ 429 응답: {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
+            attempt += 1
+
+        response.raise_for_status()
+        return response.json()
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프마다 새로 생성 (engine.run()은 매번 새 루프를 사용)
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def post_async(self, url: str, body: Dict, executor: Executor = None) -> Dict:
+        """
+        API 비동기 요청 (최대 max_in_flight개 동시 진행)
+
+        Args:
+            url: API 주소
+            body: 요청 본문
+            executor: 요청을 실행할 스레드 풀 (미지정 시 클라이언트 전용 풀)
+
+        Returns:
+            응답 JSON
+        """
+        if executor is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+            executor = self._executor
+
+        host = CrawlerSession.host_of(url)
+        loop = asyncio.get_running_loop()
+        self.quota.reserve(api_of(url))
+
+        attempt = 0
+        while True:
+            async with self._loop_semaphore():
+                # 토큰은 이벤트 루프에서 기다리고, 요청 자체는 스레드에서 실행
+                await self.session.rate_limiter.acquire_async(host)
+                response = await loop.run_in_executor(
+                    executor, partial(self._send, url, body, throttle=False))
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            print(f"   ⏳ 429 응답: {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        response.raise_for_status()
+        return response.json()
+
+    def report(self) -> Dict[str, Dict]:
+        """API별 오늘 사용/남은 호출 수 출력 후 반환"""
+        report = self.quota.report()
+        print("\n📉 네이버 API 오늘 남은 호출 수")
+        for api, usage in report.items():
+            print(f"   {API_NAMES.get(api, api):12s} | {usage['remaining']:5d} / {usage['limit']}회 "
+                  f"(사용 {usage['used']}회)")
+        return report
+
+    def close(self):
+        """클라이언트 전용 스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -4,24 +4,54 @@
 - 네이버 검색어 트렌드
 """
 
+import argparse
+import asyncio
 import requests
 import json
 import csv
-import time
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import sys
 import io
 
+from async_engine import AsyncCrawlEngine
+from http_session import CrawlerSession, get_shared_session
+from naver_cache import NaverQueryCache
+from naver_client import NaverApiClient
+from naver_calibration import (calibrate_batches, overlap_scale, plan_anchored_batches,
+                               plan_anchored_categories, rescale)
+from naver_planner import (SHOPPING_CATEGORIES, Seed, category_group, keyword_group, keyword_groups,
+                           month_span, plan_batches, plan_category_batches, segment_suffix,
+                           shopping_segments, split_by_month)
+from result_store import ResultStore, add_db_argument
+from timeseries_store import TimeSeriesStore
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+# 기본 시드 키워드 (다양한 카테고리)
+DEFAULT_SEED_KEYWORDS = [
+    # 엔터테인먼트
+    '영화', '드라마', '예능', '음악', '게임',
+    # 스포츠
+    '축구', '야구', '배구', 'E스포츠',
+    # 이슈
+    '정치', '경제', '사회', '국제',
+    # 라이프스타일
+    '패션', '뷰티', '건강', '맛집', '여행',
+    # 테크
+    '스마트폰', 'AI', '전기차'
+]
+
+
 class NaverDataLabCrawler:
     """네이버 데이터랩 크롤러"""
 
-    def __init__(self, client_id: str = None, client_secret: str = None):
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 session: CrawlerSession = None, query_cache: NaverQueryCache = None,
+                 api_client: NaverApiClient = None):
         """
         네이버 API 초기화
 
@@ -29,23 +59,25 @@ class NaverDataLabCrawler:
         1. https://developers.naver.com/apps/#/register 방문
         2. 애플리케이션 등록 (이름만 입력하면 됨)
         3. 'Client ID'와 'Client Secret' 복사
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            query_cache: 요청 본문 단위 응답 캐시 (지정 시 같은 조회는 API를 호출하지 않음)
+            api_client: 타임아웃/동시 요청/호출 한도를 처리하는 API 클라이언트 (미지정 시 생성)
         """
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.headers = {
-            'X-Naver-Client-Id': client_id,
-            'X-Naver-Client-Secret': client_secret,
-            'Content-Type': 'application/json'
-        }
+        self.session = session or get_shared_session()
+        self.query_cache = query_cache
+        self.client = api_client or NaverApiClient(client_id, client_secret, self.session)
+        self.search_url = 'https://openapi.naver.com/v1/datalab/search'
 
-    def search_trend(self, keywords: List[str], start_date: str, end_date: str,
+    def search_trend(self, keywords: List[Seed], start_date: str, end_date: str,
                      timeunit: str = 'month', device: str = '', ages: List[str] = None,
                      gender: str = '') -> Dict:
         """
         네이버 검색어 트렌드 조회
 
         Args:
-            keywords: 검색어 리스트 (최대 5개)
+            keywords: 검색어 리스트 (최대 5개, 동의어 그룹은 ('이름', [검색어, ...]) 형식)
             start_date: 시작일 (YYYY-MM-DD)
             end_date: 종료일 (YYYY-MM-DD)
             timeunit: 'date', 'week', 'month' 중 선택
@@ -54,15 +86,51 @@ class NaverDataLabCrawler:
                    6:35-39세, 7:40-44세, 8:45-49세, 9:50-54세, 10:55-59세, 11:60세 이상)
             gender: 'm', 'f', '' (전체)
         """
-        url = 'https://openapi.naver.com/v1/datalab/search'
+        body = self._build_search_body(keywords, start_date, end_date,
+                                       timeunit, device, ages, gender)
+
+        if self.query_cache:
+            cached = self.query_cache.get(self.search_url, body)
+            if cached is not None:
+                return cached
+
+        try:
+            return self._remember(self.search_url, body, self.client.post(self.search_url, body))
+        except requests.exceptions.RequestException as e:
+            self._print_request_error(e)
+            return None
+
+    async def search_trend_async(self, engine: AsyncCrawlEngine, keywords: List[Seed],
+                                 start_date: str, end_date: str, timeunit: str = 'month',
+                                 device: str = '', ages: List[str] = None,
+                                 gender: str = '') -> Dict:
+        """
+        네이버 검색어 트렌드 비동기 조회 (인자는 search_trend와 동일)
+
+        Args:
+            engine: 비동기 크롤링 엔진
+        """
+        body = self._build_search_body(keywords, start_date, end_date,
+                                       timeunit, device, ages, gender)
+
+        if self.query_cache:
+            cached = self.query_cache.get(self.search_url, body)
+            if cached is not None:
+                return cached
+
+        try:
+            # 여러 요청을 동시에 진행 (동시 요청 수/호출 한도는 API 클라이언트가 관리)
+            data = await self.client.post_async(self.search_url, body, engine.executor)
+            return self._remember(self.search_url, body, data)
+        except requests.exceptions.RequestException as e:
+            self._print_request_error(e)
+            return None
 
-        # 키워드 그룹 생성
-        keyword_groups = []
-        for i, keyword in enumerate(keywords):
-            keyword_groups.append({
-                'groupName': keyword,
-                'keywords': [keyword]
-            })
+    def _build_search_body(self, keywords: List[Seed], start_date: str, end_date: str,
+                           timeunit: str, device: str, ages: List[str], gender: str) -> Dict:
+        """검색어 트렌드 API 요청 본문 생성"""
+        # 키워드 그룹 생성 (검색어 하나 또는 동의어 묶음)
+        keyword_groups = [keyword_group(keyword) for keyword in keywords]
 
         body = {
             'startDate': start_date,  # YYYY-MM-DD 형식 그대로 사용
@@ -78,16 +146,21 @@ class NaverDataLabCrawler:
         if gender:
             body['gender'] = gender
 
-        try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(body))
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"❌ API 요청 실패: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"   응답 코드: {e.response.status_code}")
-                print(f"   응답 내용: {e.response.text}")
-            return None
+        return body
+
+    def _remember(self, url: str, body: Dict, data: Dict) -> Dict:
+        """조회 결과를 캐시에 저장 후 그대로 반환 (결과가 비어 있으면 캐시하지 않음)"""
+        if self.query_cache:
+            self.query_cache.put(url, body, data)
+        return data
+
+    @staticmethod
+    def _print_request_error(e: requests.exceptions.RequestException):
+        """API 요청 실패 내용 출력"""
+        print(f"❌ API 요청 실패: {e}")
+        if hasattr(e, 'response') and e.response is not None:
+            print(f"   응답 코드: {e.response.status_code}")
+            print(f"   응답 내용: {e.response.text}")
 
     def get_popular_keywords_by_category(self, year: int, month: int,
                                          categories: List[str] = None) -> Dict:
@@ -141,24 +214,26 @@ class NaverDataLabCrawler:
                         'data_points': result['data']
                     }
 
-            # API Rate Limit 방지
-            time.sleep(1)
-
         return results
 
 
 class NaverShoppingInsightCrawler:
     """네이버 쇼핑 인사이트 크롤러"""
 
-    def __init__(self, client_id: str = None, client_secret: str = None):
-        """네이버 쇼핑 인사이트 API 초기화"""
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.headers = {
-            'X-Naver-Client-Id': client_id,
-            'X-Naver-Client-Secret': client_secret,
-            'Content-Type': 'application/json'
-        }
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 session: CrawlerSession = None, query_cache: NaverQueryCache = None,
+                 api_client: NaverApiClient = None):
+        """
+        네이버 쇼핑 인사이트 API 초기화
+
+        Args:
+            query_cache: 요청 본문 단위 응답 캐시
+            api_client: 타임아웃/동시 요청/호출 한도를 처리하는 API 클라이언트 (미지정 시 생성)
+        """
+        self.session = session or get_shared_session()
+        self.query_cache = query_cache
+        self.client = api_client or NaverApiClient(client_id, client_secret, self.session)
+        self.categories_url = 'https://openapi.naver.com/v1/datalab/shopping/categories'
 
     def get_category_keywords(self, category: str, start_date: str, end_date: str,
                               timeunit: str = 'month', device: str = '',
@@ -171,13 +246,71 @@ class NaverShoppingInsightCrawler:
             start_date: 시작일 (YYYY-MM-DD)
             end_date: 종료일 (YYYY-MM-DD)
         """
-        url = 'https://openapi.naver.com/v1/datalab/shopping/categories'
+        return self.get_categories([category], start_date, end_date, timeunit, device, ages, gender)
+
+    def get_categories(self, categories: List, start_date: str, end_date: str,
+                       timeunit: str = 'month', device: str = '', ages: List[str] = None,
+                       gender: str = '') -> Dict:
+        """
+        여러 분야를 한 번에 조회 (요청당 최대 3개)
+
+        Args:
+            categories: 분야 cid 또는 {'name': 이름, 'param': [cid, ...]} 리스트
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            timeunit: 'date', 'week', 'month' 중 선택
+            device: 'pc', 'mo', '' (전체)
+            ages: ['10', '20', ...] (10대 ~ 60대 이상)
+            gender: 'm', 'f', '' (전체)
+        """
+        body = self._build_categories_body(categories, start_date, end_date,
+                                           timeunit, device, ages, gender)
+
+        if self.query_cache:
+            cached = self.query_cache.get(self.categories_url, body)
+            if cached is not None:
+                return cached
+
+        try:
+            return self._remember(body, self.client.post(self.categories_url, body))
+        except requests.exceptions.RequestException as e:
+            NaverDataLabCrawler._print_request_error(e)
+            return None
+
+    async def get_categories_async(self, engine: AsyncCrawlEngine, categories: List,
+                                   start_date: str, end_date: str, timeunit: str = 'month',
+                                   device: str = '', ages: List[str] = None,
+                                   gender: str = '') -> Dict:
+        """
+        여러 분야 비동기 조회 (인자는 get_categories와 동일)
+
+        Args:
+            engine: 비동기 크롤링 엔진
+        """
+        body = self._build_categories_body(categories, start_date, end_date,
+                                           timeunit, device, ages, gender)
+
+        if self.query_cache:
+            cached = self.query_cache.get(self.categories_url, body)
+            if cached is not None:
+                return cached
+
+        try:
+            data = await self.client.post_async(self.categories_url, body, engine.executor)
+            return self._remember(body, data)
+        except requests.exceptions.RequestException as e:
+            NaverDataLabCrawler._print_request_error(e)
+            return None
 
+    @staticmethod
+    def _build_categories_body(categories: List, start_date: str, end_date: str, timeunit: str,
+                               device: str, ages: List[str], gender: str) -> Dict:
+        """분야별 트렌드 API 요청 본문 생성"""
         body = {
             'startDate': start_date,  # YYYY-MM-DD 형식 그대로 사용
             'endDate': end_date,      # YYYY-MM-DD 형식 그대로 사용
             'timeUnit': timeunit,
-            'category': [{'name': category, 'param': [category]}]
+            'category': [category_group(category) for category in categories]
         }
 
         if device:
@@ -187,28 +320,42 @@ class NaverShoppingInsightCrawler:
         if gender:
             body['gender'] = gender
 
-        try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(body))
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"❌ API 요청 실패: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"   응답 코드: {e.response.status_code}")
-                print(f"   응답 내용: {e.response.text}")
-            return None
+        return body
+
+    def _remember(self, body: Dict, data: Dict) -> Dict:
+        """조회 결과를 캐시에 저장 후 그대로 반환 (결과가 비어 있으면 캐시하지 않음)"""
+        if self.query_cache:
+            self.query_cache.put(self.categories_url, body, data)
+        return data
 
 
 class KoreanTrendAnalyzer:
     """통합 한국 트렌드 분석기"""
 
-    def __init__(self, naver_client_id: str, naver_client_secret: str):
-        """초기화"""
-        self.naver_datalab = NaverDataLabCrawler(naver_client_id, naver_client_secret)
-        self.naver_shopping = NaverShoppingInsightCrawler(naver_client_id, naver_client_secret)
+    def __init__(self, naver_client_id: str, naver_client_secret: str,
+                 session: CrawlerSession = None, query_cache: NaverQueryCache = None,
+                 api_client: NaverApiClient = None, series_store: TimeSeriesStore = None,
+                 result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            query_cache: 요청 본문 단위 응답 캐시 (지난 달까지의 조회는 다시 요청하지 않음)
+            api_client: 두 크롤러가 공유할 API 클라이언트 (미지정 시 생성, 호출 한도를 함께 집계)
+            series_store: 지정 시 수집한 일별 검색 비율을 'search:키워드' 시계열로 저장
+            result_store: 결과 저장소 (지정 시 시계열과 월별 키워드 순위를 실행마다 누적 저장)
+        """
+        self.series_store = series_store
+        self.result_store = result_store
+        self.api_client = api_client or NaverApiClient(naver_client_id, naver_client_secret, session)
+        self.naver_datalab = NaverDataLabCrawler(naver_client_id, naver_client_secret, session,
+                                                 query_cache, self.api_client)
+        self.naver_shopping = NaverShoppingInsightCrawler(naver_client_id, naver_client_secret,
+                                                          session, query_cache, self.api_client)
 
     def analyze_monthly_trends(self, year: int, month: int,
-                               seed_keywords: List[str] = None) -> Dict:
+                               seed_keywords: List[str] = None, calibrate: bool = True,
+                               anchor: Seed = None) -> Dict:
         """
         월별 트렌드 분석
 
@@ -216,24 +363,398 @@ class KoreanTrendAnalyzer:
             year: 연도
             month: 월
             seed_keywords: 분석할 키워드 리스트
+            calibrate: True면 모든 요청에 기준 키워드를 넣어 묶음 간 검색 비율을 하나의 척도로 보정
+            anchor: 보정 기준 키워드 (미지정 시 첫 번째 시드)
         """
         if seed_keywords is None:
-            # 기본 시드 키워드 (다양한 카테고리)
-            seed_keywords = [
-                # 엔터테인먼트
-                '영화', '드라마', '예능', '음악', '게임',
-                # 스포츠
-                '축구', '야구', '배구', 'E스포츠',
-                # 이슈
-                '정치', '경제', '사회', '국제',
-                # 라이프스타일
-                '패션', '뷰티', '건강', '맛집', '여행',
-                # 테크
-                '스마트폰', 'AI', '전기차'
-            ]
+            seed_keywords = DEFAULT_SEED_KEYWORDS
+
+        start_date, end_date = self._month_range(year, month)
+
+        print(f"\n{'='*60}")
+        print(f"📅 {year}년 {month}월 네이버 트렌드 분석")
+        print(f"{'='*60}")
+        print(f"기간: {start_date} ~ {end_date}")
 
-        from datetime import datetime, timedelta
+        # 네이버 API는 월 단위 조회 시 최소 1개월 이상 기간 필요
+        # date 단위로 조회
+        series = self.collect_series(seed_keywords, start_date, end_date, 'date', calibrate, anchor)
 
+        all_results = [self._summarize_series({'title': keyword, 'data': data_points})
+                       for keyword, data_points in series.items()]
+
+        # 검색 비율 기준 정렬
+        all_results.sort(key=lambda x: x['avg_search_ratio'], reverse=True)
+
+        print(f"\n✅ 총 {len(all_results)}개 키워드 분석 완료")
+        return all_results
+
+    async def analyze_monthly_trends_async(self, year: int, month: int,
+                                           seed_keywords: List[str] = None,
+                                           engine: AsyncCrawlEngine = None,
+                                           calibrate: bool = True,
+                                           anchor: Seed = None) -> List[Dict]:
+        """
+        월별 트렌드 비동기 분석 (키워드 배치를 동시에 요청)
+
+        Args:
+            year: 연도
+            month: 월
+            seed_keywords: 분석할 키워드 리스트
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+            calibrate: True면 묶음 간 검색 비율을 기준 키워드로 보정
+            anchor: 보정 기준 키워드 (미지정 시 첫 번째 시드)
+        """
+        if seed_keywords is None:
+            seed_keywords = DEFAULT_SEED_KEYWORDS
+
+        start_date, end_date = self._month_range(year, month)
+        series = await self.collect_series_async(seed_keywords, start_date, end_date, 'date',
+                                                 engine, calibrate, anchor)
+
+        all_results = [self._summarize_series({'title': keyword, 'data': data_points})
+                       for keyword, data_points in series.items()]
+
+        # 검색 비율 기준 정렬
+        all_results.sort(key=lambda x: x['avg_search_ratio'], reverse=True)
+
+        print(f"✅ {year}년 {month}월: 총 {len(all_results)}개 키워드 분석 완료")
+        return all_results
+
+    def collect_series(self, seed_keywords: List[Seed], start_date: str, end_date: str,
+                       timeunit: str = 'date', calibrate: bool = True,
+                       anchor: Seed = None) -> Dict[str, List[Dict]]:
+        """
+        전체 기간의 키워드별 검색 비율을 최소 요청 수로 수집
+
+        키워드 그룹을 요청당 5개씩 묶고, 기간을 나누지 않고 한 번에 조회합니다.
+
+        Args:
+            seed_keywords: 시드 키워드 (동의어 그룹은 ('이름', [검색어, ...]))
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            timeunit: 'date', 'week', 'month'
+            calibrate: True면 요청이 여러 번일 때 모든 요청에 기준 키워드를 넣고
+                       검색 비율을 하나의 척도(전체 최댓값 100)로 보정 (요청당 시드 4개)
+            anchor: 보정 기준 키워드 (미지정 시 첫 번째 시드)
+
+        Returns:
+            {그룹 이름: [{'period': ..., 'ratio': ...}, ...]}
+        """
+        batches, anchor_group = self._plan(seed_keywords, calibrate, anchor)
+
+        batch_series = []
+        for i, batch in enumerate(batches, 1):
+            print(f"🔍 [{i}/{len(batches)}] {start_date} ~ {end_date}: "
+                  f"{', '.join(g['groupName'] for g in batch)}")
+            trend_data = self.naver_datalab.search_trend(batch, start_date, end_date, timeunit)
+            batch_series.append(self._batch_series(batch, trend_data))
+
+        return self._store(self._merge_batches(batch_series, anchor_group, seed_keywords),
+                           scale_groups=self._scale_groups(batch_series, anchor_group))
+
+    async def collect_series_async(self, seed_keywords: List[Seed], start_date: str,
+                                   end_date: str, timeunit: str = 'date',
+                                   engine: AsyncCrawlEngine = None, calibrate: bool = True,
+                                   anchor: Seed = None) -> Dict[str, List[Dict]]:
+        """
+        collect_series의 비동기 버전 (요청 묶음을 동시에 조회)
+
+        Args:
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.naver_datalab.session)
+
+        batches, anchor_group = self._plan(seed_keywords, calibrate, anchor)
+        responses = await asyncio.gather(*[
+            self.naver_datalab.search_trend_async(engine, batch, start_date, end_date, timeunit)
+            for batch in batches
+        ])
+
+        batch_series = [self._batch_series(batch, trend_data)
+                        for batch, trend_data in zip(batches, responses)]
+        return self._store(self._merge_batches(batch_series, anchor_group, seed_keywords),
+                           scale_groups=self._scale_groups(batch_series, anchor_group))
+
+    def _store(self, series: Dict[str, List[Dict]], prefix: str = 'search:',
+               scale_groups: List[List[str]] = None) -> Dict[str, List[Dict]]:
+        """
+        일별 데이터를 시계열 저장소/결과 저장소에 추가 후 그대로 반환
+
+        검색 비율은 요청마다 최댓값이 100이므로, 같은 척도로 조회한 묶음마다 이미 저장된 날짜와
+        겹치는 구간의 합계로 배율 하나를 구해 저장된 척도에 맞춥니다. 저장된 적 있는 시계열인데
+        겹치는 날짜가 없으면 척도를 맞출 수 없으므로 그 묶음은 저장하지 않습니다.
+
+        Args:
+            series: {이름: 데이터}
+            prefix: 저장 이름 앞에 붙일 구분자
+            scale_groups: 같은 척도를 공유하는 이름 묶음 (미지정 시 전체가 하나의 척도)
+        """
+        if not series or not (self.series_store or self.result_store):
+            return series
+
+        aligned = {}
+        skipped = []
+        for names in scale_groups or [list(series)]:
+            group = {name: series[name] for name in names if name in series}
+            stored = {name: self._stored_points(prefix + name, points)
+                      for name, points in group.items()}
+            if all(points is None for points in stored.values()):
+                # 처음 저장하는 묶음은 받은 척도 그대로
+                aligned.update(group)
+                continue
+
+            scale = overlap_scale(group, stored)
+            if scale is None:
+                skipped.extend(group)
+                continue
+            aligned.update(rescale(group, scale))
+
+        if skipped:
+            print(f"   ⚠️ 저장된 기간과 겹치지 않아 척도를 맞출 수 없어 저장하지 않은 시계열: "
+                  f"{', '.join(skipped)} (기간을 겹쳐 다시 조회하세요)")
+
+        if self.series_store and aligned:
+            self.series_store.append_series(aligned, prefix=prefix)
+        if self.result_store and aligned:
+            self.result_store.add_series(aligned, prefix=prefix)
+        return series
+
+    @staticmethod
+    def _scale_groups(batch_series: List[Dict[str, List[Dict]]], anchor_group: Optional[Dict],
+                      suffix: str = '') -> List[List[str]]:
+        """같은 척도의 시계열 이름 묶음 (기준 키워드로 보정했으면 전체가 하나, 아니면 요청마다)"""
+        if anchor_group is not None:
+            return [[name + suffix for batch in batch_series for name in batch]]
+        return [[name + suffix for name in batch] for batch in batch_series]
+
+    def _stored_points(self, name: str, points: List[Dict]) -> Optional[List[Dict]]:
+        """새 데이터 기간의 저장된 데이터 (저장된 적 없는 시계열이거나 새 데이터가 없으면 None)"""
+        if not points:
+            return None
+
+        periods = [point['period'] for point in points]
+        start, end = min(periods), max(periods)
+        if self.series_store:
+            return self.series_store.query(name, start, end) if name in self.series_store else None
+
+        stored = self.result_store.series(name)
+        return [point for point in stored if start <= point['period'] <= end] if stored else None
+
+    @staticmethod
+    def _plan(seed_keywords: List[Seed], calibrate: bool,
+              anchor: Seed) -> Tuple[List[List[Dict]], Optional[Dict]]:
+        """요청 묶음 계획 (보정 시 모든 묶음에 기준 키워드 포함)"""
+        if calibrate:
+            return plan_anchored_batches(seed_keywords, anchor)
+        return plan_batches(seed_keywords), None
+
+    @staticmethod
+    def _batch_series(batch: List[Dict], trend_data: Dict) -> Dict[str, List[Dict]]:
+        """API 응답 -> {그룹 이름: 데이터}"""
+        if trend_data and 'results' in trend_data:
+            return {result['title']: result['data'] for result in trend_data['results']}
+
+        print(f"   ⚠️ 데이터 수집 실패: {', '.join(g['groupName'] for g in batch)}")
+        return {}
+
+    @staticmethod
+    def _merge_batches(batch_series: List[Dict[str, List[Dict]]], anchor_group: Optional[Dict],
+                       seed_keywords: List[Seed]) -> Dict[str, List[Dict]]:
+        """묶음별 결과 합치기 (기준 키워드가 있으면 하나의 척도로 보정)"""
+        if anchor_group is None:
+            series = {}
+            for batch in batch_series:
+                series.update(batch)
+            return series
+
+        anchor_name = anchor_group['groupName']
+        is_seed = any(group['groupName'] == anchor_name for group in keyword_groups(seed_keywords))
+        return calibrate_batches(batch_series, anchor_name, keep_anchor=is_seed)
+
+    def collect_shopping_series(self, start_date: str, end_date: str, categories: List = None,
+                                splits: List[str] = None, timeunit: str = 'date',
+                                calibrate: bool = True) -> Dict[str, List[Dict]]:
+        """
+        쇼핑인사이트 분야별 클릭 비율 일괄 수집
+
+        분야를 요청당 3개씩 묶고, 구분(기기/성별/연령)마다 같은 묶음을 조회합니다.
+
+        Args:
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            categories: 분야 cid 리스트 (미지정 시 1분류 전체 12개)
+            splits: 'device', 'gender', 'age' 중 나누어 볼 구분 (미지정 시 전체만)
+            timeunit: 'date', 'week', 'month'
+            calibrate: True면 구분마다 모든 요청에 기준 분야(첫 번째 분야)를 넣어
+                       분야 간 클릭 비율을 하나의 척도(전체 최댓값 100)로 보정
+
+        Returns:
+            {'cid' 또는 'cid:구분=값': [{'period': ..., 'ratio': ...}, ...]}
+            (series_store가 있으면 'shopping:' 이름으로 저장)
+        """
+        categories = categories or list(SHOPPING_CATEGORIES)
+        batches, anchor_group = self._plan_categories(categories, calibrate)
+
+        series = {}
+        scale_groups = []
+        for segment in shopping_segments(splits):
+            batch_series = []
+            for i, batch in enumerate(batches, 1):
+                print(f"🛒 [{i}/{len(batches)}] {start_date} ~ {end_date}{segment_suffix(segment)}: "
+                      f"{self._category_names(batch)}")
+                data = self.naver_shopping.get_categories(batch, start_date, end_date, timeunit,
+                                                          **segment)
+                batch_series.append(self._category_series(batch, data))
+            series.update(self._merge_category_batches(batch_series, anchor_group, categories,
+                                                       segment))
+            scale_groups.extend(self._scale_groups(batch_series, anchor_group,
+                                                   segment_suffix(segment)))
+
+        self._print_shopping_top(series)
+        return self._store(series, prefix='shopping:', scale_groups=scale_groups)
+
+    async def collect_shopping_series_async(self, start_date: str, end_date: str,
+                                            categories: List = None, splits: List[str] = None,
+                                            timeunit: str = 'date', engine: AsyncCrawlEngine = None,
+                                            calibrate: bool = True) -> Dict[str, List[Dict]]:
+        """
+        collect_shopping_series의 비동기 버전 (모든 구분의 요청 묶음을 동시에 조회)
+
+        Args:
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.naver_shopping.session)
+
+        categories = categories or list(SHOPPING_CATEGORIES)
+        batches, anchor_group = self._plan_categories(categories, calibrate)
+        segments = shopping_segments(splits)
+
+        responses = await asyncio.gather(*[
+            self.naver_shopping.get_categories_async(engine, batch, start_date, end_date, timeunit,
+                                                     **segment)
+            for segment in segments for batch in batches
+        ])
+
+        series = {}
+        scale_groups = []
+        for i, segment in enumerate(segments):
+            segment_responses = responses[i * len(batches):(i + 1) * len(batches)]
+            batch_series = [self._category_series(batch, data)
+                            for batch, data in zip(batches, segment_responses)]
+            series.update(self._merge_category_batches(batch_series, anchor_group, categories,
+                                                       segment))
+            scale_groups.extend(self._scale_groups(batch_series, anchor_group,
+                                                   segment_suffix(segment)))
+
+        print(f"✅ 쇼핑인사이트: 분야 {len(categories)}개 x 구분 {len(segments)}개, "
+              f"요청 {len(responses)}회")
+        return self._store(series, prefix='shopping:', scale_groups=scale_groups)
+
+    @staticmethod
+    def _plan_categories(categories: List,
+                         calibrate: bool) -> Tuple[List[List[Dict]], Optional[Dict]]:
+        """쇼핑 분야 요청 묶음 계획 (보정 시 모든 묶음에 기준 분야 포함)"""
+        if calibrate:
+            return plan_anchored_categories(categories)
+        return plan_category_batches(categories), None
+
+    @staticmethod
+    def _category_names(batch: List[Dict]) -> str:
+        return ', '.join(SHOPPING_CATEGORIES.get(group['name'], group['name']) for group in batch)
+
+    @classmethod
+    def _category_series(cls, batch: List[Dict], data: Dict) -> Dict[str, List[Dict]]:
+        """쇼핑인사이트 응답 -> {분야 이름: 데이터}"""
+        if data and 'results' in data:
+            return {result['title']: result['data'] for result in data['results']}
+
+        print(f"   ⚠️ 데이터 수집 실패: {cls._category_names(batch)}")
+        return {}
+
+    @staticmethod
+    def _merge_category_batches(batch_series: List[Dict[str, List[Dict]]],
+                                anchor_group: Optional[Dict], categories: List,
+                                segment: Dict) -> Dict[str, List[Dict]]:
+        """구분 하나의 묶음별 결과 합치기 (이름 뒤에 구분 접미사)"""
+        if anchor_group is None:
+            merged = {}
+            for batch in batch_series:
+                merged.update(batch)
+        else:
+            anchor_name = anchor_group['name']
+            is_category = any(category_group(category)['name'] == anchor_name
+                              for category in categories)
+            merged = calibrate_batches(batch_series, anchor_name, keep_anchor=is_category)
+
+        suffix = segment_suffix(segment)
+        return {name + suffix: data_points for name, data_points in merged.items()}
+
+    @classmethod
+    def _print_shopping_top(cls, series: Dict[str, List[Dict]]):
+        """전체 구분의 분야별 평균 클릭 비율 출력"""
+        summaries = [cls._summarize_series({'title': name, 'data': data_points})
+                     for name, data_points in series.items() if ':' not in name]
+        summaries.sort(key=lambda x: x['avg_search_ratio'], reverse=True)
+
+        print("\n🛒 쇼핑인사이트 분야별 평균 클릭 비율:")
+        print("-" * 70)
+        for i, summary in enumerate(summaries, 1):
+            name = SHOPPING_CATEGORIES.get(summary['keyword'], summary['keyword'])
+            print(f"{i:2d}. {name:20s} | 평균: {summary['avg_search_ratio']:6.2f} | "
+                  f"최대: {summary['max_ratio']:6.2f}")
+
+    def analyze_period_by_month(self, start_date: str, end_date: str,
+                                seed_keywords: List[Seed] = None, calibrate: bool = True,
+                                anchor: Seed = None) -> Dict:
+        """
+        기간 전체를 한 번에 조회한 뒤 월별 트렌드로 나누어 분석
+
+        검색 비율은 요청 기간 전체의 최댓값(100) 기준이므로 월끼리 바로 비교할 수 있습니다.
+
+        Args:
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            seed_keywords: 분석할 키워드 리스트
+            calibrate: True면 묶음 간 검색 비율을 기준 키워드로 보정 (collect_series 참고)
+            anchor: 보정 기준 키워드 (미지정 시 첫 번째 시드)
+
+        Returns:
+            {'YYYY-MM': [키워드 요약, ...]} (월마다 평균 검색 비율 순)
+        """
+        series = self.collect_series(seed_keywords or DEFAULT_SEED_KEYWORDS, start_date, end_date,
+                                     calibrate=calibrate, anchor=anchor)
+        return self._summarize_by_month(series)
+
+    async def analyze_period_by_month_async(self, start_date: str, end_date: str,
+                                            seed_keywords: List[Seed] = None,
+                                            engine: AsyncCrawlEngine = None,
+                                            calibrate: bool = True, anchor: Seed = None) -> Dict:
+        """analyze_period_by_month의 비동기 버전"""
+        series = await self.collect_series_async(seed_keywords or DEFAULT_SEED_KEYWORDS,
+                                                 start_date, end_date, engine=engine,
+                                                 calibrate=calibrate, anchor=anchor)
+        return self._summarize_by_month(series)
+
+    @classmethod
+    def _summarize_by_month(cls, series: Dict[str, List[Dict]]) -> Dict:
+        """키워드별 전체 기간 데이터를 월별 요약으로 변환"""
+        results = {}
+        for keyword, data_points in series.items():
+            for month, points in split_by_month(data_points).items():
+                results.setdefault(month, []).append(
+                    cls._summarize_series({'title': keyword, 'data': points}))
+
+        for keywords in results.values():
+            keywords.sort(key=lambda x: x['avg_search_ratio'], reverse=True)
+
+        return dict(sorted(results.items()))
+
+    @staticmethod
+    def _month_range(year: int, month: int) -> Tuple[str, str]:
+        """해당 월의 시작일, 마지막 날 (YYYY-MM-DD)"""
         # 네이버 데이터랩은 최소 7일 이상의 기간이 필요함
         # 해당 월의 1일부터 다음 달 1일 전날까지로 설정
         start_date = f"{year}-{month:02d}-01"
@@ -251,68 +772,59 @@ class KoreanTrendAnalyzer:
         end_date_obj = next_month_first - timedelta(days=1)
         end_date = end_date_obj.strftime("%Y-%m-%d")
 
-        print(f"\n{'='*60}")
-        print(f"📅 {year}년 {month}월 네이버 트렌드 분석")
-        print(f"{'='*60}")
-        print(f"기간: {start_date} ~ {end_date}")
+        return start_date, end_date
 
-        all_results = []
+    @staticmethod
+    def _summarize_series(result: Dict) -> Dict:
+        """API 결과 한 건(키워드 그룹)을 요약 지표로 변환"""
+        keyword = result['title']
+        data_points = result['data']
 
-        # 5개씩 나눠서 API 호출
-        for i in range(0, len(seed_keywords), 5):
-            batch = seed_keywords[i:i+5]
-            print(f"\n🔍 키워드 분석 중 ({i+1}-{min(i+5, len(seed_keywords))}/{len(seed_keywords)}): {', '.join(batch)}")
+        # 평균 검색 비율 계산
+        total_ratio = sum([point['ratio'] for point in data_points])
+        avg_ratio = total_ratio / len(data_points) if data_points else 0
 
-            # 네이버 API는 월 단위 조회 시 최소 1개월 이상 기간 필요
-            # date 단위로 변경하여 조회
-            trend_data = self.naver_datalab.search_trend(
-                keywords=batch,
-                start_date=start_date,
-                end_date=end_date,
-                timeunit='date'  # month -> date로 변경
-            )
-
-            if trend_data and 'results' in trend_data:
-                for result in trend_data['results']:
-                    keyword = result['title']
-                    data_points = result['data']
-
-                    # 평균 검색 비율 계산
-                    total_ratio = sum([point['ratio'] for point in data_points])
-                    avg_ratio = total_ratio / len(data_points) if data_points else 0
+        return {
+            'keyword': keyword,
+            'avg_search_ratio': round(avg_ratio, 2),
+            'max_ratio': max([point['ratio'] for point in data_points]) if data_points else 0,
+            'total_engagement': int(total_ratio),
+            'data_points': len(data_points)
+        }
 
-                    all_results.append({
-                        'keyword': keyword,
-                        'avg_search_ratio': round(avg_ratio, 2),
-                        'max_ratio': max([point['ratio'] for point in data_points]) if data_points else 0,
-                        'total_engagement': int(total_ratio),
-                        'data_points': len(data_points)
-                    })
+    def analyze_year_by_month(self, year: int = 2025, analyze_full_year: bool = False,
+                             seed_keywords: List[str] = None,
+                             single_request: bool = False) -> Dict:
+        """
+        연도별 월별 분석
 
-                print(f"   ✅ {len(batch)}개 키워드 수집 완료")
-            else:
-                print(f"   ⚠️ 데이터 수집 실패")
+        Args:
+            year: 연도
+            analyze_full_year: True면 진행 중인 연도도 12월까지 분석
+            seed_keywords: 분석할 키워드 리스트
+            single_request: True면 키워드 묶음마다 연간 일별 데이터를 한 번에 조회한 뒤
+                            월별 평균/최대/합계를 로컬에서 계산 (월별 요청 없음,
+                            검색 비율은 월별이 아닌 연간 최댓값 기준)
+        """
+        current_month = self._last_month_to_analyze(year, analyze_full_year)
 
-            # Rate Limit 방지
-            time.sleep(0.5)
+        if single_request:
+            print(f"\n{'='*70}")
+            print(f"📊 {year}년 1~{current_month}월 분석 시작 (연간 일괄 조회)")
+            print(f"{'='*70}")
 
-        # 검색 비율 기준 정렬
-        all_results.sort(key=lambda x: x['avg_search_ratio'], reverse=True)
+            results = self.analyze_period_by_month(*month_span(year, 1, current_month),
+                                                   seed_keywords)
+            for month in range(1, current_month + 1):
+                keywords = results.get(f"{year}-{month:02d}")
+                if keywords:
+                    self._print_month_top(year, month, keywords)
+                else:
+                    print(f"⚠️ {year}년 {month}월: 트렌드를 수집하지 못했습니다.")
+            return results
 
-        print(f"\n✅ 총 {len(all_results)}개 키워드 분석 완료")
-        return all_results
-
-    def analyze_year_by_month(self, year: int = 2025, analyze_full_year: bool = False,
-                             seed_keywords: List[str] = None) -> Dict:
-        """연도별 월별 분석"""
         results = {}
 
-        # 분석할 월 결정
-        if analyze_full_year or datetime.now().year > year:
-            current_month = 12
-        else:
-            current_month = datetime.now().month if datetime.now().year == year else 12
-
         for month in range(1, current_month + 1):
             print(f"\n{'='*70}")
             print(f"📊 {year}년 {month}월 분석 시작")
@@ -322,30 +834,73 @@ class KoreanTrendAnalyzer:
 
             if keywords:
                 results[f"{year}-{month:02d}"] = keywords
-
-                # 결과 출력
-                print(f"\n🏆 {year}년 {month}월 Top 10 트렌드 키워드:")
-                print("-" * 70)
-                for i, kw in enumerate(keywords[:10], 1):
-                    print(f"{i:2d}. {kw['keyword']:20s} | "
-                          f"평균 검색비율: {kw['avg_search_ratio']:6.2f} | "
-                          f"최대: {kw['max_ratio']:6.2f}")
+                self._print_month_top(year, month, keywords)
             else:
                 print(f"⚠️ {year}년 {month}월: 트렌드를 수집하지 못했습니다.")
 
-            # 월별 대기
-            if month < current_month:
-                print(f"\n⏳ 다음 월 수집을 위해 잠시 대기 중...")
-                time.sleep(2)
+        return results
+
+    @staticmethod
+    def _print_month_top(year: int, month: int, keywords: List[Dict]):
+        """월별 Top 10 트렌드 키워드 출력"""
+        print(f"\n🏆 {year}년 {month}월 Top 10 트렌드 키워드:")
+        print("-" * 70)
+        for i, kw in enumerate(keywords[:10], 1):
+            print(f"{i:2d}. {kw['keyword']:20s} | "
+                  f"평균 검색비율: {kw['avg_search_ratio']:6.2f} | "
+                  f"최대: {kw['max_ratio']:6.2f}")
+
+    async def analyze_year_by_month_async(self, year: int = 2025, analyze_full_year: bool = False,
+                                          seed_keywords: List[str] = None,
+                                          engine: AsyncCrawlEngine = None,
+                                          single_request: bool = False) -> Dict:
+        """
+        연도별 월별 비동기 분석 (모든 월을 동시에 요청)
+
+        single_request=True면 키워드 묶음마다 연간 데이터를 한 번에 조회 (analyze_year_by_month 참고)
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.naver_datalab.session)
+
+        last_month = self._last_month_to_analyze(year, analyze_full_year)
+        if single_request:
+            results = await self.analyze_period_by_month_async(
+                *month_span(year, 1, last_month), seed_keywords, engine)
+            print(f"✅ {year}년 1~{last_month}월: {len(results)}개월 연간 일괄 분석 완료")
+            return results
+
+        months = range(1, last_month + 1)
+        monthly_keywords = await asyncio.gather(*[
+            self.analyze_monthly_trends_async(year, month, seed_keywords, engine)
+            for month in months
+        ])
+
+        results = {}
+        for month, keywords in zip(months, monthly_keywords):
+            if keywords:
+                results[f"{year}-{month:02d}"] = keywords
+            else:
+                print(f"⚠️ {year}년 {month}월: 트렌드를 수집하지 못했습니다.")
 
         return results
 
+    @staticmethod
+    def _last_month_to_analyze(year: int, analyze_full_year: bool) -> int:
+        """분석할 마지막 월 결정"""
+        if analyze_full_year or datetime.now().year > year:
+            return 12
+        return datetime.now().month if datetime.now().year == year else 12
+
     def save_results(self, results: Dict, filename: str = "naver_trends_2025.json"):
-        """결과 저장 (JSON)"""
+        """결과 저장 (JSON, 결과 저장소가 있으면 월별 키워드 순위도 누적)"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\n💾 결과가 {filename}에 저장되었습니다.")
 
+        if self.result_store:
+            rows = self.result_store.add_keyword_results('naver', results)
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
     def save_results_to_csv(self, results: Dict, filename: str = "naver_trends_2025.csv"):
         """결과 저장 (CSV)"""
         with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
@@ -368,6 +923,10 @@ class KoreanTrendAnalyzer:
 
 # 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='네이버 데이터랩 트렌드 분석')
+    add_db_argument(parser)
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("🚀 네이버 데이터랩 트렌드 분석")
     print("="*80)
@@ -388,9 +947,17 @@ if __name__ == "__main__":
         print("\n💡 API 발급은 1분이면 완료됩니다!")
         sys.exit(1)
 
+    # --db 지정 시 시계열과 월별 키워드 순위를 실행마다 DB에 누적
+    result_store = ResultStore(args.db) if args.db else None
+
     try:
         # 분석기 초기화
-        analyzer = KoreanTrendAnalyzer(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+        # 지난 달까지의 조회 결과는 캐시에서 재사용
+        # 일별 데이터는 시계열 저장소에 보관 (주/월 집계, 이동 평균은 재조회 없이 계산)
+        analyzer = KoreanTrendAnalyzer(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET,
+                                       query_cache=NaverQueryCache(),
+                                       series_store=TimeSeriesStore(),
+                                       result_store=result_store)
 
         # 분석할 키워드 설정 (원하는 키워드로 변경 가능)
         custom_keywords = [
@@ -409,10 +976,12 @@ if __name__ == "__main__":
         ]
 
         # 2025년 월별 분석 실행
+        # 키워드 묶음마다 연간 데이터를 한 번에 조회하여 월별로 나눔
         results = analyzer.analyze_year_by_month(
             year=2025,
             analyze_full_year=True,
-            seed_keywords=custom_keywords
+            seed_keywords=custom_keywords,
+            single_request=True
         )
 
         if results:
@@ -435,9 +1004,14 @@ if __name__ == "__main__":
         else:
             print("\n❌ 수집된 데이터가 없습니다.")
 
+        analyzer.api_client.report()
+
     except KeyboardInterrupt:
         print("\n\n⚠️ 사용자에 의해 중단되었습니다.")
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if result_store:
+            result_store.close()
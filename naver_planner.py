@@ -0,0 +1,164 @@
+"""
+네이버 데이터랩 요청 계획
+- 검색어 트렌드 API 한도에 맞춰 키워드 그룹을 묶음 (요청당 그룹 5개, 그룹당 검색어 20개)
+- 시드 키워드마다 동의어를 한 그룹으로 합산 (예: ('영화', ['영화', '영화추천', '개봉영화']))
+- 월마다 따로 요청하지 않고 전체 기간을 한 번에 조회한 뒤 월 단위로 잘라 사용
+  (시드 30개 x 12개월: 월별 요청 72회 -> 6회)
+- 쇼핑인사이트 분야는 요청당 3개씩 묶고, 기기/성별/연령 구분마다 같은 묶음을 조회
+"""
+
+from calendar import monthrange
+from typing import Dict, List, Tuple, Union
+
+# 검색어 트렌드 API 한도
+MAX_GROUPS_PER_REQUEST = 5
+MAX_KEYWORDS_PER_GROUP = 20
+
+# 쇼핑인사이트 분야별 트렌드 API 한도
+MAX_CATEGORIES_PER_REQUEST = 3
+
+# 쇼핑인사이트 1분류 (cid: 분야 이름)
+SHOPPING_CATEGORIES = {
+    '50000000': '패션의류',
+    '50000001': '패션잡화',
+    '50000002': '화장품/미용',
+    '50000003': '디지털/가전',
+    '50000004': '가구/인테리어',
+    '50000005': '출산/육아',
+    '50000006': '식품',
+    '50000007': '스포츠/레저',
+    '50000008': '생활/건강',
+    '50000009': '여가/생활편의',
+    '50000010': '면세점',
+    '50000011': '도서',
+}
+
+# 쇼핑인사이트 구분별 조회 조건 (구분 하나마다 전체 분야를 한 번 더 조회)
+SHOPPING_SPLITS = {
+    'device': [{'device': 'pc'}, {'device': 'mo'}],
+    'gender': [{'gender': 'm'}, {'gender': 'f'}],
+    'age': [{'ages': [age]} for age in ('10', '20', '30', '40', '50', '60')],
+}
+
+# 시드 키워드: '영화' / ('영화', ['영화', '영화추천']) / {'groupName': '영화', 'keywords': [...]}
+Seed = Union[str, Tuple[str, List[str]], Dict]
+
+
+def keyword_group(seed: Seed) -> Dict:
+    """
+    시드 키워드를 API의 keywordGroups 항목으로 변환
+
+    Args:
+        seed: 검색어 하나, (그룹 이름, 동의어 리스트), 또는 keywordGroups 형식 dict
+
+    Returns:
+        {'groupName': 이름, 'keywords': [검색어, ...]}
+    """
+    if isinstance(seed, str):
+        name, keywords = seed, [seed]
+    elif isinstance(seed, dict):
+        name, keywords = seed['groupName'], seed.get('keywords') or [seed['groupName']]
+    else:
+        name, keywords = seed
+
+    # 중복 검색어 제거 (순서 유지)
+    keywords = list(dict.fromkeys(keywords)) or [name]
+    if len(keywords) > MAX_KEYWORDS_PER_GROUP:
+        raise ValueError(f"키워드 그룹 '{name}'의 검색어가 {MAX_KEYWORDS_PER_GROUP}개를 넘습니다: "
+                         f"{len(keywords)}개")
+
+    return {'groupName': name, 'keywords': keywords}
+
+
+def keyword_groups(seeds: List[Seed]) -> List[Dict]:
+    """시드 키워드 -> keywordGroups 항목 리스트 (같은 이름의 그룹은 한 번만)"""
+    groups = {}
+    for seed in seeds:
+        group = keyword_group(seed)
+        groups.setdefault(group['groupName'], group)
+    return list(groups.values())
+
+
+def plan_batches(seeds: List[Seed]) -> List[List[Dict]]:
+    """
+    시드 키워드를 요청 단위(그룹 최대 5개)로 묶음
+
+    같은 이름의 그룹은 한 번만 조회합니다.
+
+    Args:
+        seeds: 시드 키워드 리스트
+
+    Returns:
+        요청별 keywordGroups 리스트
+    """
+    groups = keyword_groups(seeds)
+    return [groups[i:i + MAX_GROUPS_PER_REQUEST]
+            for i in range(0, len(groups), MAX_GROUPS_PER_REQUEST)]
+
+
+def split_by_month(data_points: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    일/주 단위 데이터를 월별로 나눔
+
+    Args:
+        data_points: [{'period': 'YYYY-MM-DD', 'ratio': 비율}, ...]
+
+    Returns:
+        {'YYYY-MM': [데이터, ...], ...} (기간 순서 유지)
+    """
+    months = {}
+    for point in data_points:
+        months.setdefault(point['period'][:7], []).append(point)
+    return months
+
+
+def month_span(year: int, first_month: int, last_month: int) -> Tuple[str, str]:
+    """first_month 1일부터 last_month 마지막 날까지의 기간 (YYYY-MM-DD)"""
+    last_day = monthrange(year, last_month)[1]
+    return f"{year}-{first_month:02d}-01", f"{year}-{last_month:02d}-{last_day:02d}"
+
+
+def category_group(category: Union[str, Dict]) -> Dict:
+    """
+    쇼핑 분야를 API의 category 항목으로 변환
+
+    Args:
+        category: 분야 cid 또는 {'name': 이름, 'param': [cid, ...]}
+
+    Returns:
+        {'name': 이름, 'param': [cid, ...]} (cid 하나면 이름도 cid)
+    """
+    if isinstance(category, dict):
+        return {'name': category['name'], 'param': list(category.get('param') or [category['name']])}
+    return {'name': category, 'param': [category]}
+
+
+def plan_category_batches(categories: List[Union[str, Dict]]) -> List[List[Dict]]:
+    """쇼핑 분야를 요청 단위(분야 최대 3개)로 묶음 (같은 이름은 한 번만)"""
+    groups = list({group['name']: group for group in map(category_group, categories)}.values())
+    return [groups[i:i + MAX_CATEGORIES_PER_REQUEST]
+            for i in range(0, len(groups), MAX_CATEGORIES_PER_REQUEST)]
+
+
+def shopping_segments(splits: List[str] = None) -> List[Dict]:
+    """
+    쇼핑인사이트 조회 조건 목록
+
+    Args:
+        splits: 'device', 'gender', 'age' 중 나누어 볼 구분 (미지정 시 전체만)
+
+    Returns:
+        [{}, {'device': 'pc'}, ...] (첫 항목은 항상 전체)
+    """
+    segments = [{}]
+    for split in splits or []:
+        if split not in SHOPPING_SPLITS:
+            raise ValueError(f"지원하지 않는 구분: {split} (가능: {', '.join(SHOPPING_SPLITS)})")
+        segments.extend(SHOPPING_SPLITS[split])
+    return segments
+
+
+def segment_suffix(segment: Dict) -> str:
+    """조회 조건 -> 시계열 이름 접미사 (전체: '', {'device': 'mo'}: ':device=mo')"""
+    return ''.join(f":{key}={','.join(value) if isinstance(value, list) else value}"
+                   for key, value in sorted(segment.items()))
@@ -0,0 +1,94 @@
+"""
+프로세스 풀 HTML 파싱 단계
+- 페치(I/O)와 파싱(CPU)을 분리
+- 원본 페이지 바이트를 큐에 넣고, 프로세스 풀이 게시물 리스트로 파싱
+- 파싱 처리량이 CPU 코어 수에 비례하여 증가
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+
+def _parse_content(parser: Callable[[str], List[Dict]], content: bytes,
+                   encoding: str) -> List[Dict]:
+    """워커 프로세스에서 실행: 바이트 디코딩 후 파싱"""
+    return parser(content.decode(encoding, errors='replace'))
+
+
+class ParsePipeline:
+    """큐 + 프로세스 풀 기반 파싱 단계"""
+
+    def __init__(self, max_workers: int = None, queue_size: int = 64):
+        """
+        초기화
+
+        Args:
+            max_workers: 파싱 프로세스 수 (기본값: CPU 코어 수)
+            queue_size: 파싱 대기 큐 크기 (가득 차면 페치 측이 대기)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+
+        # 스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 사용
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+
+        self._loop = None
+        self._queue = None
+        self._workers = []
+
+    def _ensure_workers(self):
+        """현재 이벤트 루프에 큐와 소비자 태스크 생성"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    async def _worker(self):
+        """큐에서 페이지를 꺼내 프로세스 풀에 파싱 요청"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            parser, content, encoding, future = await self._queue.get()
+            try:
+                posts = await loop.run_in_executor(
+                    self.executor, _parse_content, parser, content, encoding
+                )
+                if not future.done():
+                    future.set_result(posts)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def parse(self, parser: Callable[[str], List[Dict]], content: bytes,
+                    encoding: str = 'utf-8') -> List[Dict]:
+        """
+        페이지 파싱 요청
+
+        Args:
+            parser: 모듈 최상위 파싱 함수 (예: clien_crawling.parse_board_page)
+            content: 원본 페이지 바이트
+            encoding: 페이지 인코딩
+
+        Returns:
+            게시물 리스트
+        """
+        self._ensure_workers()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((parser, content, encoding, future))
+        return await future
+
+    def close(self):
+        """프로세스 풀 종료"""
+        self.executor.shutdown(wait=True)
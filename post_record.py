@@ -0,0 +1,105 @@
+"""
+게시물 레코드
+- 모든 크롤러가 만드는 공통 게시물 타입 (__slots__로 게시물당 dict 생성 없음)
+- 사이트별 지표를 공통 필드(comments, views, likes)로 정규화
+- 기존 dict 키(reply_count, hits, symphs 등)로도 읽을 수 있음
+"""
+
+from typing import Dict, Optional
+
+
+# 사이트별 기존 dict 키 -> 공통 필드 (to_dict()의 키 순서이기도 함)
+SITE_FIELDS = {
+    'dcinside': {'reply_count': 'comments', 'views': 'views', 'recommend': 'likes', 'date': 'date'},
+    'clien': {'comments': 'comments', 'hits': 'views', 'symphs': 'likes'},
+    'ppomppu': {'hits': 'views', 'recommends': 'likes'},
+    'instiz': {'comments': 'comments'},
+}
+
+
+class Post:
+    """
+    게시물 레코드
+
+    공통 필드:
+        site: 사이트 이름 ('dcinside', 'clien', 'ppomppu', 'instiz')
+        title: 제목
+        comments: 댓글 수
+        views: 조회수
+        likes: 추천 수 (디시 추천, 클리앙 공감, 뽐뿌 추천)
+        date: 작성일 (목록에 표시된 문자열)
+        engagement: 사이트별 가중치로 계산한 인기도 (키워드 집계에 사용)
+        post_id: 게시물 번호 (증분 수집의 기준, 목록에서 찾지 못하면 None)
+        author: 작성자 (목록에 표시된 닉네임, 없으면 빈 값)
+        url: 게시물 링크 (목록의 href 그대로, 없으면 빈 값)
+    """
+
+    __slots__ = ('site', 'title', 'comments', 'views', 'likes', 'date', 'engagement', 'post_id',
+                 'author', 'url')
+
+    def __init__(self, site: str, title: str, comments: int = 0, views: int = 0,
+                 likes: int = 0, date: str = '', engagement: int = 0,
+                 post_id: Optional[int] = None, author: str = '', url: str = ''):
+        self.site = site
+        self.title = title
+        self.comments = comments
+        self.views = views
+        self.likes = likes
+        self.date = date
+        self.engagement = engagement
+        self.post_id = post_id
+        self.author = author
+        self.url = url
+
+    def _field(self, key: str) -> str:
+        if key in Post.__slots__:
+            return key
+        field = SITE_FIELDS.get(self.site, {}).get(key)
+        if field is None:
+            raise KeyError(key)
+        return field
+
+    def __getitem__(self, key: str):
+        """기존 dict 방식 접근 (post['title'], post['hits'] 등)"""
+        return getattr(self, self._field(key))
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self._field(key)
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default=None):
+        """기존 dict 방식 접근 (없는 키는 default)"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict:
+        """사이트별 기존 dict 형식으로 변환 (JSON 저장용)"""
+        record = {'title': self.title}
+        for key, field in SITE_FIELDS.get(self.site, {}).items():
+            record[key] = getattr(self, field)
+        record['engagement'] = self.engagement
+        return record
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, field) for field in Post.__slots__)
+
+    def __reduce__(self):
+        # 파싱 프로세스에서 돌려받을 때 필드 값만 전달
+        return (Post, self._values())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Post):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        # __eq__와 같은 필드를 사용해야 set/dict 키로 쓸 수 있다
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return f"Post(site={self.site!r}, title={self.title!r}, engagement={self.engagement})"
@@ -4,35 +4,236 @@
 - 베스트 게시판 지원
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
+import argparse
+import asyncio
+from functools import partial
+from bs4 import SoupStrainer
 import re
-from collections import Counter
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import json
 import csv
 from datetime import datetime
 import sys
 import io
 
+from async_engine import AsyncCrawlEngine
+from crawl_state import CrawlState
+from html_parser import make_soup
+from http_session import CrawlerSession, get_shared_session
+from keyword_extraction import extract_keywords, make_counter
+from post_record import Post
+from result_store import ResultStore, add_db_argument
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
+# 부분 파싱 시 트리로 만들 영역: 테이블(<table>)
+LIST_STRAINER = SoupStrainer('table')
+
+
+# 이름으로 바로 찾을 수 있는 게시판 테이블 (종류, 값)
+NAMED_BOARD_TABLES = [
+    ('class', 'board_list'),
+    ('class', 'list_table'),
+    ('id', 'revolution_main_table'),
+]
+
+# 게시판별로 탐지한 게시판 테이블 위치 (게시판 ID -> (종류, 값))
+# 프로세스 단위로 유지되므로 파싱 프로세스도 첫 페이지 이후에는 탐지를 건너뜀
+_board_table_locators = {}
+
+
+def _find_table(soup, locator: Tuple[str, str]):
+    """(종류, 값) 위치로 테이블 찾기"""
+    kind, value = locator
+    if kind == 'id':
+        return soup.find('table', id=value)
+    return soup.find('table', class_=value)
+
+
+def _table_locator(soup, table) -> Optional[Tuple[str, str]]:
+    """
+    다음 페이지에서 같은 테이블을 찾기 위한 위치
+
+    id가 있으면 id, 없으면 페이지에서 이 테이블만 가진 클래스를 사용합니다.
+    (레이아웃용 공통 클래스는 다른 테이블과 겹치므로 제외, 고유한 값이 없으면 None)
+    """
+    if table.get('id'):
+        return ('id', table['id'])
+    for class_name in table.get('class') or []:
+        if soup.find_all('table', class_=class_name) == [table]:
+            return ('class', class_name)
+    return None
+
+
+def _has_posts(table) -> bool:
+    """게시물 제목 링크(a.baseList-title)가 있는 테이블인지"""
+    return table.find('a', class_='baseList-title') is not None
+
+
+def detect_board_table(soup):
+    """
+    게시판 테이블 탐지
+
+    이름으로 찾지 못하면 제목 링크(a.baseList-title)를 가장 많이 포함한 테이블을
+    선택합니다. 링크마다 조상 테이블을 한 번씩 거슬러 올라가며 개수만 세므로
+    테이블을 문자열로 직렬화하지 않습니다. 개수가 같으면 가장 안쪽 테이블
+    (바깥 레이아웃 테이블 제외)을, 제목 링크가 없으면 직접 포함한 행(tr)이
+    가장 많은 테이블을 선택합니다.
+
+    Returns:
+        게시판 테이블 (없으면 None)
+    """
+    for locator in NAMED_BOARD_TABLES:
+        table = _find_table(soup, locator)
+        if table:
+            return table
+
+    markers = soup.find_all('a', class_='baseList-title')
+    limit = None
+    if not markers:
+        markers = soup.find_all('tr')
+        limit = 1
+
+    # id(table) -> [개수, 가장 가까운 깊이, 테이블]
+    counts = {}
+    for marker in markers:
+        for depth, table in enumerate(marker.find_parents('table', limit=limit)):
+            entry = counts.setdefault(id(table), [0, depth, table])
+            entry[0] += 1
+            entry[1] = min(entry[1], depth)
+
+    if not counts:
+        return None
+
+    return max(counts.values(), key=lambda entry: (entry[0], -entry[1]))[2]
+
+
+def parse_hotdeal_page(html: str, backend: str = 'auto', targeted: bool = True,
+                       board: str = 'ppomppu') -> List[Post]:
+    """
+    핫딜 게시판 목록 페이지 파싱
+
+    Args:
+        html: 목록 페이지 HTML
+        backend: 파서 백엔드 ('auto', 'lxml', 'html.parser')
+        targeted: True면 게시물 목록 영역만 파싱 (헤더/사이드바/광고 제외)
+        board: 게시판 ID (게시판 테이블 위치 캐시 키)
+
+    Returns:
+        게시물 리스트
+    """
+    soup = make_soup(html, backend, LIST_STRAINER if targeted else None)
+    posts = []
+
+    # 게시판 테이블 찾기 (탐지한 위치는 게시판별로 캐시)
+    board_table = None
+    locator = _board_table_locators.get(board)
+    if locator:
+        board_table = _find_table(soup, locator)
+        if not board_table or not _has_posts(board_table):
+            # 캐시한 위치가 더 이상 게시물 테이블이 아니면 버리고 다시 탐지
+            _board_table_locators.pop(board, None)
+            board_table = None
+
+    if not board_table:
+        board_table = detect_board_table(soup)
+        locator = _table_locator(soup, board_table) if board_table else None
+        if locator and _has_posts(board_table):
+            _board_table_locators[board] = locator
+
+    if not board_table:
+        print(f"   ⚠️ 게시판 테이블을 찾지 못함")
+        return posts
+
+    # 게시물 행 찾기
+    post_list = board_table.find_all('tr')
+
+    # 유효한 게시물만 필터링 (공백 행 제외)
+    valid_posts = [tr for tr in post_list if tr.find('td', class_='list_vspace') is None]
+
+    if not valid_posts:
+        print(f"   ⚠️ 유효한 게시물을 찾지 못함")
+        return posts
+
+    for post in valid_posts:
+        try:
+            # 제목 찾기 - baseList-title 클래스를 가진 링크
+            title_elem = post.find('a', class_='baseList-title')
+
+            if not title_elem or not title_elem.text.strip():
+                continue
+
+            title = title_elem.text.strip()
+
+            # 공지/알림 제외
+            if any(word in title for word in ['공지', '알림', '광고', '이벤트', '안내']):
+                continue
+
+            # 조회수 - baseList-views 클래스
+            hits = 0
+            hit_elem = post.find('td', class_='baseList-views')
+            if hit_elem:
+                hit_text = hit_elem.text.strip()
+                hits = int(hit_text) if hit_text.isdigit() else 0
+
+            # 추천수 - baseList-rec 클래스 (형식: "4 - 0")
+            recommends = 0
+            rec_elem = post.find('td', class_='baseList-rec')
+            if rec_elem:
+                rec_text = rec_elem.text.strip()
+                # "4 - 0" 형식에서 첫 번째 숫자 추출
+                match = re.search(r'(\d+)', rec_text)
+                if match:
+                    recommends = int(match.group(1))
+
+            # 게시물 번호 (증분 수집 기준) - 제목 링크의 no 파라미터
+            id_match = re.search(r'[?&]no=(\d+)', title_elem.get('href', ''))
+            post_id = int(id_match.group(1)) if id_match else None
+
+            # 작성자 - baseList-name 클래스
+            name_elem = post.find('td', class_='baseList-name')
+            author = name_elem.text.strip() if name_elem else ''
+
+            posts.append(Post('ppomppu', title, views=hits, likes=recommends,
+                              engagement=hits + recommends * 10, post_id=post_id,
+                              author=author, url=title_elem.get('href', '')))
+
+        except Exception as e:
+            continue
+
+    return posts
+
+
 class PpomppuCrawler:
     """뽐뿌 크롤러"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, crawl_state: CrawlState = None,
+                 result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            session: 공유 HTTP 세션 (미지정 시 프로세스 공용 세션 사용)
+            parser_backend: HTML 파서 백엔드 ('auto': lxml 우선, 없으면 'html.parser')
+            targeted_parsing: True면 목록 페이지에서 게시물 목록 영역만 파싱
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 수집)
+            result_store: 결과 저장소 (지정 시 수집한 게시물을 게시판별로 저장)
+        """
+        self.session = session or get_shared_session()
+        self.parser_backend = parser_backend
+        self.parse_options = {'backend': parser_backend, 'targeted': targeted_parsing}
+        self.crawl_state = crawl_state
+        self.result_store = result_store
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         self.base_url = 'https://www.ppomppu.co.kr'
 
-    def get_board_posts(self, board_id: str, max_pages: int = 5) -> List[Dict]:
+    def get_board_posts(self, board_id: str, max_pages: int = 5) -> List[Post]:
         """
         게시판의 게시물 가져오기
 
@@ -54,11 +255,11 @@ class PpomppuCrawler:
 
             try:
                 print(f"   페이지 {page}/{max_pages} 요청 중...")
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.session.get(url, headers=self.headers, timeout=10)
                 response.raise_for_status()
                 response.encoding = 'euc-kr'  # 뽐뿌는 euc-kr 인코딩
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text, self.parser_backend)
 
                 # 게시물 목록 파싱
                 post_list = soup.select('tr[class*="list"]')
@@ -98,12 +299,9 @@ class PpomppuCrawler:
                             rec_text = recommend_elem.text.strip()
                             recommends = int(rec_text) if rec_text.isdigit() else 0
 
-                        posts.append({
-                            'title': title,
-                            'hits': hits,
-                            'recommends': recommends,
-                            'engagement': hits + recommends * 10
-                        })
+                        posts.append(Post('ppomppu', title, views=hits, likes=recommends,
+                                          engagement=hits + recommends * 10,
+                                          url=title_elem.get('href', '')))
 
                     except Exception as e:
                         continue
@@ -111,17 +309,14 @@ class PpomppuCrawler:
                 if len(posts) > 0:
                     print(f"   ✅ 현재까지 총 {len(posts)}개 게시물 수집")
 
-                # Rate limit 방지
-                time.sleep(random.uniform(1, 2))
-
             except Exception as e:
                 print(f"   ⚠️ 페이지 {page} 수집 실패: {e}")
                 continue
 
         print(f"\n📊 전체 수집 완료: 총 {len(posts)}개 게시물")
-        return posts
+        return self._record(f'ppomppu:{board_id.rsplit("=", 1)[-1]}', posts)
 
-    def get_hotdeal_posts(self, max_pages: int = 10) -> List[Dict]:
+    def get_hotdeal_posts(self, max_pages: int = 10) -> List[Post]:
         """
         핫딜 게시판 가져오기
 
@@ -131,181 +326,158 @@ class PpomppuCrawler:
         Returns:
             게시물 리스트
         """
-        posts = []
-
-        for page in range(1, max_pages + 1):
-            # 뽐뿌 핫딜 게시판
-            url = f'{self.base_url}/zboard/zboard.php?id=ppomppu&page={page}'
-
-            try:
-                print(f"   페이지 {page}/{max_pages} 요청 중: {url}")
-                response = requests.get(url, headers=self.headers, timeout=10)
-                print(f"   응답 코드: {response.status_code}")
-                response.raise_for_status()
-                response.encoding = 'euc-kr'
-
-                soup = BeautifulSoup(response.text, 'html.parser')
+        return list(self.iter_hotdeal_posts(max_pages))
 
-                # 게시판 테이블 찾기
-                tables = soup.find_all('table')
+    def iter_hotdeal_posts(self, max_pages: int = 10) -> Iterator[Post]:
+        """
+        핫딜 게시판 게시물을 페이지를 파싱하는 대로 하나씩 내보냄
 
-                board_table = soup.find('table', {'class': 'board_list'}) or \
-                             soup.find('table', {'class': 'list_table'}) or \
-                             soup.find('table', id='revolution_main_table')
+        Args:
+            max_pages: 크롤링할 페이지 수
 
-                if not board_table and tables:
-                    # 가장 큰 테이블 사용
-                    board_table = max(tables, key=lambda t: len(str(t)))
+        Yields:
+            게시물 (증분 모드에서는 지난 수집 이후의 새 게시물만)
+        """
+        total = 0
+        cursor = self.crawl_state.cursor('ppomppu:ppomppu') if self.crawl_state else None
 
-                if not board_table:
-                    print(f"   ⚠️ 게시판 테이블을 찾지 못함")
-                    continue
+        try:
+            for page in range(1, max_pages + 1):
+                # 뽐뿌 핫딜 게시판
+                url = f'{self.base_url}/zboard/zboard.php?id=ppomppu&page={page}'
 
-                # 게시물 행 찾기
-                post_list = board_table.find_all('tr')
+                try:
+                    print(f"   페이지 {page}/{max_pages} 요청 중: {url}")
+                    response = self.session.get(url, headers=self.headers, timeout=10)
+                    print(f"   응답 코드: {response.status_code}")
+                    response.raise_for_status()
+                    response.encoding = 'euc-kr'
 
-                # 유효한 게시물만 필터링 (공백 행 제외)
-                valid_posts = [tr for tr in post_list if tr.find('td', class_='list_vspace') is None]
+                    page_posts = parse_hotdeal_page(response.text, **self.parse_options)
 
-                if not valid_posts:
-                    print(f"   ⚠️ 유효한 게시물을 찾지 못함")
+                except Exception as e:
+                    print(f"   ⚠️ 페이지 {page} 수집 실패: {e}")
                     continue
 
-                post_list = valid_posts
-
-                successful_posts = 0
-                for post in post_list:
-                    try:
-                        # 제목 찾기 - baseList-title 클래스를 가진 링크
-                        title_elem = post.find('a', class_='baseList-title')
+                if cursor:
+                    page_posts = cursor.filter(page_posts, deliver=False)
+                self._record('ppomppu:ppomppu', page_posts)
 
-                        if not title_elem or not title_elem.text.strip():
-                            continue
+                total += len(page_posts)
+                if total > 0:
+                    print(f"   ✅ 현재까지 총 {total}개 게시물 수집")
 
-                        title = title_elem.text.strip()
+                for post in page_posts:
+                    if cursor:
+                        cursor.deliver(post)
+                    yield post
 
-                        # 공지/알림 제외
-                        if any(word in title for word in ['공지', '알림', '광고', '이벤트', '안내']):
-                            continue
+                if cursor and cursor.done:
+                    print(f"   ⏹️ 이미 수집한 게시물에 도달 (페이지 {page})")
+                    break
+        finally:
+            # 넘긴 게시물까지만 기록 (호출한 쪽이 중간에 멈춰도 상태 저장)
+            if cursor:
+                cursor.commit()
 
-                        # 조회수 - baseList-views 클래스
-                        hits = 0
-                        hit_elem = post.find('td', class_='baseList-views')
-                        if hit_elem:
-                            hit_text = hit_elem.text.strip()
-                            hits = int(hit_text) if hit_text.isdigit() else 0
+        print(f"\n📊 전체 수집 완료: 총 {total}개 게시물")
 
-                        # 추천수 - baseList-rec 클래스 (형식: "4 - 0")
-                        recommends = 0
-                        rec_elem = post.find('td', class_='baseList-rec')
-                        if rec_elem:
-                            rec_text = rec_elem.text.strip()
-                            # "4 - 0" 형식에서 첫 번째 숫자 추출
-                            import re
-                            match = re.search(r'(\d+)', rec_text)
-                            if match:
-                                recommends = int(match.group(1))
-
-                        posts.append({
-                            'title': title,
-                            'hits': hits,
-                            'recommends': recommends,
-                            'engagement': hits + recommends * 10
-                        })
-
-                        successful_posts += 1
-
-                    except Exception as e:
-                        continue
+    async def get_hotdeal_posts_async(self, engine: AsyncCrawlEngine,
+                                      max_pages: int = 10) -> List[Post]:
+        """
+        핫딜 게시판 비동기 수집 (요청 간격은 엔진이 호스트별로 관리)
 
-                if len(posts) > 0:
-                    print(f"   ✅ 현재까지 총 {len(posts)}개 게시물 수집")
+        Args:
+            engine: 비동기 크롤링 엔진
+            max_pages: 크롤링할 페이지 수
 
-                # Rate limit 방지
-                time.sleep(random.uniform(1, 2))
+        Returns:
+            게시물 리스트
+        """
+        async def fetch_page(page: int) -> List[Post]:
+            # 페이지마다 페치 후 바로 파싱 단계로 넘겨 다른 페이지의 요청과 겹치도록 함
+            try:
+                response = await engine.fetch(
+                    f'{self.base_url}/zboard/zboard.php?id=ppomppu&page={page}',
+                    headers=self.headers, timeout=10
+                )
+                response.raise_for_status()
+                return await engine.parse(partial(parse_hotdeal_page, **self.parse_options),
+                                          response, 'euc-kr')
 
             except Exception as e:
                 print(f"   ⚠️ 페이지 {page} 수집 실패: {e}")
-                continue
+                return []
 
-        print(f"\n📊 전체 수집 완료: 총 {len(posts)}개 게시물")
+        posts = []
+        if self.crawl_state:
+            # 증분 모드: 이미 본 게시물에 도달할 때까지 한 페이지씩 순서대로 요청
+            cursor = self.crawl_state.cursor('ppomppu:ppomppu')
+            for page in range(1, max_pages + 1):
+                posts.extend(cursor.filter(await fetch_page(page)))
+                if cursor.done:
+                    break
+            cursor.commit()
+        else:
+            pages = await asyncio.gather(*[fetch_page(page) for page in range(1, max_pages + 1)])
+            for page_posts in pages:
+                posts.extend(page_posts)
+
+        print(f"   ✅ [핫딜] 총 {len(posts)}개 게시물 수집")
+        return self._record('ppomppu:ppomppu', posts)
+
+    def _record(self, board_key: str, posts: List[Post]) -> List[Post]:
+        """결과 저장소가 있으면 게시물 저장 후 그대로 반환"""
+        if self.result_store:
+            self.result_store.add_posts(board_key, posts)
         return posts
 
-    def extract_keywords_from_posts(self, posts: List[Dict],
-                                   min_length: int = 2) -> List[Dict]:
+    def extract_keywords_from_posts(self, posts: Iterable[Dict], min_length: int = 2,
+                                   top_k: Optional[int] = 100, rank_by: str = 'count',
+                                   capacity: Optional[int] = None) -> List[Dict]:
         """
-        게시물에서 키워드 추출
+        게시물에서 키워드 추출 (공용 추출 엔진의 'ppomppu' 프로필 사용)
 
         Args:
-            posts: 게시물 리스트
+            posts: 게시물 리스트 (capacity 지정 시 제너레이터도 가능)
             min_length: 최소 키워드 길이
+            top_k: 반환할 키워드 수 (None이면 전체)
+            rank_by: 순위 기준 ('count', 'total_engagement', 'avg_engagement')
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
 
         Returns:
             키워드와 빈도수
         """
-        keyword_counter = Counter()
-        keyword_engagement = {}
-
-        # 불용어
-        stopwords = {
-            '뽐뿌', '게시판', '게시글', '공지', '질문', '답변',
-            '입니다', '합니다', '있습니다', '없습니다', '가능', '불가능',
-            '이거', '저거', '그거', '이게', '저게', '그게',
-            '오늘', '어제', '내일', '요즘', '지금', '이제', '그냥',
-            '진짜', '정말', '완전', '너무', '엄청', '개', '매우',
-            '있다', '없다', '하다', '되다', '이다', '아니다',
-            '같다', '듯하다', '보이다', '싶다', '하고', '그리고',
-            '또는', '그런데', '하지만', '그러나', '그래서', '때문에',
-            '안녕하세요', '감사합니다', '수고하세요', '부탁드립니다',
-            '핫딜', '특가', '할인', '최저가', '무료배송', '쿠폰'
-        }
-
-        for post in posts:
-            title = post['title']
-            engagement = post.get('engagement', 1)
-
-            # 한글 키워드 추출 (2글자 이상)
-            korean_words = re.findall(r'[가-힣]{2,}', title)
-
-            # 영어 키워드 추출 (2글자 이상)
-            english_words = re.findall(r'\b[A-Za-z]{2,}\b', title)
-
-            # 숫자+텍스트 조합 (가격, 날짜 등)
-            mixed_words = re.findall(r'\d+[가-힣]+', title)
-
-            all_words = korean_words + english_words + mixed_words
-
-            for word in all_words:
-                # 불용어 제거
-                if word.lower() in stopwords or len(word) < min_length:
-                    continue
-
-                keyword_counter[word] += 1
-
-                # 인기도 누적
-                if word not in keyword_engagement:
-                    keyword_engagement[word] = 0
-                keyword_engagement[word] += engagement
+        return extract_keywords(posts, 'ppomppu', min_length, top_k, rank_by, capacity)
 
-        # 결과 정리
-        keywords = []
-        for word, count in keyword_counter.most_common(100):
-            keywords.append({
-                'keyword': word,
-                'count': count,
-                'total_engagement': keyword_engagement.get(word, 0),
-                'avg_engagement': keyword_engagement.get(word, 0) / count if count > 0 else 0
-            })
+    def keyword_counter(self, capacity: Optional[int] = None):
+        """
+        게시물을 하나씩 집계하는 키워드 카운터 ('ppomppu' 프로필)
 
-        return keywords
+        Args:
+            capacity: 지정하면 최대 capacity개 키워드만 추적하는 고정 메모리 근사 집계
+        """
+        return make_counter('ppomppu', capacity=capacity)
 
 
 class PpomppuTrendAnalyzer:
     """뽐뿌 트렌드 분석기"""
 
-    def __init__(self):
-        """초기화"""
-        self.crawler = PpomppuCrawler()
+    def __init__(self, session: CrawlerSession = None, parser_backend: str = 'auto',
+                 targeted_parsing: bool = True, keyword_capacity: Optional[int] = None,
+                 crawl_state: CrawlState = None, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            keyword_capacity: 지정하면 키워드를 고정 메모리 근사 집계
+            crawl_state: 증분 수집 상태 (지정 시 지난 수집 이후의 새 게시물만 분석)
+            result_store: 결과 저장소 (지정 시 게시물과 키워드 순위를 실행마다 누적 저장)
+        """
+        self.crawler = PpomppuCrawler(session, parser_backend, targeted_parsing, crawl_state=crawl_state,
+                                      result_store=result_store)
+        self.keyword_capacity = keyword_capacity
+        self.result_store = result_store
 
     def analyze_hotdeal(self, max_pages: int = 10) -> Dict:
         """
@@ -321,33 +493,64 @@ class PpomppuTrendAnalyzer:
         print(f"🔥 뽐뿌 핫딜 게시판 분석")
         print(f"{'='*60}")
 
-        posts = self.crawler.get_hotdeal_posts(max_pages)
+        # 페이지를 파싱하는 대로 바로 집계하여 게시물 리스트를 만들지 않음
+        counter = self.crawler.keyword_counter(self.keyword_capacity)
+        counter.add_posts(self.crawler.iter_hotdeal_posts(max_pages))
+
+        return self._summarize_hotdeal(counter)
+
+    async def analyze_hotdeal_async(self, max_pages: int = 10,
+                                    engine: AsyncCrawlEngine = None) -> Dict:
+        """
+        핫딜 게시판 비동기 분석
+
+        Args:
+            max_pages: 크롤링할 페이지 수
+            engine: 비동기 크롤링 엔진 (미지정 시 크롤러 세션으로 생성)
+
+        Returns:
+            분석 결과
+        """
+        if engine is None:
+            engine = AsyncCrawlEngine(self.crawler.session)
+
+        posts = await self.crawler.get_hotdeal_posts_async(engine, max_pages)
 
-        if not posts:
+        counter = self.crawler.keyword_counter(self.keyword_capacity)
+        counter.add_posts(posts)
+        return self._summarize_hotdeal(counter)
+
+    def _summarize_hotdeal(self, counter) -> Dict:
+        """집계한 핫딜 키워드에서 결과 생성"""
+        if not counter.post_count:
             print(f"⚠️ 데이터를 수집하지 못했습니다.")
             return {}
 
-        print(f"📊 총 {len(posts)}개 게시물 수집 완료")
+        print(f"📊 총 {counter.post_count}개 게시물 수집 완료")
 
         # 키워드 추출
         print(f"🔍 키워드 추출 중...")
-        keywords = self.crawler.extract_keywords_from_posts(posts)
+        keywords = counter.top()
 
         print(f"✅ {len(keywords)}개 키워드 추출 완료")
 
         return {
             'source': '뽐뿌 핫딜',
-            'total_posts': len(posts),
+            'total_posts': counter.post_count,
             'keywords': keywords,
             'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
     def save_results(self, results: Dict, filename: str = 'ppomppu_trends.json'):
-        """결과 저장 (JSON)"""
+        """결과 저장 (JSON, 결과 저장소가 있으면 키워드 순위도 누적)"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"\n💾 결과가 {filename}에 저장되었습니다.")
 
+        if self.result_store:
+            rows = self.result_store.add_keyword_results('ppomppu', results)
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
     def save_results_to_csv(self, results: Dict, filename: str = 'ppomppu_trends.csv'):
         """결과 저장 (CSV)"""
         with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
@@ -371,14 +574,18 @@ class PpomppuTrendAnalyzer:
 
 # 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='뽐뿌 트렌드 크롤링')
+    add_db_argument(parser)
+    args = parser.parse_args()
+
     print("\n" + "="*80)
     print("🚀 뽐뿌 트렌드 크롤링")
     print("="*80)
     print("\n🛒 뽐뿌에서 쇼핑/핫딜 트렌드 키워드를 수집합니다.")
     print("⚠️  크롤링 속도 제한을 준수하며, 공개 게시판만 수집합니다.\n")
 
-    # 분석기 초기화
-    analyzer = PpomppuTrendAnalyzer()
+    # 분석기 초기화 (--db 지정 시 게시물과 키워드 순위를 실행마다 DB에 누적)
+    analyzer = PpomppuTrendAnalyzer(result_store=ResultStore(args.db) if args.db else None)
 
     try:
         # 핫딜 게시판 분석
@@ -416,3 +623,6 @@ if __name__ == "__main__":
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if analyzer.result_store:
+            analyzer.result_store.close()
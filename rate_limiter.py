@@ -0,0 +1,113 @@
+"""
+호스트별 토큰 버킷 요청 제한
+- 고정 sleep 대신 요청 예산이 소진된 경우에만 대기
+- 호스트별 요청 속도(rate)와 버스트(burst) 설정
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+
+
+# 기본 요청 속도: 1.5초당 1회 (README의 요청 간 1~2초 대기 기준)
+DEFAULT_RATE = 1 / 1.5
+DEFAULT_BURST = 1
+
+# 호스트별 (초당 요청 수, 버스트)
+DEFAULT_HOST_LIMITS = {
+    'openapi.naver.com': (2.0, 2),
+}
+
+
+class TokenBucket:
+    """토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        초기화
+
+        Args:
+            rate: 초당 충전되는 토큰 수 (= 평균 초당 요청 수)
+            burst: 버킷 크기 (연속으로 보낼 수 있는 최대 요청 수)
+        """
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 1개 예약
+
+        Returns:
+            예약한 토큰을 사용할 수 있을 때까지 대기할 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            # 음수 잔량 = 앞서 예약한 요청들의 대기열
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 대기 (비동기)"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음"""
+
+    def __init__(self, default_rate: float = DEFAULT_RATE, default_burst: int = DEFAULT_BURST,
+                 host_limits: Dict[str, Tuple[float, int]] = None):
+        """
+        초기화
+
+        Args:
+            default_rate: 별도 설정이 없는 호스트의 초당 요청 수
+            default_burst: 별도 설정이 없는 호스트의 버스트
+            host_limits: {'호스트': (초당 요청 수, 버스트), ...} (기본값: DEFAULT_HOST_LIMITS)
+        """
+        if host_limits is None:
+            host_limits = DEFAULT_HOST_LIMITS
+
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(host_limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, rate: float, burst: int = 1):
+        """호스트별 요청 속도 설정"""
+        with self._lock:
+            self.host_limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def bucket(self, host: str) -> TokenBucket:
+        """호스트의 토큰 버킷 반환 (없으면 생성)"""
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                self._buckets[host] = TokenBucket(rate, burst)
+            return self._buckets[host]
+
+    def acquire(self, host: str):
+        """호스트에 요청을 보낼 수 있을 때까지 대기"""
+        self.bucket(host).acquire()
+
+    async def acquire_async(self, host: str):
+        """호스트에 요청을 보낼 수 있을 때까지 대기 (비동기)"""
+        await self.bucket(host).acquire_async()
@@ -0,0 +1,284 @@
+"""
+SQLite 결과 저장소
+- 실행마다 덮어쓰는 JSON/CSV 대신 게시물, 키워드 스냅샷, 네이버 시계열을 하나의 DB에 누적
+- WAL 모드 (분석 중에도 다른 프로세스에서 조회 가능)
+- 게시물은 버퍼에 모아 batch_size개씩 한 트랜잭션으로 삽입, 같은 게시물은 지표만 갱신
+  (번호가 없는 게시물은 제목/작성일/작성자/링크 해시로 같은 게시물을 판별)
+- (키워드, 사이트, 수집 시각) 인덱스로 "최근 30일 사이트 Y의 키워드 X" 같은 조회가 인덱스 탐색
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from post_record import Post
+
+
+# 기본 DB 파일
+RESULT_DB_FILE = 'trend_results.db'
+
+# 게시물 버퍼를 비우는 기준 (행 수)
+DEFAULT_BATCH_SIZE = 500
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    site TEXT NOT NULL,
+    board TEXT NOT NULL,
+    post_id INTEGER,
+    post_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    comments INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    engagement INTEGER NOT NULL DEFAULT 0,
+    posted TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    UNIQUE (site, board, post_key)
+);
+CREATE INDEX IF NOT EXISTS posts_board_seen ON posts (site, board, last_seen);
+
+CREATE TABLE IF NOT EXISTS keyword_snapshots (
+    site TEXT NOT NULL,
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    total_engagement REAL NOT NULL,
+    avg_engagement REAL NOT NULL,
+    crawled_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_keyword ON keyword_snapshots (keyword, site, crawled_at);
+CREATE INDEX IF NOT EXISTS snapshots_site ON keyword_snapshots (site, crawled_at);
+
+CREATE TABLE IF NOT EXISTS naver_series (
+    name TEXT NOT NULL,
+    period TEXT NOT NULL,
+    ratio REAL NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (name, period)
+) WITHOUT ROWID;
+"""
+
+UPSERT_POST = """
+INSERT INTO posts (site, board, post_id, post_key, title, comments, views, likes, engagement, posted,
+                   first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (site, board, post_key) DO UPDATE SET
+    title = excluded.title, comments = excluded.comments, views = excluded.views,
+    likes = excluded.likes, engagement = excluded.engagement, last_seen = excluded.last_seen
+"""
+
+UPSERT_SERIES = """
+INSERT INTO naver_series (name, period, ratio, updated_at) VALUES (?, ?, ?, ?)
+ON CONFLICT (name, period) DO UPDATE SET ratio = excluded.ratio, updated_at = excluded.updated_at
+"""
+
+
+def _now() -> str:
+    return datetime.now().strftime(TIME_FORMAT)
+
+
+def add_db_argument(parser: argparse.ArgumentParser):
+    """명령행에 --db [DB_FILE] 옵션 추가 (지정한 경우에만 결과 저장소 사용)"""
+    parser.add_argument('--db', nargs='?', const=RESULT_DB_FILE, default=None, metavar='DB_FILE',
+                        help=f'게시물/키워드 순위/네이버 시계열을 SQLite DB에 누적 (파일 기본값: {RESULT_DB_FILE})')
+
+
+def post_key(post: Post) -> str:
+    """
+    게시판 안에서 게시물을 구분하는 키
+
+    게시물 번호가 있으면 번호, 없으면 제목/작성일/작성자/링크의 해시
+    (번호를 읽지 못하는 목록도 다시 수집할 때 같은 행을 갱신하고, 제목이 같은 다른 게시물은 구분)
+    """
+    if post.post_id is not None:
+        return str(post.post_id)
+    raw = '\x1f'.join((post.title, post.date or '', post.author, post.url))
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return 'h:' + digest[:16]
+
+
+class ResultStore:
+    """게시물/키워드 스냅샷/네이버 시계열 SQLite 저장소"""
+
+    def __init__(self, path: str = RESULT_DB_FILE, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        초기화
+
+        Args:
+            path: DB 파일 경로
+            batch_size: 게시물을 한 번에 삽입할 행 수
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending_posts = []
+
+        # 동기 크롤링은 엔진의 스레드 풀에서도 실행되므로 연결을 스레드 간에 공유 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def add_posts(self, board: str, posts: Iterable[Post]):
+        """
+        게시물 추가 (batch_size개가 모이면 삽입)
+
+        같은 게시판/번호의 게시물은 지표와 마지막으로 본 시각만 갱신합니다.
+        (번호를 알 수 없는 게시물은 제목/작성일/작성자/링크가 모두 같으면 같은 게시물로 봄)
+
+        Args:
+            board: 게시판 구분 (예: 'clien:park', 증분 수집 상태와 같은 이름)
+            posts: 게시물 리스트
+        """
+        seen = _now()
+        rows = [(post.site, board, post.post_id, post_key(post), post.title, post.comments,
+                 post.views, post.likes, post.engagement, post.date or None, seen, seen)
+                for post in posts]
+
+        with self._lock:
+            self._pending_posts.extend(rows)
+            if len(self._pending_posts) >= self.batch_size:
+                self._flush_posts()
+
+    def _flush_posts(self):
+        if not self._pending_posts:
+            return
+        with self._conn:
+            self._conn.executemany(UPSERT_POST, self._pending_posts)
+        self._pending_posts = []
+
+    def flush(self):
+        """버퍼에 남은 게시물 삽입"""
+        with self._lock:
+            self._flush_posts()
+
+    def add_keyword_results(self, site: str, results: Dict, crawled_at: str = None) -> int:
+        """
+        사이트 분석 결과의 키워드 순위를 스냅샷으로 저장
+
+        Args:
+            site: 사이트 이름 ('naver', 'dcinside', 'clien', 'ppomppu', 'instiz')
+            results: 분석 결과 (save_results에 넘기는 형식)
+                - 네이버: {'YYYY-MM': [키워드 요약, ...]}
+                - 그 외: {게시판 키: {'keywords': [...], 'crawled_at': ..., ...}}
+            crawled_at: 수집 시각 (미지정 시 결과의 crawled_at 또는 현재 시각)
+
+        Returns:
+            저장한 행 수
+        """
+        rows = []
+        for key, result in results.items():
+            if site == 'naver':
+                # 네이버: 키 = 연월, 출현횟수 = 데이터 수, 인기도 = 검색비율
+                keywords = [(kw['keyword'], kw['data_points'], kw['total_engagement'],
+                             kw['avg_search_ratio']) for kw in result]
+                snapshot_at = crawled_at or _now()
+            else:
+                source = result.get('board_name', result.get('gallery_name',
+                                                             result.get('source', key)))
+                keywords = [(kw['keyword'], kw['count'], kw.get('total_engagement', 0),
+                             round(kw.get('avg_engagement', 0), 2)) for kw in result['keywords']]
+                snapshot_at = crawled_at or result.get('crawled_at') or _now()
+                key = source
+
+            rows.extend((site, key, keyword, rank, count, total, avg, snapshot_at)
+                        for rank, (keyword, count, total, avg) in enumerate(keywords, 1))
+
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT INTO keyword_snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                   rows)
+        return len(rows)
+
+    def add_series(self, series: Dict[str, List[Dict]], prefix: str = '') -> int:
+        """
+        네이버 시계열 저장 (같은 이름/기간은 새 값으로 교체)
+
+        Args:
+            series: {이름: [{'period': ..., 'ratio': ...}, ...]}
+            prefix: 이름 앞에 붙일 구분자 (예: 'search:', 'shopping:')
+
+        Returns:
+            저장한 행 수
+        """
+        updated_at = _now()
+        rows = [(prefix + name, point['period'], point['ratio'], updated_at)
+                for name, data_points in series.items() for point in data_points]
+
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT_SERIES, rows)
+        return len(rows)
+
+    def keyword_history(self, keyword: str, site: str = None, days: Optional[int] = 30) -> List[Dict]:
+        """
+        키워드의 스냅샷 기록
+
+        Args:
+            keyword: 키워드
+            site: 사이트 이름 (미지정 시 전체)
+            days: 최근 며칠 (None이면 전체 기간)
+
+        Returns:
+            [{'crawled_at', 'site', 'source', 'rank', 'count', 'total_engagement', 'avg_engagement'}, ...]
+            (수집 시각 순)
+        """
+        query = ('SELECT crawled_at, site, source, rank, count, total_engagement, avg_engagement '
+                 'FROM keyword_snapshots WHERE keyword = ?')
+        params = [keyword]
+        if site:
+            query += ' AND site = ?'
+            params.append(site)
+        if days is not None:
+            query += ' AND crawled_at >= ?'
+            params.append((datetime.now() - timedelta(days=days)).strftime(TIME_FORMAT))
+        query += ' ORDER BY crawled_at'
+
+        return self._select(query, params)
+
+    def recent_posts(self, board: str, days: Optional[int] = 30) -> List[Dict]:
+        """
+        게시판의 최근 게시물 (마지막으로 본 시각 순)
+
+        Args:
+            board: 게시판 구분 (예: 'clien:park')
+            days: 최근 며칠 (None이면 전체 기간)
+        """
+        site = board.split(':', 1)[0]
+        since = (datetime.now() - timedelta(days=days)).strftime(TIME_FORMAT) if days else ''
+        return self._select('SELECT * FROM posts WHERE site = ? AND board = ? AND last_seen >= ? '
+                            'ORDER BY last_seen DESC', [site, board, since])
+
+    def series(self, name: str, start: str = None, end: str = None) -> List[Dict]:
+        """
+        네이버 시계열 기간 조회
+
+        Args:
+            name: 시계열 이름 (예: 'search:영화')
+            start: 시작일 (YYYY-MM-DD)
+            end: 종료일 (YYYY-MM-DD)
+
+        Returns:
+            [{'period': ..., 'ratio': ...}, ...]
+        """
+        return self._select('SELECT period, ratio FROM naver_series '
+                            'WHERE name = ? AND period >= ? AND period <= ? ORDER BY period',
+                            [name, start or '', end or '9999'])
+
+    def _select(self, query: str, params: List) -> List[Dict]:
+        self.flush()
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def close(self):
+        """남은 게시물을 삽입하고 연결 종료"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
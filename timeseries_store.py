@@ -0,0 +1,279 @@
+"""
+열 기반 시계열 저장소
+- 네이버 데이터랩 (키워드, 날짜, 비율) 데이터를 키워드별 두 개의 열 파일로 저장
+  - <id>.dates: 날짜 (일 단위 서수, int32)
+  - <id>.ratios: 비율 (float64)
+  - index.json: 시계열 이름 -> 파일/건수/기간
+- 새 날짜는 파일 끝에 이어 쓰고, 이미 있는 날짜는 새 값으로 교체
+- 값은 받은 그대로 저장 (실행 간 척도 맞춤은 저장 전에 분석기가 겹치는 날짜 기준으로 처리)
+- 날짜 열이 정렬되어 있어 기간 조회는 이진 탐색
+- 주/월 단위 집계, 이동 평균을 API 재조회 없이 계산
+"""
+
+import hashlib
+import json
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 기본 저장 디렉터리
+SERIES_STORE_DIR = 'naver_series'
+
+DATE_TYPE = 'i'
+RATIO_TYPE = 'd'
+
+ROLLUP_PERIODS = ('week', 'month')
+
+
+def _ordinal(day: str) -> int:
+    return date.fromisoformat(day).toordinal()
+
+
+def _day(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _period_key(ordinal: int, period: str) -> str:
+    """집계 구간 이름 (week: 그 주 월요일 날짜, month: YYYY-MM)"""
+    day = date.fromordinal(ordinal)
+    if period == 'week':
+        return (day - timedelta(days=day.weekday())).isoformat()
+    return day.isoformat()[:7]
+
+
+class TimeSeriesStore:
+    """키워드별 (날짜, 비율) 열 파일 저장소"""
+
+    def __init__(self, path: str = SERIES_STORE_DIR):
+        """
+        초기화
+
+        Args:
+            path: 저장 디렉터리
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._columns = {}
+        os.makedirs(path, exist_ok=True)
+        self._index = self._load_index()
+
+    def _index_path(self) -> str:
+        return os.path.join(self.path, 'index.json')
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self._index_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = f'{self._index_path()}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._index_path())
+
+    def _files(self, name: str) -> Tuple[str, str]:
+        stem = self._index[name]['file']
+        base = os.path.join(self.path, stem)
+        return base + '.dates', base + '.ratios'
+
+    def _load(self, name: str) -> Tuple[array, array]:
+        """시계열의 두 열 (메모리에 한 번만 읽음)"""
+        if name not in self._columns:
+            dates, ratios = array(DATE_TYPE), array(RATIO_TYPE)
+            if name in self._index:
+                count = self._index[name]['count']
+                dates_path, ratios_path = self._files(name)
+                with open(dates_path, 'rb') as f:
+                    dates.fromfile(f, count)
+                with open(ratios_path, 'rb') as f:
+                    ratios.fromfile(f, count)
+            self._columns[name] = (dates, ratios)
+        return self._columns[name]
+
+    def names(self) -> List[str]:
+        """저장된 시계열 이름"""
+        return list(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def append(self, name: str, data_points: Iterable[Dict]) -> int:
+        """
+        시계열에 데이터 추가
+
+        마지막 날짜 이후의 데이터는 파일 끝에 이어 쓰고,
+        이미 저장된 날짜가 있으면 새 값으로 교체한 뒤 다시 씁니다.
+        비율은 척도를 바꾸지 않고 그대로 저장하므로, 요청마다 최댓값이 100인 데이터는
+        저장된 값과 같은 척도로 맞춘 뒤 넘겨야 합니다 (naver_calibration.overlap_scale).
+
+        Args:
+            name: 시계열 이름 (예: 'search:영화', 'shopping:50000000')
+            data_points: [{'period': 'YYYY-MM-DD', 'ratio': 비율}, ...]
+
+        Returns:
+            저장 후 전체 데이터 수
+        """
+        # 같은 날짜가 여러 번 있으면 마지막 값 사용
+        points = sorted({_ordinal(point['period']): float(point['ratio'])
+                         for point in data_points}.items())
+        if not points:
+            return self._index.get(name, {}).get('count', 0)
+
+        with self._lock:
+            if name not in self._index:
+                stem = hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]
+                self._index[name] = {'file': stem, 'count': 0}
+                self._columns[name] = (array(DATE_TYPE), array(RATIO_TYPE))
+
+            dates, ratios = self._load(name)
+            dates_path, ratios_path = self._files(name)
+
+            if not dates or points[0][0] > dates[-1]:
+                # 이어 쓰기: 새 날짜만 파일 끝에 추가
+                new_dates = array(DATE_TYPE, [day for day, _ in points])
+                new_ratios = array(RATIO_TYPE, [ratio for _, ratio in points])
+                with open(dates_path, 'ab') as f:
+                    new_dates.tofile(f)
+                with open(ratios_path, 'ab') as f:
+                    new_ratios.tofile(f)
+                dates.extend(new_dates)
+                ratios.extend(new_ratios)
+            else:
+                # 겹치는 날짜가 있으면 합친 뒤 다시 씀
+                merged = dict(zip(dates, ratios))
+                merged.update(points)
+                days = sorted(merged)
+                dates[:] = array(DATE_TYPE, days)
+                ratios[:] = array(RATIO_TYPE, [merged[day] for day in days])
+                for path, column in ((dates_path, dates), (ratios_path, ratios)):
+                    with open(path + '.tmp', 'wb') as f:
+                        column.tofile(f)
+                    os.replace(path + '.tmp', path)
+
+            entry = self._index[name]
+            entry['count'] = len(dates)
+            entry['first'] = _day(dates[0])
+            entry['last'] = _day(dates[-1])
+            self._save_index()
+            return len(dates)
+
+    def append_series(self, series: Dict[str, List[Dict]], prefix: str = '') -> int:
+        """
+        여러 시계열 한 번에 추가
+
+        Args:
+            series: {이름: 데이터} (collect_series 결과 등)
+            prefix: 이름 앞에 붙일 구분자 (예: 'search:')
+
+        Returns:
+            추가한 시계열 수
+        """
+        for name, data_points in series.items():
+            self.append(prefix + name, data_points)
+        return len(series)
+
+    def _slice(self, name: str, start: Optional[str],
+               end: Optional[str]) -> Tuple[array, array]:
+        """기간 안의 두 열 (이진 탐색)"""
+        dates, ratios = self._load(name)
+        lo = bisect_left(dates, _ordinal(start)) if start else 0
+        hi = bisect_right(dates, _ordinal(end)) if end else len(dates)
+        return dates[lo:hi], ratios[lo:hi]
+
+    def query(self, name: str, start: str = None, end: str = None) -> List[Dict]:
+        """
+        기간 조회
+
+        Args:
+            name: 시계열 이름
+            start: 시작일 (YYYY-MM-DD, 미지정 시 처음부터)
+            end: 종료일 (YYYY-MM-DD, 미지정 시 끝까지)
+
+        Returns:
+            [{'period': 'YYYY-MM-DD', 'ratio': 비율}, ...]
+        """
+        dates, ratios = self._slice(name, start, end)
+        return [{'period': _day(day), 'ratio': ratio} for day, ratio in zip(dates, ratios)]
+
+    def rollup(self, name: str, period: str = 'month', start: str = None,
+               end: str = None) -> List[Dict]:
+        """
+        주/월 단위 집계
+
+        Args:
+            name: 시계열 이름
+            period: 'week'(월요일 시작) 또는 'month'
+            start: 시작일
+            end: 종료일
+
+        Returns:
+            [{'period', 'avg_ratio', 'max_ratio', 'total_ratio', 'data_points'}, ...]
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"지원하지 않는 집계 단위: {period} (가능: {', '.join(ROLLUP_PERIODS)})")
+
+        dates, ratios = self._slice(name, start, end)
+
+        rows = []
+        current = None
+        for day, ratio in zip(dates, ratios):
+            key = _period_key(day, period)
+            if current is None or current['period'] != key:
+                current = {'period': key, 'avg_ratio': 0.0, 'max_ratio': ratio,
+                           'total_ratio': 0.0, 'data_points': 0}
+                rows.append(current)
+            current['total_ratio'] += ratio
+            current['data_points'] += 1
+            if ratio > current['max_ratio']:
+                current['max_ratio'] = ratio
+
+        for row in rows:
+            row['avg_ratio'] = round(row['total_ratio'] / row['data_points'], 2)
+        return rows
+
+    def moving_average(self, name: str, window: int = 7, start: str = None,
+                       end: str = None) -> List[Dict]:
+        """
+        이동 평균 (직전 window개 데이터, 데이터가 window개 모인 날부터)
+
+        Args:
+            name: 시계열 이름
+            window: 평균을 낼 데이터 수
+            start: 시작일
+            end: 종료일
+
+        Returns:
+            [{'period': 'YYYY-MM-DD', 'ratio': 이동 평균}, ...]
+        """
+        if window < 1:
+            raise ValueError("window는 1 이상이어야 합니다.")
+
+        dates, ratios = self._slice(name, start, end)
+
+        averages = []
+        running = 0.0
+        for i, ratio in enumerate(ratios):
+            running += ratio
+            if i >= window:
+                running -= ratios[i - window]
+            if i >= window - 1:
+                averages.append({'period': _day(dates[i]), 'ratio': round(running / window, 5)})
+        return averages
+
+    def delete(self, name: str):
+        """시계열 삭제"""
+        with self._lock:
+            if name not in self._index:
+                return
+            for path in self._files(name):
+                if os.path.exists(path):
+                    os.remove(path)
+            del self._index[name]
+            self._columns.pop(name, None)
+            self._save_index()
@@ -0,0 +1,333 @@
+"""
+통합 트렌드 크롤링 실행기
+- 5개 사이트 분석기를 한 프로세스에서 동시에 실행
+- 하나의 HTTP 세션/비동기 엔진과 하나의 결과 저장소를 공유
+- 사이트별 소요 시간 보고
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import io
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from async_engine import AsyncCrawlEngine
+from crawl_state import CRAWL_STATE_FILE, CrawlState
+from http_cache import DEFAULT_CACHE_TTL, HTTP_CACHE_DIR, HttpCache
+from http_session import CrawlerSession
+from parse_pool import ParsePipeline
+from clien_crawling import ClienTrendAnalyzer
+from dcinside_crawling import DCInsideTrendAnalyzer, DEFAULT_GALLERIES
+from instiz_crawling import InstizTrendAnalyzer
+from naver_cache import NAVER_CACHE_DIR, NaverQueryCache
+from naver_client import NaverApiClient
+from naver_datalab_crawling import KoreanTrendAnalyzer
+from naver_planner import SHOPPING_SPLITS, month_span
+from ppomppu_crawling import PpomppuTrendAnalyzer
+from result_store import ResultStore, add_db_argument
+from timeseries_store import SERIES_STORE_DIR, TimeSeriesStore
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+ALL_SITES = ['naver', 'dcinside', 'clien', 'ppomppu', 'instiz']
+
+SITE_NAMES = {
+    'naver': '네이버 데이터랩',
+    'dcinside': '디시인사이드',
+    'clien': '클리앙',
+    'ppomppu': '뽐뿌',
+    'instiz': '인스티즈',
+}
+
+
+class TrendResultSink:
+    """모든 사이트 결과를 하나의 JSON/CSV로 저장하는 출력 저장소"""
+
+    def __init__(self, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            result_store: 지정 시 save()에서 사이트별 키워드 순위를 DB에 누적
+        """
+        self.results = {}
+        self.timings = {}
+        self.result_store = result_store
+
+    def add(self, site: str, results: Dict, elapsed: float):
+        """사이트 결과 추가"""
+        if results:
+            self.results[site] = results
+        self.timings[site] = round(elapsed, 2)
+
+    def iter_rows(self):
+        """CSV 행 생성 (사이트, 출처, 순위, 키워드, 출현횟수, 총_인기도, 평균_인기도)"""
+        for site, results in self.results.items():
+            for key, result in results.items():
+                if site == 'naver':
+                    # 네이버: 키 = 연월, 값 = 키워드 리스트 (인기도 = 검색비율)
+                    for i, kw in enumerate(result, 1):
+                        yield [SITE_NAMES[site], key, i, kw['keyword'], kw['data_points'],
+                               kw['total_engagement'], kw['avg_search_ratio']]
+                    continue
+
+                source_name = result.get('board_name', result.get('gallery_name',
+                                                                  result.get('source', key)))
+                for i, kw in enumerate(result['keywords'], 1):
+                    yield [SITE_NAMES[site], source_name, i, kw['keyword'], kw['count'],
+                           kw.get('total_engagement', 0), round(kw.get('avg_engagement', 0), 2)]
+
+    def save(self, prefix: str = 'korean_trends'):
+        """결과 저장 (JSON + CSV)"""
+        json_file = f'{prefix}.json'
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timings': self.timings,
+                'results': self.results
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과가 {json_file}에 저장되었습니다.")
+
+        csv_file = f'{prefix}.csv'
+        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['사이트', '게시판/출처', '순위', '키워드', '출현횟수', '총_인기도', '평균_인기도'])
+            writer.writerows(self.iter_rows())
+        print(f"💾 CSV 결과가 {csv_file}에 저장되었습니다.")
+
+        if self.result_store:
+            crawled_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            rows = sum(self.result_store.add_keyword_results(site, results, crawled_at)
+                       for site, results in self.results.items())
+            print(f"💾 키워드 순위 {rows}건이 {self.result_store.path}에 추가되었습니다.")
+
+
+class TrendOrchestrator:
+    """여러 사이트 분석기를 동시에 실행하는 통합 실행기"""
+
+    def __init__(self, session: CrawlerSession = None, naver_client_id: str = None,
+                 naver_client_secret: str = None, sink: TrendResultSink = None,
+                 parse_workers: int = 0, crawl_state: CrawlState = None,
+                 naver_cache: NaverQueryCache = None, series_store: TimeSeriesStore = None,
+                 shopping_splits: List[str] = None, result_store: ResultStore = None):
+        """
+        초기화
+
+        Args:
+            session: 모든 분석기가 공유할 HTTP 세션 (미지정 시 새로 생성)
+            naver_client_id: 네이버 API Client ID (없으면 네이버는 건너뜀)
+            naver_client_secret: 네이버 API Client Secret
+            sink: 결과 저장소 (미지정 시 새로 생성)
+            parse_workers: HTML 파싱 프로세스 수 (0이면 이벤트 루프에서 바로 파싱)
+            crawl_state: 증분 수집 상태 (지정 시 게시판별로 지난 수집 이후의 새 게시물만 수집)
+            naver_cache: 네이버 데이터랩 조회 캐시 (지정 시 같은 조회는 API를 호출하지 않음)
+            series_store: 네이버 일별 검색 비율 저장소 (지정 시 조회한 시계열을 누적 저장)
+            shopping_splits: 지정 시 네이버 분석과 함께 쇼핑인사이트 1분류 전체를 조회하여
+                             시계열 저장소에 저장 ([]: 전체만, ['device', 'gender', 'age'] 중 추가 구분)
+            result_store: SQLite 결과 저장소 (지정 시 게시물/키워드 순위/네이버 시계열을 실행마다 누적)
+        """
+        self.session = session or CrawlerSession()
+        parse_pipeline = ParsePipeline(parse_workers) if parse_workers > 0 else None
+        self.engine = AsyncCrawlEngine(self.session, parse_pipeline=parse_pipeline)
+        self.result_store = result_store
+        self.sink = sink or TrendResultSink(result_store)
+        self.crawl_state = crawl_state
+        self.naver_cache = naver_cache
+        self.series_store = series_store
+        self.shopping_splits = shopping_splits
+
+        self.naver_client_id = naver_client_id
+        self.naver_client_secret = naver_client_secret
+        self.naver_api = NaverApiClient(naver_client_id, naver_client_secret, self.session)
+
+    def _site_job(self, site: str, year: int, max_pages: int):
+        """사이트별 분석 코루틴 생성"""
+        if site == 'naver':
+            analyzer = KoreanTrendAnalyzer(self.naver_client_id, self.naver_client_secret, self.session,
+                                           self.naver_cache, self.naver_api,
+                                           series_store=self.series_store,
+                                           result_store=self.result_store)
+            return self._naver_job(analyzer, year)
+
+        if site == 'dcinside':
+            analyzer = DCInsideTrendAnalyzer(self.session, crawl_state=self.crawl_state,
+                                             result_store=self.result_store)
+            return analyzer.analyze_multiple_galleries_async(DEFAULT_GALLERIES, max_pages, self.engine)
+
+        if site == 'clien':
+            analyzer = ClienTrendAnalyzer(self.session, crawl_state=self.crawl_state,
+                                          result_store=self.result_store)
+            return self._wrap(analyzer.analyze_monthly_best_async(max_pages * 2, self.engine),
+                              'monthly_best')
+
+        if site == 'ppomppu':
+            analyzer = PpomppuTrendAnalyzer(self.session, crawl_state=self.crawl_state,
+                                            result_store=self.result_store)
+            return self._wrap(analyzer.analyze_hotdeal_async(max_pages * 2, self.engine), 'hotdeal')
+
+        if site == 'instiz':
+            analyzer = InstizTrendAnalyzer(self.session, crawl_state=self.crawl_state,
+                                           result_store=self.result_store)
+            return self._wrap(analyzer.analyze_ichart_async(100, self.engine), 'ichart')
+
+        raise ValueError(f"지원하지 않는 사이트: {site}")
+
+    async def _naver_job(self, analyzer: KoreanTrendAnalyzer, year: int) -> Dict:
+        """검색어 트렌드 연간 분석 (쇼핑 구분이 있으면 쇼핑인사이트 일괄 조회를 동시에 진행)"""
+        monthly = analyzer.analyze_year_by_month_async(year, analyze_full_year=True, engine=self.engine,
+                                                       single_request=True)
+        if self.shopping_splits is None:
+            return await monthly
+
+        shopping = analyzer.collect_shopping_series_async(*month_span(year, 1, 12),
+                                                          splits=self.shopping_splits,
+                                                          engine=self.engine)
+        results, _ = await asyncio.gather(monthly, shopping)
+        return results
+
+    @staticmethod
+    async def _wrap(coro, key: str) -> Dict:
+        """단일 결과를 {key: result} 형태로 변환 (각 스크립트의 저장 형식과 동일)"""
+        result = await coro
+        return {key: result} if result else {}
+
+    async def _timed(self, site: str, coro):
+        """사이트 분석을 실행하고 소요 시간을 저장소에 기록"""
+        start = time.perf_counter()
+        try:
+            results = await coro
+        except Exception as e:
+            print(f"\n❌ {SITE_NAMES[site]} 분석 실패: {e}")
+            results = {}
+        self.sink.add(site, results, time.perf_counter() - start)
+
+    def run(self, sites: List[str] = None, year: int = 2025, max_pages: int = 5) -> TrendResultSink:
+        """
+        사이트 동시 분석 실행
+
+        Args:
+            sites: 분석할 사이트 목록 (기본값: 전체)
+            year: 네이버 데이터랩 분석 연도
+            max_pages: 게시판당 크롤링할 페이지 수
+
+        Returns:
+            결과 저장소
+        """
+        if sites is None:
+            sites = ALL_SITES
+
+        if 'naver' in sites and not (self.naver_client_id and self.naver_client_secret):
+            print("⚠️ 네이버 API 키가 없어 네이버 데이터랩은 건너뜁니다.")
+            sites = [site for site in sites if site != 'naver']
+
+        async def _run_all():
+            await asyncio.gather(*[
+                self._timed(site, self._site_job(site, year, max_pages))
+                for site in sites
+            ])
+
+        start = time.perf_counter()
+        self.engine.run(_run_all())
+        total = time.perf_counter() - start
+
+        self.print_timings(total)
+        if 'naver' in sites:
+            self.naver_api.report()
+        return self.sink
+
+    def print_timings(self, total: float):
+        """사이트별 소요 시간 출력"""
+        print("\n" + "="*60)
+        print("⏱️  사이트별 소요 시간")
+        print("="*60)
+        for site, elapsed in sorted(self.sink.timings.items(), key=lambda x: x[1], reverse=True):
+            status = '✅' if site in self.sink.results else '⚠️'
+            print(f"{status} {SITE_NAMES[site]:12s} | {elapsed:7.2f}초")
+        print("-" * 60)
+        print(f"   {'전체':12s} | {total:7.2f}초")
+
+    def close(self):
+        """엔진, 세션 및 결과 저장소 종료"""
+        self.engine.close()
+        self.naver_api.close()
+        self.session.close()
+        if self.result_store:
+            self.result_store.close()
+
+
+# 실행
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='한국 트렌드 통합 크롤링')
+    parser.add_argument('--sites', nargs='+', choices=ALL_SITES, default=ALL_SITES,
+                        help='분석할 사이트 (기본값: 전체)')
+    parser.add_argument('--year', type=int, default=2025, help='네이버 데이터랩 분석 연도')
+    parser.add_argument('--max-pages', type=int, default=5, help='게시판당 크롤링할 페이지 수')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='HTML 파싱 프로세스 수 (기본값 0: 이벤트 루프에서 바로 파싱)')
+    parser.add_argument('--incremental', nargs='?', const=CRAWL_STATE_FILE, default=None,
+                        metavar='STATE_FILE',
+                        help=f'증분 수집: 게시판별 마지막 수집 게시물 이후만 수집 (상태 파일 기본값: {CRAWL_STATE_FILE})')
+    parser.add_argument('--cache', nargs='?', const=HTTP_CACHE_DIR, default=None, metavar='CACHE_DIR',
+                        help=f'디스크 응답 캐시 사용 (디렉터리 기본값: {HTTP_CACHE_DIR})')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help='캐시 응답을 재검증 없이 쓰는 시간(초)')
+    parser.add_argument('--no-naver-cache', action='store_true',
+                        help=f'네이버 데이터랩 조회 캐시({NAVER_CACHE_DIR}) 사용 안 함')
+    parser.add_argument('--series-store', nargs='?', const=SERIES_STORE_DIR, default=None,
+                        metavar='STORE_DIR',
+                        help=f'네이버 일별 검색 비율을 시계열 저장소에 누적 (디렉터리 기본값: {SERIES_STORE_DIR})')
+    parser.add_argument('--shopping', nargs='*', choices=list(SHOPPING_SPLITS), default=None,
+                        metavar='SPLIT',
+                        help='쇼핑인사이트 1분류 전체를 조회하여 시계열 저장소에 저장 '
+                             '(추가 구분: device, gender, age)')
+    add_db_argument(parser)
+    parser.add_argument('--output', default='korean_trends_2025', help='결과 파일 이름 (확장자 제외)')
+    args = parser.parse_args()
+
+    print("\n" + "="*80)
+    print("🚀 한국 트렌드 통합 크롤링")
+    print("="*80)
+    print(f"\n📱 대상: {', '.join(SITE_NAMES[site] for site in args.sites)}")
+    print("⚠️  호스트별 요청 속도 제한을 준수하며, 공개 게시판만 수집합니다.\n")
+
+    # 쇼핑인사이트 결과는 시계열 저장소에만 저장
+    if args.shopping is not None and not args.series_store:
+        args.series_store = SERIES_STORE_DIR
+
+    orchestrator = TrendOrchestrator(
+        session=CrawlerSession(cache=HttpCache(args.cache, args.cache_ttl)) if args.cache else None,
+        naver_client_id=os.environ.get('NAVER_CLIENT_ID'),
+        naver_client_secret=os.environ.get('NAVER_CLIENT_SECRET'),
+        parse_workers=args.parse_workers,
+        crawl_state=CrawlState(args.incremental) if args.incremental else None,
+        naver_cache=None if args.no_naver_cache else NaverQueryCache(),
+        series_store=TimeSeriesStore(args.series_store) if args.series_store else None,
+        shopping_splits=args.shopping,
+        result_store=ResultStore(args.db) if args.db else None
+    )
+
+    try:
+        sink = orchestrator.run(args.sites, year=args.year, max_pages=args.max_pages)
+
+        if sink.results:
+            sink.save(args.output)
+            print(f"\n✅ 크롤링 완료! 총 {len(sink.results)}개 사이트 분석")
+        else:
+            print("\n❌ 수집된 데이터가 없습니다.")
+
+    except KeyboardInterrupt:
+        print("\n\n⚠️ 사용자에 의해 중단되었습니다.")
+    except Exception as e:
+        print(f"\n❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        orchestrator.close()